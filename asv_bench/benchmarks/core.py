@@ -0,0 +1,271 @@
+"""
+Benchmarks of time and peak memory of the core hot paths.
+
+Run with asv from `asv_bench/`:
+
+    asv run                       # measure and store results as baselines
+    asv continuous main HEAD      # compare HEAD against main and flag regressions
+    asv compare <commit> <commit>
+
+`python core.py` runs each benchmark once with the smallest parameters.
+"""
+import numpy as np
+
+import epymetheus as ep
+from epymetheus import batch
+from epymetheus.benchmarks import DeterminedStrategy
+from epymetheus.datasets import make_randomwalk
+from epymetheus.metrics import metrics
+from epymetheus.ts import ts
+
+# Work (n_trades * n_bars) beyond which a case is skipped
+MAX_WORK = 10 ** 9
+# Size of universe (n_bars * n_assets) beyond which a case is skipped
+MAX_SIZE = 10 ** 8
+
+N_TRADES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+# Loops over `Trade` objects are too slow to benchmark a million trades
+N_TRADES_LOOP = [10 ** 3, 10 ** 4, 10 ** 5]
+
+
+def make_universe(n_bars, n_assets):
+    return make_randomwalk(n_bars, n_assets, seed=42)
+
+
+def draw_trades(universe, n_trades, basket_size):
+    """
+    Return random assets, lots and entry/exit pairs of trades.
+    """
+    rng = np.random.default_rng(42)
+    n_bars, n_assets = universe.shape
+
+    asset = rng.integers(n_assets, size=(n_trades, basket_size))
+    lot = rng.standard_normal((n_trades, basket_size))
+    bars = np.sort(rng.integers(n_bars, size=(n_trades, 2)), axis=1)
+
+    return asset, lot, bars
+
+
+def make_trades(universe, n_trades, basket_size=1, take_stop=False):
+    """
+    Return trades with random assets, lots and entry/exit pairs.
+    """
+    asset, lot, bars = draw_trades(universe, n_trades, basket_size)
+    columns = universe.columns.values
+    take, stop = (0.01, -0.01) if take_stop else (None, None)
+
+    return [
+        ep.trade(
+            columns[asset[i]],
+            entry=universe.index[bars[i, 0]],
+            exit=universe.index[bars[i, 1]],
+            take=take,
+            stop=stop,
+            lot=lot[i],
+        )
+        for i in range(n_trades)
+    ]
+
+
+def make_arrays(universe, n_trades, basket_size=1, take_stop=False):
+    """
+    Return the same trades as `make_trades` as `TradeArrays`
+    without creating `Trade` objects.
+    """
+    asset, lot, bars = draw_trades(universe, n_trades, basket_size)
+    take, stop = (0.01, -0.01) if take_stop else (np.inf, -np.inf)
+
+    return batch.TradeArrays(
+        asset.ravel(),
+        lot.ravel(),
+        np.arange(0, n_trades * basket_size + 1, basket_size),
+        bars[:, 0],
+        bars[:, 1],
+        np.full(n_trades, take),
+        np.full(n_trades, stop),
+    )
+
+
+def skip_if_large(n_trades, n_bars, n_assets=1):
+    if n_trades * n_bars > MAX_WORK or n_bars * n_assets > MAX_SIZE:
+        # asv skips a case whose setup raises NotImplementedError
+        raise NotImplementedError
+
+
+class Execute:
+    params = (
+        N_TRADES_LOOP,
+        [10, 100, 1000],
+        [1, 10],
+        [False, True],
+    )
+    param_names = ["n_trades", "n_assets", "basket_size", "take_stop"]
+    timeout = 1800
+
+    def setup(self, n_trades, n_assets, basket_size, take_stop):
+        self.universe = make_universe(1000, n_assets)
+        self.trades = make_trades(self.universe, n_trades, basket_size, take_stop)
+
+    def time_execute(self, n_trades, n_assets, basket_size, take_stop):
+        for t in self.trades:
+            t.execute(self.universe)
+
+    def peakmem_execute(self, n_trades, n_assets, basket_size, take_stop):
+        for t in self.trades:
+            t.execute(self.universe)
+
+
+class ExecuteArrays:
+    params = (N_TRADES, [10, 100, 1000], [1, 10], [False, True])
+    param_names = ["n_trades", "n_assets", "basket_size", "take_stop"]
+    timeout = 1800
+
+    def setup(self, n_trades, n_assets, basket_size, take_stop):
+        universe = make_universe(1000, n_assets)
+        self.prices = universe.values
+        self.arrays = make_arrays(universe, n_trades, basket_size, take_stop)
+
+    def time_execute(self, n_trades, n_assets, basket_size, take_stop):
+        batch.execute(self.prices, self.arrays)
+
+    def peakmem_execute(self, n_trades, n_assets, basket_size, take_stop):
+        batch.execute(self.prices, self.arrays)
+
+
+class TimeSeries:
+    params = (
+        N_TRADES_LOOP,
+        [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+        [10, 100, 1000],
+    )
+    param_names = ["n_trades", "n_bars", "n_assets"]
+    timeout = 1800
+
+    def setup(self, n_trades, n_bars, n_assets):
+        skip_if_large(n_trades, n_bars, n_assets)
+        self.universe = make_universe(n_bars, n_assets)
+        self.trades = make_trades(self.universe, n_trades, basket_size=2)
+        for t in self.trades:
+            t.execute(self.universe)
+
+    def time_wealth(self, n_trades, n_bars, n_assets):
+        ts.wealth(self.trades, self.universe)
+
+    def time_exposure(self, n_trades, n_bars, n_assets):
+        ts._exposure(self.trades, self.universe, net=False)
+
+    def time_pnls(self, n_trades, n_bars, n_assets):
+        metrics._pnls(self.trades, self.universe)
+
+    def peakmem_wealth(self, n_trades, n_bars, n_assets):
+        ts.wealth(self.trades, self.universe)
+
+    def peakmem_exposure(self, n_trades, n_bars, n_assets):
+        ts._exposure(self.trades, self.universe, net=False)
+
+
+class TimeSeriesArrays:
+    params = (
+        N_TRADES,
+        [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+        [10, 100, 1000],
+    )
+    param_names = ["n_trades", "n_bars", "n_assets"]
+    timeout = 1800
+
+    def setup(self, n_trades, n_bars, n_assets):
+        skip_if_large(n_trades, n_bars, n_assets)
+        universe = make_universe(n_bars, n_assets)
+        self.prices = universe.values
+        self.arrays = make_arrays(universe, n_trades, basket_size=2)
+        self.close = batch.execute(self.prices, self.arrays)
+
+    def time_wealth(self, n_trades, n_bars, n_assets):
+        batch.wealth(self.prices, self.arrays, self.close)
+
+    def time_exposure(self, n_trades, n_bars, n_assets):
+        batch.exposure(self.prices, self.arrays, self.close, net=False)
+
+    def time_pnls(self, n_trades, n_bars, n_assets):
+        batch.trade_pnls(self.prices, self.arrays, self.close)
+
+    def peakmem_wealth(self, n_trades, n_bars, n_assets):
+        batch.wealth(self.prices, self.arrays, self.close)
+
+    def peakmem_exposure(self, n_trades, n_bars, n_assets):
+        batch.exposure(self.prices, self.arrays, self.close, net=False)
+
+
+class History:
+    params = (N_TRADES_LOOP, [10, 100, 1000], [1, 10])
+    param_names = ["n_trades", "n_assets", "basket_size"]
+    timeout = 1800
+
+    def setup(self, n_trades, n_assets, basket_size):
+        universe = make_universe(1000, n_assets)
+        trades = make_trades(universe, n_trades, basket_size)
+        self.strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+
+    def time_history(self, n_trades, n_assets, basket_size):
+        self.strategy.history()
+
+    def peakmem_history(self, n_trades, n_assets, basket_size):
+        self.strategy.history()
+
+
+class SimulatePortfolio:
+    params = (N_TRADES, ["reject", "scale"])
+    param_names = ["n_trades", "how"]
+    timeout = 1800
+
+    def setup(self, n_trades, how):
+        universe = make_universe(1000, 100)
+        self.prices = universe.values
+        self.arrays = make_arrays(universe, n_trades, basket_size=2)
+        self.close = batch.execute(self.prices, self.arrays)
+
+    def time_simulate_portfolio(self, n_trades, how):
+        batch.simulate_portfolio(
+            self.prices, self.arrays, self.close, cash=100.0, max_leverage=2.0, how=how
+        )
+
+
+class MakeRandomwalk:
+    params = ([10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6], [10, 100, 1000])
+    param_names = ["n_bars", "n_assets"]
+
+    def setup(self, n_bars, n_assets):
+        if n_bars * n_assets > MAX_SIZE:
+            raise NotImplementedError
+
+    def time_make_randomwalk(self, n_bars, n_assets):
+        make_randomwalk(n_bars, n_assets, seed=42)
+
+    def peakmem_make_randomwalk(self, n_bars, n_assets):
+        make_randomwalk(n_bars, n_assets, seed=42)
+
+
+def _check():
+    """
+    Run every benchmark once with the smallest parameters.
+    """
+    classes = (
+        Execute,
+        ExecuteArrays,
+        TimeSeries,
+        TimeSeriesArrays,
+        History,
+        SimulatePortfolio,
+        MakeRandomwalk,
+    )
+    for cls in classes:
+        args = [values[0] for values in cls.params]
+        bench = cls()
+        bench.setup(*args)
+        for name in dir(bench):
+            if name.startswith(("time_", "peakmem_")):
+                getattr(bench, name)(*args)
+
+
+if __name__ == "__main__":
+    _check()
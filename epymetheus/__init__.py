@@ -1,7 +1,12 @@
 # flake8: noqa
 
+from epymetheus.result import Result
+from epymetheus.result import load_result
+from epymetheus.result import save_result
+from epymetheus.result import write_history
 from epymetheus.strategy import Strategy
 from epymetheus.strategy import create_strategy
 from epymetheus.trade import Trade
 from epymetheus.trade import trade
+from epymetheus.universe import MemmapUniverse
 from epymetheus.universe import Universe
@@ -0,0 +1,24 @@
+# flake8: noqa
+
+from .batch import TradeArrays
+from .batch import execute
+from .batch import exposure
+from .batch import leg_pnls
+from .batch import metric
+from .batch import result_dtype
+from .batch import trade_pnls
+from .batch import wealth
+from .convert import to_trade_arrays
+from .portfolio import fill_trades
+from .portfolio import simulate_portfolio
+from .positions import Positions
+from .positions import exposure_pairs
+from .positions import group_wealth
+from .positions import pnl_pairs
+from .positions import sparse_exposure
+from .positions import sparse_wealth
+from .signal import signal_to_trades
+from .target import Target
+from .target import holdings_exposure
+from .target import holdings_turnover
+from .target import holdings_wealth
@@ -0,0 +1,653 @@
+import numpy as np
+import pandas as pd
+
+
+def _ragged_arange(starts, lengths):
+    """
+    Return concatenation of `arange(start, start + length)`.
+
+    Examples
+    --------
+    >>> _ragged_arange(np.array([0, 10, 5]), np.array([2, 3, 1]))
+    array([ 0,  1, 10, 11, 12,  5])
+    """
+    lengths = np.asarray(lengths, dtype=int)
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum()) - np.repeat(offsets - starts, lengths)
+
+
+def _runs(values):
+    """
+    Return runs of consecutive bars with the same non-zero value of each column.
+
+    Parameters
+    ----------
+    - values : numpy.array, shape (n_bars, n_assets)
+
+    Returns
+    -------
+    asset, begin, end, value : numpy.array, shape (n_runs,)
+        Column, first bar, bar next to the last bar and value of each run.
+        Runs are sorted by `begin`.
+
+    Examples
+    --------
+    >>> values = np.array([[0, 2], [1, 2], [1, -1]])
+    >>> _runs(values)
+    (array([1, 0, 1]), array([0, 1, 2]), array([2, 3, 3]), array([ 2,  1, -1]))
+    """
+    n_bars = values.shape[0]
+
+    # Lay out values of each column contiguously
+    flat = values.T.reshape(-1)
+
+    # The first bar of each column is always a boundary
+    boundary = np.ones(flat.size, dtype=bool)
+    boundary[1:] = flat[1:] != flat[:-1]
+    boundary[::n_bars] = True
+    begin = np.flatnonzero(boundary)
+    end = np.append(begin[1:], flat.size)
+
+    nonzero = flat[begin] != 0
+    begin, end = begin[nonzero], end[nonzero]
+
+    asset = begin // n_bars
+    order = np.argsort(begin - asset * n_bars, kind="stable")
+    begin, end, asset = begin[order], end[order], asset[order]
+
+    return asset, begin - asset * n_bars, end - asset * n_bars, flat[begin]
+
+
+class TradeArrays:
+    """
+    Columnar representation of trades.
+
+    Legs (pairs of asset and lot) of all trades are stored in flat arrays
+    and the legs of the `i`-th trade are `indptr[i]:indptr[i + 1]`.
+    Assets, entries and exits are stored as integer positions in a universe.
+
+    Parameters
+    ----------
+    - asset : numpy.array, shape (n_legs,)
+        Column positions of assets.
+    - lot : numpy.array, shape (n_legs,)
+        Lots of assets.
+    - indptr : numpy.array, shape (n_trades + 1,)
+        Boundaries of legs of each trade.
+    - entry : numpy.array, shape (n_trades,)
+        Index positions of entries.
+    - exit : numpy.array, shape (n_trades,)
+        Index positions of exits.
+    - take : numpy.array, shape (n_trades,)
+        Thresholds of profit-take. `inf` stands for no order.
+    - stop : numpy.array, shape (n_trades,)
+        Thresholds of stop-loss. `-inf` stands for no order.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+    >>> trades = [ep.trade("A", entry=1), [1, -2] * ep.trade(["A", "B"], take=1.0)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> arrays.asset
+    array([0, 0, 1])
+    >>> arrays.indptr
+    array([0, 1, 3])
+    >>> arrays.entry, arrays.exit
+    (array([1, 0]), array([2, 2]))
+    """
+
+    def __init__(self, asset, lot, indptr, entry, exit, take, stop):
+        self.asset = np.asarray(asset, dtype=int)
+        self.lot = np.asarray(lot, dtype=float)
+        self.indptr = np.asarray(indptr, dtype=int)
+        self.entry = np.asarray(entry, dtype=int)
+        self.exit = np.asarray(exit, dtype=int)
+        self.take = np.asarray(take, dtype=float)
+        self.stop = np.asarray(stop, dtype=float)
+
+        if (np.diff(self.indptr) <= 0).any():
+            raise ValueError("Each trade should have at least one asset.")
+
+    @classmethod
+    def from_trades(cls, trades, universe):
+        """
+        Initialize `TradeArrays` from trades.
+
+        Parameters
+        ----------
+        - trades : iterable of Trade
+        - universe : pandas.DataFrame
+
+        Returns
+        -------
+        arrays : TradeArrays
+        """
+        trades = list(trades)
+        n_bars = universe.index.size
+
+        n_legs = np.array([t.asset.size for t in trades], dtype=int)
+        indptr = np.concatenate(([0], np.cumsum(n_legs)))
+
+        if len(trades) > 0:
+            asset = universe.columns.get_indexer(
+                np.concatenate([t.asset for t in trades])
+            )
+            lot = np.concatenate([t.lot for t in trades]).astype(float)
+        else:
+            asset, lot = np.zeros(0, dtype=int), np.zeros(0)
+        if (asset == -1).any():
+            raise KeyError("asset not in universe.columns")
+
+        entry = cls.__get_positions(universe, [t.entry for t in trades], 0)
+        exit = cls.__get_positions(universe, [t.exit for t in trades], n_bars - 1)
+        take = [np.inf if t.take is None else t.take for t in trades]
+        stop = [-np.inf if t.stop is None else t.stop for t in trades]
+
+        return cls(asset, lot, indptr, entry, exit, take, stop)
+
+    @classmethod
+    def from_frame(cls, frame, universe):
+        """
+        Initialize `TradeArrays` from a table of trades.
+
+        Each row is a leg. Rows with the same `trade_id` are legs of
+        a single trade, and entry, exit, take and stop of its first row are used.
+        If `trade_id` is not given, each row is a single-asset trade.
+
+        Parameters
+        ----------
+        - frame : pandas.DataFrame or dict[str, array]
+            Table with columns `asset` and optionally `trade_id`, `lot`,
+            `entry`, `exit`, `take` and `stop`.
+            Missing values stand for None of `Trade`.
+        - universe : pandas.DataFrame
+
+        Returns
+        -------
+        arrays : TradeArrays
+
+        Examples
+        --------
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+        >>> frame = pd.DataFrame({
+        ...     "trade_id": [0, 1, 1],
+        ...     "asset": ["A", "A", "B"],
+        ...     "lot": [1.0, 1.0, -2.0],
+        ...     "entry": [1, None, None],
+        ...     "take": [None, 1.0, 1.0],
+        ... })
+        >>> arrays = TradeArrays.from_frame(frame, universe)
+        >>> arrays.asset
+        array([0, 0, 1])
+        >>> arrays.indptr
+        array([0, 1, 3])
+        >>> arrays.entry, arrays.exit
+        (array([1, 0]), array([2, 2]))
+        >>> arrays.take
+        array([inf,  1.])
+        """
+        n_rows = len(np.asarray(frame["asset"]))
+        n_bars = universe.index.size
+
+        def column(name, default):
+            if name not in frame:
+                return np.full(n_rows, default)
+            return np.asarray(frame[name])
+
+        if "trade_id" in frame:
+            trade_id = np.asarray(frame["trade_id"])
+            order = np.argsort(trade_id, kind="stable")
+            bounds = np.flatnonzero(np.diff(trade_id[order])) + 1
+        else:
+            order = np.arange(n_rows)
+            bounds = np.arange(1, n_rows)
+        indptr = np.concatenate(([0], bounds, [n_rows])) if n_rows > 0 else [0]
+        first = order[indptr[:-1]]
+
+        asset = universe.columns.get_indexer(column("asset", None)[order])
+        if (asset == -1).any():
+            raise KeyError("asset not in universe.columns")
+        lot = column("lot", 1.0).astype(float)[order]
+
+        entry = cls.__get_positions(universe, column("entry", None)[first], 0)
+        exit = cls.__get_positions(universe, column("exit", None)[first], n_bars - 1)
+        take = np.nan_to_num(column("take", np.nan).astype(float)[first], nan=np.inf)
+        stop = np.nan_to_num(column("stop", np.nan).astype(float)[first], nan=-np.inf)
+
+        return cls(asset, lot, indptr, entry, exit, take, stop)
+
+    @classmethod
+    def from_holdings(cls, holdings):
+        """
+        Initialize `TradeArrays` from holdings.
+
+        Each run of consecutive bars with the same non-zero lot of an asset
+        is a single-asset trade, which exits at the bar where the lot changes.
+
+        Parameters
+        ----------
+        - holdings : numpy.array, shape (n_bars, n_assets)
+            Lots held from each bar to the next.
+
+        Returns
+        -------
+        arrays : TradeArrays
+
+        Examples
+        --------
+        >>> holdings = np.array([[0.0, 2.0], [1.0, 2.0], [1.0, -1.0], [0.0, -1.0]])
+        >>> arrays = TradeArrays.from_holdings(holdings)
+        >>> arrays.asset, arrays.lot
+        (array([1, 0, 1]), array([ 2.,  1., -1.]))
+        >>> arrays.entry, arrays.exit
+        (array([0, 1, 2]), array([2, 3, 3]))
+        """
+        n_bars = holdings.shape[0]
+        asset, entry, end, lot = _runs(holdings)
+        n_trades = asset.size
+
+        return cls(
+            asset,
+            lot,
+            np.arange(n_trades + 1),
+            entry,
+            np.minimum(end, n_bars - 1),
+            np.full(n_trades, np.inf),
+            np.full(n_trades, -np.inf),
+        )
+
+    @classmethod
+    def concat(cls, arrays):
+        """
+        Concatenate trades of `TradeArrays`.
+
+        Parameters
+        ----------
+        - arrays : sequence of TradeArrays
+
+        Returns
+        -------
+        arrays : TradeArrays
+
+        Examples
+        --------
+        >>> a = TradeArrays([0, 1], [1.0, 2.0], [0, 2], [0], [3], [np.inf], [-np.inf])
+        >>> b = TradeArrays([1], [-1.0], [0, 1], [1], [2], [np.inf], [-np.inf])
+        >>> arrays = TradeArrays.concat([a, b])
+        >>> arrays.indptr, arrays.asset, arrays.entry
+        (array([0, 2, 3]), array([0, 1, 1]), array([0, 1]))
+        """
+        offsets = np.cumsum([0] + [a.n_legs for a in arrays])
+        indptr = [[0]] + [a.indptr[1:] + o for a, o in zip(arrays, offsets)]
+
+        def concat(name):
+            return np.concatenate([getattr(a, name) for a in arrays])
+
+        return cls(
+            concat("asset"),
+            concat("lot"),
+            np.concatenate(indptr),
+            concat("entry"),
+            concat("exit"),
+            concat("take"),
+            concat("stop"),
+        )
+
+    @property
+    def n_trades(self) -> int:
+        return self.indptr.size - 1
+
+    @property
+    def n_legs(self) -> int:
+        return self.asset.size
+
+    @property
+    def trade_id(self) -> np.array:
+        """
+        Return the index of trade that each leg belongs to.
+        """
+        return np.repeat(np.arange(self.n_trades), np.diff(self.indptr))
+
+    @staticmethod
+    def __get_positions(universe, labels, default):
+        if not isinstance(labels, np.ndarray):
+            labels = np.array(labels, dtype=object)
+        positions = np.full(labels.size, default, dtype=int)
+        given = ~pd.isna(labels)
+        if given.any():
+            positions[given] = universe.index.get_indexer(labels[given])
+        if (positions == -1).any():
+            raise KeyError("entry or exit not in universe.index")
+        return positions
+
+
+def execute(prices, arrays, chunk_size=2 ** 22) -> np.array:
+    """
+    Return index positions of close of trades.
+
+    Profit-take and stop-loss are evaluated for all trades at once.
+    Leading axes of `prices` (e.g. paths of Monte Carlo simulation)
+    are broadcast.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - arrays : TradeArrays
+    - chunk_size : int, default 2 ** 22
+        Approximate number of (leg, bar) pairs to evaluate at once.
+
+    Returns
+    -------
+    close : numpy.array, shape (..., n_trades)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]})
+    >>> trades = [ep.trade("A", entry=1, exit=5, take=2.0), -ep.trade("A", exit=3)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> execute(universe.values, arrays)
+    array([3, 3])
+    """
+    lead = prices.shape[:-2]
+    close = np.array(np.broadcast_to(arrays.exit, lead + (arrays.n_trades,)))
+
+    has_order = np.isfinite(arrays.take) | np.isfinite(arrays.stop)
+    trade_idx = np.flatnonzero(has_order)
+    if trade_idx.size == 0:
+        return close
+
+    length = np.maximum(arrays.exit - arrays.entry, 0) + 1
+    n_legs = np.diff(arrays.indptr)
+    n_elements = np.cumsum(length[trade_idx] * n_legs[trade_idx])
+    chunk_ids = n_elements // chunk_size
+
+    for chunk_id in np.unique(chunk_ids):
+        chunk = trade_idx[chunk_ids == chunk_id]
+        close[..., chunk] = _execute_chunk(prices, arrays, chunk, length[chunk])
+
+    return close
+
+
+def _execute_chunk(prices, arrays, trade_idx, length):
+    # A slot is a pair of trade and bar in [entry, exit].
+    # An element is a pair of slot and leg.
+    n_trades = trade_idx.size
+    slot_start = np.cumsum(length) - length
+    slot_trade = np.repeat(np.arange(n_trades), length)
+    slot_offset = np.arange(length.sum()) - np.repeat(slot_start, length)
+
+    leg_start = arrays.indptr[trade_idx]
+    leg_count = arrays.indptr[trade_idx + 1] - leg_start
+    slot_count = leg_count[slot_trade]
+    slot_bounds = np.cumsum(slot_count) - slot_count
+
+    elem_leg = _ragged_arange(leg_start[slot_trade], slot_count)
+    elem_bar = np.repeat(arrays.entry[trade_idx][slot_trade] + slot_offset, slot_count)
+
+    price = prices[..., elem_bar, arrays.asset[elem_leg]]
+    value = np.add.reduceat(arrays.lot[elem_leg] * price, slot_bounds, axis=-1)
+    pnl = value - value[..., slot_start[slot_trade]]
+
+    take = arrays.take[trade_idx][slot_trade]
+    stop = arrays.stop[trade_idx][slot_trade]
+    signal = np.logical_or(pnl >= take, pnl <= stop)
+
+    # Offset of the first signal, or that of exit if no signal
+    offset = np.where(signal, slot_offset, (length - 1)[slot_trade])
+    offset = np.minimum.reduceat(offset, slot_start, axis=-1)
+
+    return arrays.entry[trade_idx] + offset
+
+
+def leg_pnls(prices, arrays, close) -> np.array:
+    """
+    Return final profit-loss of each leg.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (..., n_trades)
+
+    Returns
+    -------
+    pnls : numpy.array, shape (..., n_legs)
+    """
+    lead = prices.shape[:-2]
+    n_assets = prices.shape[-1]
+    trade_id = arrays.trade_id
+
+    flat = prices.reshape(lead + (-1,))
+    i_entry = arrays.entry[trade_id] * n_assets + arrays.asset
+    i_close = close[..., trade_id] * n_assets + arrays.asset
+    i_close = np.broadcast_to(i_close, lead + (arrays.n_legs,))
+
+    p_entry = flat[..., i_entry]
+    p_close = np.take_along_axis(flat, i_close, axis=-1)
+
+    return arrays.lot.astype(result_dtype(prices)) * (p_close - p_entry)
+
+
+def trade_pnls(prices, arrays, close) -> np.array:
+    """
+    Return final profit-loss of each trade.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (..., n_trades)
+
+    Returns
+    -------
+    pnls : numpy.array, shape (..., n_trades)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [3.0, 2.0, 1.0]})
+    >>> trades = [ep.trade("A", entry=1), [1, -2] * ep.trade(["A", "B"])]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> trade_pnls(universe.values, arrays, close)
+    array([2., 7.])
+    """
+    pnls = leg_pnls(prices, arrays, close)
+    if arrays.n_trades == 0:
+        return pnls
+    # Accumulate in float64 even if prices are float32
+    return np.add.reduceat(pnls, arrays.indptr[:-1], axis=-1, dtype=np.float64)
+
+
+def _holdings(shape, arrays, begin, end, lot):
+    """
+    Return total lots held in `[begin, end)` for each bar and asset.
+
+    Parameters
+    ----------
+    - shape : tuple
+        Shape of prices, (..., n_bars, n_assets).
+    - begin, end : numpy.array, shape (..., n_legs)
+    - lot : numpy.array, shape (n_legs,)
+
+    Returns
+    -------
+    holdings : numpy.array, shape (..., n_bars, n_assets)
+    """
+    *lead, n_bars, n_assets = shape
+    n_paths = int(np.prod(lead))
+    size = (n_bars + 1) * n_assets
+
+    begin = np.broadcast_to(begin, tuple(lead) + lot.shape).reshape(n_paths, -1)
+    end = np.broadcast_to(end, tuple(lead) + lot.shape).reshape(n_paths, -1)
+    path = np.arange(n_paths).reshape(-1, 1) * size
+
+    index = np.concatenate(
+        [
+            (path + begin * n_assets + arrays.asset).reshape(-1),
+            (path + end * n_assets + arrays.asset).reshape(-1),
+        ]
+    )
+    weights = np.concatenate([np.tile(lot, n_paths), np.tile(-lot, n_paths)])
+    diff = np.bincount(index, weights=weights, minlength=n_paths * size)
+    diff = diff.reshape(tuple(lead) + (n_bars + 1, n_assets))
+
+    return np.cumsum(diff, axis=-2)[..., :-1, :]
+
+
+def wealth(prices, arrays, close) -> np.array:
+    """
+    Return wealth.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (..., n_trades)
+
+    Returns
+    -------
+    wealth : numpy.array, shape (..., n_bars)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0, 8.0], "B": [3.0, 2.0, 1.0, 0.0]})
+    >>> trades = [ep.trade("A", entry=1, exit=2), -ep.trade("B", entry=0)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> wealth(universe.values, arrays, close)
+    array([0., 1., 4., 5.])
+    """
+    dtype = result_dtype(prices)
+    trade_id = arrays.trade_id
+    begin = arrays.entry[trade_id] + 1
+    end = close[..., trade_id] + 1
+    holdings = _holdings(prices.shape, arrays, begin, end, arrays.lot)
+    holdings = holdings.astype(dtype, copy=False)
+
+    # Accumulate in float64 even if prices are float32
+    diff = np.zeros(prices.shape[:-1])
+    diff[..., 1:] = (holdings[..., 1:, :] * np.diff(prices, axis=-2)).sum(
+        axis=-1, dtype=np.float64
+    )
+
+    return np.cumsum(diff, axis=-1).astype(dtype, copy=False)
+
+
+def exposure(prices, arrays, close, net=True) -> np.array:
+    """
+    Return net or absolute exposure.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (..., n_trades)
+    - net : bool, default True
+        If False, return absolute exposure.
+
+    Returns
+    -------
+    exposure : numpy.array, shape (..., n_bars)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0, 8.0], "B": [3.0, 2.0, 1.0, 0.0]})
+    >>> trades = [ep.trade("A", entry=1, exit=2), -ep.trade("B", entry=0)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> exposure(universe.values, arrays, close)
+    array([-3.,  0.,  3.,  0.])
+    >>> exposure(universe.values, arrays, close, net=False)
+    array([3., 4., 5., 0.])
+    """
+    trade_id = arrays.trade_id
+    begin = arrays.entry[trade_id]
+    end = close[..., trade_id] + 1
+    lot = arrays.lot if net else np.abs(arrays.lot)
+    holdings = _holdings(prices.shape, arrays, begin, end, lot)
+    holdings = holdings.astype(result_dtype(prices), copy=False)
+
+    price = prices if net else np.abs(prices)
+    exposure = (holdings * price).sum(axis=-1, dtype=np.float64)
+    return exposure.astype(result_dtype(prices), copy=False)
+
+
+def result_dtype(prices) -> np.dtype:
+    """
+    Return float dtype in which wealth, exposure and pnls of prices are returned.
+
+    Parameters
+    ----------
+    - prices : numpy.array
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        Dtype of prices if it is float, or `numpy.float64` otherwise.
+
+    Examples
+    --------
+    >>> result_dtype(np.zeros(3, dtype=np.float32))
+    dtype('float32')
+    >>> result_dtype(np.zeros(3, dtype=int))
+    dtype('float64')
+    """
+    dtype = np.asarray(prices).dtype
+    return dtype if dtype.kind == "f" else np.dtype(float)
+
+
+def _mean_where(pnls, where):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(where, pnls, 0).sum(axis=-1) / where.sum(axis=-1)
+
+
+def metric(name, pnls, wealth) -> np.array:
+    """
+    Evaluate a metric along the last axis.
+
+    Parameters
+    ----------
+    - name : str
+        Name of metric. See `epymetheus.metrics`.
+    - pnls : numpy.array, shape (..., n_trades)
+        Final profit-loss of trades.
+    - wealth : numpy.array, shape (..., n_bars)
+        Wealth.
+
+    Returns
+    -------
+    metric : numpy.array, shape (...)
+
+    Examples
+    --------
+    >>> pnls = np.array([[1.0, -2.0, 3.0], [-1.0, -1.0, 2.0]])
+    >>> metric("num_win", pnls, None)
+    array([2, 1])
+    >>> metric("avg_lose", pnls, None)
+    array([-2., -1.])
+    """
+    n_trades = pnls.shape[-1]
+    metrics = {
+        "avg_lose": lambda: _mean_where(pnls, pnls <= 0),
+        "avg_pnl": lambda: np.mean(pnls, axis=-1),
+        "avg_win": lambda: _mean_where(pnls, pnls > 0),
+        "final_wealth": lambda: np.sum(pnls, axis=-1),
+        "max_drawdown": lambda: np.min(
+            wealth - np.maximum.accumulate(wealth, axis=-1), axis=-1
+        ),
+        "num_lose": lambda: np.sum(pnls <= 0, axis=-1),
+        "num_win": lambda: np.sum(pnls > 0, axis=-1),
+        "rate_lose": lambda: np.sum(pnls <= 0, axis=-1) / n_trades,
+        "rate_win": lambda: np.sum(pnls > 0, axis=-1) / n_trades,
+    }
+    return metrics[name]()
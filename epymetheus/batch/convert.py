@@ -0,0 +1,40 @@
+import pandas as pd
+
+from .batch import TradeArrays
+from .target import Target
+
+
+def to_trade_arrays(trades, universe) -> TradeArrays:
+    """
+    Convert what the logic of `Strategy` returns into `TradeArrays`.
+
+    Parameters
+    ----------
+    - trades : iterable of Trade, pandas.DataFrame, dict, TradeArrays or Target
+        A table of legs is converted by `TradeArrays.from_frame`,
+        `TradeArrays` is returned as it is and `Target` is converted
+        into runs of its lots by `TradeArrays.from_holdings`.
+    - universe : pandas.DataFrame
+
+    Returns
+    -------
+    arrays : TradeArrays
+
+    Examples
+    --------
+    >>> import epymetheus as ep
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+    >>> to_trade_arrays([ep.trade("A"), -ep.trade("B")], universe).lot
+    array([ 1., -1.])
+    >>> to_trade_arrays(pd.DataFrame({"asset": ["B"]}), universe).asset
+    array([1])
+    >>> to_trade_arrays(Target([[1.0, 0.0], [1.0, 0.0], [0.0, 0.0]]), universe).exit
+    array([2])
+    """
+    if isinstance(trades, TradeArrays):
+        return trades
+    if isinstance(trades, Target):
+        return TradeArrays.from_holdings(trades.lots(universe))
+    if isinstance(trades, (pd.DataFrame, dict)):
+        return TradeArrays.from_frame(trades, universe)
+    return TradeArrays.from_trades(trades or [], universe)
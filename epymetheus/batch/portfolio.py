@@ -0,0 +1,238 @@
+import heapq
+
+import numpy as np
+
+from .batch import TradeArrays
+
+# Kinds of events. Closes precede entries at the same bar to release capital.
+_CLOSE = 0
+_ENTRY = 1
+
+
+def simulate_portfolio(
+    prices,
+    arrays,
+    close,
+    cash=1.0,
+    min_cash=0.0,
+    max_leverage=None,
+    max_positions=None,
+    how="reject",
+) -> np.array:
+    """
+    Simulate a portfolio with capital constraints and
+    return the fraction of lot of each trade that is filled.
+
+    Entries and closes of trades are processed as events in time order
+    from a priority queue. Closes given by exits, profit-takes and stop-losses
+    are those evaluated by `execute`; a scaled trade keeps its close
+    since its profit-take and stop-loss are scaled together.
+    At each bar, closes are processed before entries and entries are
+    processed in the order of trades.
+
+    An entry is accepted if, after it is filled,
+
+    - cash is not less than `min_cash`,
+    - gross exposure, the sum of absolute values of positions of assets,
+      is not more than `max_leverage` times equity (cash plus positions),
+      unless the entry does not increase gross exposure,
+    - the number of open trades is not more than `max_positions`.
+
+    Equity and gross exposure are evaluated only at bars with events,
+    so that it takes O(n_events log n_events + n_event_bars * n_assets) time.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+    - cash : float, default 1.0
+        Initial cash.
+    - min_cash : float or None, default 0.0
+        Minimum cash after each entry. If None, cash is not constrained.
+    - max_leverage : float, optional
+        Maximum ratio of gross exposure to equity after each entry.
+    - max_positions : int, optional
+        Maximum number of open trades.
+    - how : {"reject", "scale"}, default "reject"
+        If "reject", an entry violating the constraints is rejected.
+        If "scale", its lots are scaled down to the largest fraction that
+        satisfies the constraints of cash and leverage.
+
+    Returns
+    -------
+    fill : numpy.array, shape (n_trades,)
+        Fraction of lot filled, which is 0.0 for rejected trades.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> from epymetheus.batch import execute
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [2.0, 2.0, 2.0]})
+    >>> trades = [ep.trade("A"), ep.trade("B"), ep.trade("B", entry=1)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> simulate_portfolio(universe.values, arrays, close, cash=4.0)
+    array([1., 1., 0.])
+    >>> simulate_portfolio(universe.values, arrays, close, cash=4.0, how="scale")
+    array([1. , 1. , 0.5])
+    """
+    if how not in ("reject", "scale"):
+        raise ValueError(f"Invalid how: {how}")
+
+    n_assets = prices.shape[-1]
+    n_trades = arrays.n_trades
+    indptr, asset, lot = _aggregate_legs(arrays, n_assets)
+    indptr, asset, lot = indptr.tolist(), asset.tolist(), lot.tolist()
+    close = np.asarray(close).tolist()
+
+    fill = [0.0] * n_trades
+    holdings = [0.0] * n_assets
+    n_open = 0
+
+    # The queue holds closes of open trades and the next entry in time order
+    entry = arrays.entry.tolist()
+    order = np.argsort(arrays.entry, kind="stable").tolist()
+    events = [(entry[order[0]], _ENTRY, order[0])] if n_trades > 0 else []
+    n_entries = 0
+
+    current_bar = None
+    while events:
+        bar, kind, i = heapq.heappop(events)
+        if kind == _ENTRY:
+            n_entries += 1
+            if n_entries < n_trades:
+                j = order[n_entries]
+                heapq.heappush(events, (entry[j], _ENTRY, j))
+        if bar != current_bar:
+            # Equity does not change by events within a bar
+            current_bar = bar
+            price = prices[bar].tolist()
+            equity = cash + float(np.dot(holdings, prices[bar]))
+            gross = float(np.dot(np.abs(holdings), np.abs(prices[bar])))
+
+        legs = range(indptr[i], indptr[i + 1])
+        held = [holdings[asset[k]] for k in legs]
+        p = [price[asset[k]] for k in legs]
+        lots = [lot[k] for k in legs]
+
+        if kind == _CLOSE:
+            lots = [-fill[i] * v for v in lots]
+            n_open -= 1
+        else:
+            f = _max_fill(held, lots, p, cash, min_cash, gross, equity, max_leverage)
+            if max_positions is not None and n_open >= max_positions:
+                f = 0.0
+            if how == "reject" and f < 1.0:
+                f = 0.0
+            if f <= 0.0:
+                continue
+            fill[i] = f
+            lots = [f * v for v in lots]
+            n_open += 1
+            heapq.heappush(events, (close[i], _CLOSE, i))
+
+        for k, h, v, pk in zip(legs, held, lots, p):
+            holdings[asset[k]] = h + v
+            cash -= v * pk
+            gross += (abs(h + v) - abs(h)) * abs(pk)
+
+    return np.array(fill)
+
+
+def fill_trades(arrays, close, fill):
+    """
+    Return filled trades given fractions of lots filled.
+
+    Trades with zero fill are dropped. Lots, profit-takes and stop-losses
+    of the other trades are scaled by their fills.
+
+    Parameters
+    ----------
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+    - fill : numpy.array, shape (n_trades,)
+        Fraction of lot of each trade filled. See `simulate_portfolio`.
+
+    Returns
+    -------
+    arrays : TradeArrays
+    close : numpy.array
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> from epymetheus.batch import execute, sparse_wealth
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [2.0, 2.0, 2.0]})
+    >>> trades = [ep.trade("A"), ep.trade("A", entry=1)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> fill = simulate_portfolio(universe.values, arrays, close, cash=2.0)
+    >>> fill
+    array([1., 0.])
+    >>> 2.0 + sparse_wealth(universe.values, *fill_trades(arrays, close, fill))
+    array([2., 3., 5.])
+    """
+    fill = np.asarray(fill, dtype=float)
+    filled = fill > 0
+    n_legs = np.diff(arrays.indptr)
+    legs = filled[arrays.trade_id]
+
+    filled_arrays = TradeArrays(
+        arrays.asset[legs],
+        arrays.lot[legs] * fill[arrays.trade_id][legs],
+        np.concatenate(([0], np.cumsum(n_legs[filled]))),
+        arrays.entry[filled],
+        arrays.exit[filled],
+        arrays.take[filled] * fill[filled],
+        arrays.stop[filled] * fill[filled],
+    )
+    return filled_arrays, np.asarray(close)[filled]
+
+
+def _aggregate_legs(arrays, n_assets):
+    """
+    Return `indptr`, `asset` and `lot` of legs where lots of
+    the same asset in each trade are summed up.
+    """
+    key = arrays.trade_id * n_assets + arrays.asset
+    key, inverse = np.unique(key, return_inverse=True)
+    lot = np.bincount(inverse.ravel(), weights=arrays.lot, minlength=key.size)
+    trade_id, asset = np.divmod(key, n_assets)
+    indptr = np.searchsorted(trade_id, np.arange(arrays.n_trades + 1))
+    return indptr, asset, lot
+
+
+def _max_fill(held, lots, price, cash, min_cash, gross, equity, max_leverage):
+    """
+    Return the largest fraction of lots in [0, 1] that satisfies
+    the constraints of cash and leverage.
+    """
+    f = 1.0
+
+    cost = sum(v * p for v, p in zip(lots, price))
+    if min_cash is not None and cost > 0 and cost > cash - min_cash:
+        f = min(f, (cash - min_cash) / cost)
+
+    if max_leverage is not None:
+        # Gross exposure is convex and piecewise linear in the fraction
+        def gross_at(x):
+            return gross + sum(
+                (abs(h + x * v) - abs(h)) * abs(p) for h, v, p in zip(held, lots, price)
+            )
+
+        bound = max(max_leverage * equity, gross)
+        if gross_at(1.0) <= bound:
+            return max(f, 0.0)
+        kinks = sorted(-h / v for h, v in zip(held, lots) if v != 0 and 0 < -h / v < 1)
+        x0, g0 = 0.0, gross
+        for x1 in kinks + [1.0]:
+            g1 = gross_at(x1)
+            if g1 > bound:
+                f = min(f, x0 + (bound - g0) * (x1 - x0) / (g1 - g0))
+                break
+            x0, g0 = x1, g1
+
+    return max(f, 0.0)
@@ -0,0 +1,357 @@
+import numpy as np
+
+from .batch import _ragged_arange
+from .batch import result_dtype
+
+
+class Positions:
+    """
+    Sparse representation of lots held of each asset.
+
+    Positions are stored as events in CSR-like arrays: the events of
+    the `j`-th asset are `indptr[j]:indptr[j + 1]`, sorted by bar.
+    `lot[k]` is the prefix sum of changes of lots, that is,
+    the lot held from `bar[k]` until the next event of the asset.
+    Work and memory are proportional to the number of events and
+    the number of pairs of bar and asset with non-zero lots,
+    not to `n_bars * n_assets`.
+
+    Parameters
+    ----------
+    - indptr : numpy.array, shape (n_assets + 1,)
+        Boundaries of events of each asset.
+    - bar : numpy.array, shape (n_events,)
+        Index positions of events.
+    - lot : numpy.array, shape (n_events,)
+        Lots held from each event.
+    - shape : tuple
+        (n_bars, n_assets).
+
+    Examples
+    --------
+    >>> positions = Positions.from_intervals(
+    ...     asset=[0, 0, 1], begin=[0, 2, 1], end=[3, 4, 2], lot=[1.0, 2.0, -1.0],
+    ...     shape=(5, 2),
+    ... )
+    >>> positions.indptr
+    array([0, 4, 6])
+    >>> positions.bar, positions.lot
+    (array([0, 2, 3, 4, 1, 2]), array([ 1.,  3.,  2.,  0., -1.,  0.]))
+    >>> positions.to_dense()
+    array([[ 1.,  0.],
+           [ 1., -1.],
+           [ 3.,  0.],
+           [ 2.,  0.],
+           [ 0.,  0.]])
+    """
+
+    def __init__(self, indptr, bar, lot, shape):
+        self.indptr = np.asarray(indptr, dtype=int)
+        self.bar = np.asarray(bar, dtype=int)
+        self.lot = np.asarray(lot, dtype=float)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_intervals(cls, asset, begin, end, lot, shape):
+        """
+        Initialize `Positions` from lots held in `[begin, end)`.
+
+        Parameters
+        ----------
+        - asset : numpy.array, shape (n,)
+            Column positions of assets.
+        - begin, end : numpy.array, shape (n,)
+            Index positions. Lots are held in `[begin, end)`.
+        - lot : numpy.array, shape (n,)
+        - shape : tuple
+            (n_bars, n_assets).
+
+        Returns
+        -------
+        positions : Positions
+        """
+        n_bars, n_assets = shape
+        asset, begin, end = (np.asarray(a, dtype=int) for a in (asset, begin, end))
+        lot = np.asarray(lot, dtype=float)
+
+        held = end > begin
+        asset = np.concatenate([asset[held], asset[held]])
+        bar = np.concatenate([begin[held], end[held]])
+        change = np.concatenate([lot[held], -lot[held]])
+        opened = np.repeat([1, -1], held.sum())
+
+        # Sort by asset and then by bar, and merge events at the same bar
+        key = asset * (n_bars + 1) + bar
+        order = np.argsort(key, kind="stable")
+        key, change, opened = key[order], change[order], opened[order]
+        first = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+        if key.size > 0:
+            key = key[first]
+            change = np.add.reduceat(change, first)
+            opened = np.add.reduceat(opened, first)
+
+        asset, bar = np.divmod(key, n_bars + 1)
+        indptr = np.searchsorted(asset, np.arange(n_assets + 1))
+
+        # Prefix sums of changes within each asset
+        start = indptr[:-1][asset]
+        lot = np.cumsum(change)
+        lot -= np.concatenate(([0.0], lot))[start]
+        n_open = np.cumsum(opened)
+        n_open -= np.concatenate(([0], n_open))[start]
+        # Cancel rounding errors where no interval is open
+        lot[n_open == 0] = 0.0
+
+        return cls(indptr, bar, lot, shape)
+
+    @property
+    def n_events(self) -> int:
+        return self.bar.size
+
+    @property
+    def asset(self) -> np.array:
+        """
+        Return the column position of the asset of each event.
+        """
+        return np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+
+    def segments(self):
+        """
+        Return segments of bars with constant non-zero lots.
+
+        Returns
+        -------
+        asset, begin, end, lot : numpy.array, shape (n_segments,)
+            Lots are held in `[begin, end)`.
+        """
+        asset = self.asset
+        end = np.append(self.bar[1:], self.shape[0])
+        # The last event of each asset closes all positions
+        last = self.indptr[1:][self.indptr[1:] > self.indptr[:-1]] - 1
+        end[last] = np.maximum(self.bar[last], self.shape[0])
+
+        held = (self.lot != 0) & (end > self.bar)
+        return asset[held], self.bar[held], end[held], self.lot[held]
+
+    def nonzero(self):
+        """
+        Return pairs of bar and asset with non-zero lots.
+
+        Returns
+        -------
+        bar, asset, lot : numpy.array, shape (nnz,)
+        """
+        asset, begin, end, lot = self.segments()
+        end = np.minimum(end, self.shape[0])
+        length = np.maximum(end - begin, 0)
+
+        bar = _ragged_arange(begin, length)
+        return bar, np.repeat(asset, length), np.repeat(lot, length)
+
+    def to_dense(self) -> np.array:
+        """
+        Return lots as a dense array.
+
+        Returns
+        -------
+        lots : numpy.array, shape (n_bars, n_assets)
+        """
+        bar, asset, lot = self.nonzero()
+        dense = np.zeros(self.shape)
+        dense[bar, asset] = lot
+        return dense
+
+
+def pnl_pairs(prices, arrays, close):
+    """
+    Return profit-loss earned at each pair of bar and asset held.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+
+    Returns
+    -------
+    bar, asset, pnl : numpy.array, shape (nnz,)
+        Profit-loss of each asset from the previous bar to `bar`.
+    """
+    dtype = result_dtype(prices)
+    trade_id = arrays.trade_id
+    positions = Positions.from_intervals(
+        arrays.asset, arrays.entry[trade_id], close[trade_id], arrays.lot, prices.shape
+    )
+    bar, asset, lot = positions.nonzero()
+
+    # Lots held from bar to bar + 1 earn the change of prices
+    lot = lot.astype(dtype, copy=False)
+    pnl = lot * (prices[bar + 1, asset] - prices[bar, asset])
+
+    return bar + 1, asset, pnl
+
+
+def exposure_pairs(prices, arrays, close, net=True):
+    """
+    Return net or absolute exposure at each pair of bar and asset held.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+    - net : bool, default True
+        If False, return absolute exposure.
+
+    Returns
+    -------
+    bar, asset, exposure : numpy.array, shape (nnz,)
+    """
+    dtype = result_dtype(prices)
+    trade_id = arrays.trade_id
+    lot = arrays.lot if net else np.abs(arrays.lot)
+    # Exposure includes the bar of close
+    positions = Positions.from_intervals(
+        arrays.asset, arrays.entry[trade_id], close[trade_id] + 1, lot, prices.shape
+    )
+    bar, asset, lot = positions.nonzero()
+
+    price = prices[bar, asset]
+    value = lot.astype(dtype, copy=False) * (price if net else np.abs(price))
+
+    return bar, asset, value
+
+
+def sparse_wealth(prices, arrays, close) -> np.array:
+    """
+    Return wealth evaluated with sparse positions.
+
+    It is equivalent to `wealth` of two-dimensional prices
+    but work is proportional to the number of pairs of bar and asset held.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+
+    Returns
+    -------
+    wealth : numpy.array, shape (n_bars,)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> from epymetheus.batch import TradeArrays, execute
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0, 8.0], "B": [3.0, 2.0, 1.0, 0.0]})
+    >>> trades = [ep.trade("A", entry=1, exit=2), -ep.trade("B", entry=0)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> sparse_wealth(universe.values, arrays, close)
+    array([0., 1., 4., 5.])
+    """
+    dtype = result_dtype(prices)
+    bar, _, pnl = pnl_pairs(prices, arrays, close)
+    diff = np.bincount(bar, weights=pnl, minlength=prices.shape[0])
+
+    return np.cumsum(diff).astype(dtype, copy=False)
+
+
+def sparse_exposure(prices, arrays, close, net=True) -> np.array:
+    """
+    Return net or absolute exposure evaluated with sparse positions.
+
+    It is equivalent to `exposure` of two-dimensional prices
+    but work is proportional to the number of pairs of bar and asset held.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+    - net : bool, default True
+        If False, return absolute exposure.
+
+    Returns
+    -------
+    exposure : numpy.array, shape (n_bars,)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> from epymetheus.batch import TradeArrays, execute
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0, 8.0], "B": [3.0, 2.0, 1.0, 0.0]})
+    >>> trades = [ep.trade("A", entry=1, exit=2), -ep.trade("B", entry=0)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> sparse_exposure(universe.values, arrays, close)
+    array([-3.,  0.,  3.,  0.])
+    >>> sparse_exposure(universe.values, arrays, close, net=False)
+    array([3., 4., 5., 0.])
+    """
+    dtype = result_dtype(prices)
+    bar, _, value = exposure_pairs(prices, arrays, close, net=net)
+    exposure = np.bincount(bar, weights=value, minlength=prices.shape[0])
+
+    return exposure.astype(dtype, copy=False)
+
+
+def group_wealth(prices, arrays, close, group, n_groups) -> np.array:
+    """
+    Return wealth of each group of trades evaluated with sparse positions.
+
+    Positions of each group are kept apart as if they were of distinct assets
+    so that wealth of all groups is evaluated in a single pass.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (n_bars, n_assets)
+    - arrays : TradeArrays
+    - close : numpy.array, shape (n_trades,)
+    - group : numpy.array, shape (n_trades,)
+        Group of each trade in `range(n_groups)`.
+    - n_groups : int
+        Number of groups.
+
+    Returns
+    -------
+    wealth : numpy.array, shape (n_bars, n_groups)
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import epymetheus as ep
+    >>> from epymetheus.batch import TradeArrays, execute
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0, 8.0], "B": [3.0, 2.0, 1.0, 0.0]})
+    >>> trades = [ep.trade("A", entry=1, exit=2), -ep.trade("B", entry=0)]
+    >>> arrays = TradeArrays.from_trades(trades, universe)
+    >>> close = execute(universe.values, arrays)
+    >>> group_wealth(universe.values, arrays, close, np.array([1, 0]), 2)
+    array([[0., 0.],
+           [1., 0.],
+           [2., 2.],
+           [3., 2.]])
+    """
+    dtype = result_dtype(prices)
+    n_bars, n_assets = prices.shape
+    trade_id = arrays.trade_id
+    column = group[trade_id] * n_assets + arrays.asset
+    positions = Positions.from_intervals(
+        column,
+        arrays.entry[trade_id],
+        close[trade_id],
+        arrays.lot,
+        (n_bars, n_groups * n_assets),
+    )
+    bar, column, lot = positions.nonzero()
+    group, asset = np.divmod(column, n_assets)
+
+    lot = lot.astype(dtype, copy=False)
+    pnl = lot * (prices[bar + 1, asset] - prices[bar, asset])
+    diff = np.bincount(
+        (bar + 1) * n_groups + group, weights=pnl, minlength=n_bars * n_groups
+    )
+
+    return np.cumsum(diff.reshape(n_bars, n_groups), axis=0).astype(dtype, copy=False)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from .batch import _runs
+
+
+def signal_to_trades(signal, take=None, stop=None) -> pd.DataFrame:
+    """
+    Convert a matrix of target positions into trades.
+
+    Each run of consecutive bars with the same non-zero position of an asset
+    becomes a single-asset trade with this position as its lot.
+    It enters at the first bar of the run and exits at the bar
+    where the position changes (or at the last bar).
+    Missing values stand for zero positions.
+
+    Parameters
+    ----------
+    - signal : pandas.DataFrame or numpy.array, shape (n_bars, n_assets)
+        Target positions in unit of share.
+        The index and columns should be those of universe.
+    - take : float > 0, optional
+        Threshold of profit-take of each trade.
+    - stop : float < 0, optional
+        Threshold of stop-loss of each trade.
+
+    Returns
+    -------
+    trades : pandas.DataFrame
+        Table of trades with columns `asset`, `lot`, `entry` and `exit`
+        (and `take` and `stop` if given) sorted by entry,
+        which can be returned by the logic of `Strategy`.
+
+    Examples
+    --------
+    >>> signal = pd.DataFrame({
+    ...     "A": [0, 1, 1, 1, 0, 0],
+    ...     "B": [2, 2, -1, -1, -1, -1],
+    ... })
+    >>> signal_to_trades(signal)
+      asset  lot  entry  exit
+    0     B  2.0      0     2
+    1     A  1.0      1     4
+    2     B -1.0      2     5
+
+    >>> from epymetheus.benchmarks import DeterminedStrategy
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], "B": 1.0})
+    >>> strategy = DeterminedStrategy(signal_to_trades(signal))
+    >>> strategy.run(universe, verbose=False).score("final_wealth")
+    3.0
+    """
+    signal = pd.DataFrame(signal)
+    n_bars = signal.shape[0]
+
+    asset, entry, end, lot = _runs(np.nan_to_num(signal.values.astype(float)))
+    exit = np.minimum(end, n_bars - 1)
+
+    trades = pd.DataFrame(
+        {
+            "asset": signal.columns.values[asset],
+            "lot": lot,
+            "entry": signal.index.values[entry],
+            "exit": signal.index.values[exit],
+        }
+    )
+    if take is not None:
+        trades["take"] = take
+    if stop is not None:
+        trades["stop"] = stop
+
+    return trades
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+
+from .batch import result_dtype
+
+
+class Target:
+    """
+    Target positions of assets at each bar.
+
+    The logic of `Strategy` may return `Target` instead of trades to run
+    a backtesting by matrix operations of holdings without trades.
+    The position at each bar is held until the next bar.
+
+    Parameters
+    ----------
+    - values : pandas.DataFrame or numpy.array, shape (n_bars, n_assets)
+        Target positions.
+        `pandas.DataFrame` is aligned to the index and columns of universe.
+        Missing values stand for zero positions.
+    - by : {"lot", "weight"}, default "lot"
+        If "lot", values are lots in unit of share.
+        If "weight", values are value-based weights,
+        which are converted into lots by dividing by prices.
+
+    Examples
+    --------
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [4.0, 2.0, 1.0]})
+    >>> Target(pd.DataFrame({"A": [0.5, 0.5, 0.5]}), by="weight").lots(universe)
+    array([[0.5  , 0.   ],
+           [0.25 , 0.   ],
+           [0.125, 0.   ]])
+    """
+
+    def __init__(self, values, by="lot"):
+        if by not in ("lot", "weight"):
+            raise ValueError(f"Invalid value of by: {by}")
+        self.values = values
+        self.by = by
+
+    def lots(self, universe) -> np.array:
+        """
+        Return lots to hold at each bar.
+
+        Parameters
+        ----------
+        - universe : pandas.DataFrame
+
+        Returns
+        -------
+        lots : numpy.array, shape (n_bars, n_assets)
+        """
+        values = self.values
+        if isinstance(values, pd.DataFrame):
+            values = values.reindex(index=universe.index, columns=universe.columns)
+        values = np.nan_to_num(np.asarray(values, dtype=float))
+        if values.shape != universe.shape:
+            raise ValueError(
+                f"Shape of target {values.shape} != shape of universe {universe.shape}"
+            )
+
+        if self.by == "weight":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.where(values != 0, values / universe.values, 0.0)
+
+        return values
+
+
+def holdings_wealth(prices, holdings) -> np.array:
+    """
+    Return wealth of holdings.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - holdings : numpy.array, shape (..., n_bars, n_assets)
+        Lots held from each bar to the next.
+
+    Returns
+    -------
+    wealth : numpy.array, shape (..., n_bars)
+
+    Examples
+    --------
+    >>> prices = np.array([[1.0, 4.0], [2.0, 2.0], [4.0, 1.0]])
+    >>> holdings = np.array([[1.0, 0.0], [0.0, -1.0], [0.0, 0.0]])
+    >>> holdings_wealth(prices, holdings)
+    array([0., 1., 2.])
+    """
+    dtype = result_dtype(prices)
+    holdings = np.asarray(holdings).astype(dtype, copy=False)
+
+    # Accumulate in float64 even if prices are float32
+    diff = np.zeros(prices.shape[:-1])
+    diff[..., 1:] = (holdings[..., :-1, :] * np.diff(prices, axis=-2)).sum(
+        axis=-1, dtype=np.float64
+    )
+
+    return np.cumsum(diff, axis=-1).astype(dtype, copy=False)
+
+
+def holdings_exposure(prices, holdings, net=True) -> np.array:
+    """
+    Return net or absolute exposure of holdings.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - holdings : numpy.array, shape (..., n_bars, n_assets)
+    - net : bool, default True
+        If False, return absolute exposure.
+
+    Returns
+    -------
+    exposure : numpy.array, shape (..., n_bars)
+
+    Examples
+    --------
+    >>> prices = np.array([[1.0, 4.0], [2.0, 2.0], [4.0, 1.0]])
+    >>> holdings = np.array([[1.0, 0.0], [1.0, -1.0], [0.0, 0.0]])
+    >>> holdings_exposure(prices, holdings)
+    array([1., 0., 0.])
+    >>> holdings_exposure(prices, holdings, net=False)
+    array([1., 4., 0.])
+    """
+    dtype = result_dtype(prices)
+    value = np.asarray(holdings).astype(dtype, copy=False) * prices
+    value = value if net else np.abs(value)
+
+    return value.sum(axis=-1, dtype=np.float64).astype(dtype, copy=False)
+
+
+def holdings_turnover(prices, holdings) -> np.array:
+    """
+    Return value traded at each bar to rebalance holdings.
+
+    Positions before the first bar are zero.
+
+    Parameters
+    ----------
+    - prices : numpy.array, shape (..., n_bars, n_assets)
+    - holdings : numpy.array, shape (..., n_bars, n_assets)
+
+    Returns
+    -------
+    turnover : numpy.array, shape (..., n_bars)
+
+    Examples
+    --------
+    >>> prices = np.array([[1.0, 4.0], [2.0, 2.0], [4.0, 1.0]])
+    >>> holdings = np.array([[1.0, 0.0], [1.0, -1.0], [0.0, 0.0]])
+    >>> holdings_turnover(prices, holdings)
+    array([1., 2., 5.])
+    """
+    dtype = result_dtype(prices)
+    holdings = np.asarray(holdings).astype(dtype, copy=False)
+    traded = np.abs(np.diff(holdings, axis=-2, prepend=0)) * np.abs(prices)
+
+    return traded.sum(axis=-1, dtype=np.float64).astype(dtype, copy=False)
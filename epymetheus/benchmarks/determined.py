@@ -1,4 +1,7 @@
+import pandas as pd
+
 from epymetheus import Strategy
+from epymetheus.batch import TradeArrays
 
 
 class DeterminedStrategy(Strategy):
@@ -7,8 +10,10 @@ class DeterminedStrategy(Strategy):
 
     Parameters
     ----------
-    trade : iterable of Trade
+    trade : iterable of Trade, pandas.DataFrame, dict[str, array] or TradeArrays
         Trades to yield.
+        A table of legs (see `epymetheus.batch.TradeArrays.from_frame`)
+        is returned as it is and executed without `Trade` objects.
 
     Examples
     --------
@@ -17,11 +22,22 @@ class DeterminedStrategy(Strategy):
     >>> universe = ...
     >>> strategy(universe)
     [trade(['A'], lot=[1.]), trade(['B'], lot=[1.])]
+
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+    >>> trades = {"asset": ["A", "B"], "entry": [0, 1], "lot": [1.0, -1.0]}
+    >>> strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+    >>> strategy.history()
+       trade_id asset  lot  entry  close  exit  take  stop  pnl
+    0         0     A  1.0      0      2     2  None  None  2.0
+    1         1     B -1.0      1      2     2  None  None  1.0
     """
 
     def __init__(self, trades):
+        if isinstance(trades, dict):
+            trades = pd.DataFrame(trades)
         self._trades = trades
 
     def logic(self, universe):
-        for t in self._trades:
-            yield t
+        if isinstance(self._trades, (pd.DataFrame, TradeArrays)):
+            return self._trades
+        return iter(self._trades)
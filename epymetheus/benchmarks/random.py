@@ -1,10 +1,12 @@
 import numpy as np
 
 from epymetheus import Strategy
-from epymetheus import trade
+from epymetheus import Trade
+from epymetheus.batch import TradeArrays
+from epymetheus.stochastic import check_rng
 
 
-def random_uniform(min_value=0, max_value=1, size=1):
+def random_uniform(min_value=0, max_value=1, size=1, rng=None):
     """
     Return random floats in range [min_value, max_value].
 
@@ -14,13 +16,17 @@ def random_uniform(min_value=0, max_value=1, size=1):
     >>> random_uniform(1, 2, 3)
     array([1.37454012, 1.95071431, 1.73199394])
     """
-    return (max_value - min_value) * np.random.random(size) + min_value
+    rng = np.random if rng is None else rng
+    return (max_value - min_value) * rng.random(size) + min_value
 
 
 class RandomStrategy(Strategy):
     """
     Randomly yield trades.
 
+    Assets, lots, entries and exits of all trades are drawn at once
+    so that it can generate a large number of trades quickly.
+
     Parameters
     ----------
     - n_trades : int, default 10
@@ -31,6 +37,23 @@ class RandomStrategy(Strategy):
         Maximum value of lots.
     - min_lot : 1
         Minimum value of lots.
+    - holding : None, int or callable, optional
+        Number of bars to hold each trade.
+        If None, entry and exit are drawn uniformly from the bars.
+        If int, every trade is held for this number of bars.
+        If callable, `holding(rng, size)` returns an array of holding lengths;
+        `rng` is `numpy.random.Generator` or `numpy.random` if seed is None.
+        Holding lengths are clipped to the length of universe.
+    - take : float > 0, optional
+        Threshold of profit-take of each trade.
+    - stop : float < 0, optional
+        Threshold of stop-loss of each trade.
+    - seed : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - columnar : bool, default False
+        If True, the logic returns trades as `TradeArrays` given by `arrays`
+        so that `run` executes them at once without creating `Trade` objects.
 
     Examples
     --------
@@ -39,20 +62,120 @@ class RandomStrategy(Strategy):
     >>> strategy = RandomStrategy(n_trades=2)
     >>> universe = make_randomwalk(10, 3)
     >>> strategy(universe)
-    [trade(['2'], lot=[1.], entry=1, exit=8), trade(['1'], lot=[1.], entry=1, exit=4)]
+    [trade(['2'], lot=[1.], entry=1, exit=9), trade(['1'], lot=[1.], entry=8, exit=9)]
+
+    Trades are reproducible if seed is given:
+
+    >>> strategy = RandomStrategy(n_trades=2, seed=42)
+    >>> strategy(universe) == strategy(universe)
+    True
+
+    Holding lengths can be drawn from a distribution:
+
+    >>> holding = lambda rng, size: rng.geometric(0.2, size)
+    >>> strategy = RandomStrategy(n_trades=1000, holding=holding, take=1.0, seed=42)
+    >>> arrays = strategy.arrays(universe)
+    >>> arrays.n_trades
+    1000
+    >>> ((arrays.exit - arrays.entry) >= 1).all()
+    True
+
+    Large numbers of trades can be run as `TradeArrays`:
+
+    >>> strategy = RandomStrategy(n_trades=1000, columnar=True, seed=42)
+    >>> strategy.run(universe, verbose=False).trade_arrays.n_trades
+    1000
     """
 
-    def __init__(self, n_trades=10, max_n_assets=1, max_lot=1.0, min_lot=1.0):
+    def __init__(
+        self,
+        n_trades=10,
+        max_n_assets=1,
+        max_lot=1.0,
+        min_lot=1.0,
+        holding=None,
+        take=None,
+        stop=None,
+        seed=None,
+        columnar=False,
+    ):
         self._n_trades = n_trades
         self.max_n_assets = max_n_assets
         self.max_lot = max_lot
         self.min_lot = min_lot
+        self.holding = holding
+        self.take = take
+        self.stop = stop
+        self.seed = seed
+        self.columnar = columnar
+
+    def arrays(self, universe) -> TradeArrays:
+        """
+        Return random trades as `TradeArrays`.
+
+        Parameters
+        ----------
+        - universe : pandas.DataFrame
+
+        Returns
+        -------
+        arrays : TradeArrays
+        """
+        rng = check_rng(self.seed)
+        if rng is None:
+            rng, randint = np.random, np.random.randint
+        else:
+            randint = rng.integers
+
+        n_trades = self._n_trades
+        n_bars, n_assets = universe.shape
+
+        n_legs = randint(1, self.max_n_assets + 1, size=n_trades)
+        indptr = np.concatenate(([0], np.cumsum(n_legs)))
+        asset = rng.choice(n_assets, indptr[-1])
+        lot = random_uniform(self.min_lot, self.max_lot, indptr[-1], rng=rng)
+        entry, exit = self.__bars(n_trades, n_bars, rng, randint)
+        take = np.full(n_trades, np.inf if self.take is None else self.take)
+        stop = np.full(n_trades, -np.inf if self.stop is None else self.stop)
+
+        return TradeArrays(asset, lot, indptr, entry, exit, take, stop)
 
     def logic(self, universe):
-        for _ in range(self._n_trades):
-            n_assets = np.random.randint(1, self.max_n_assets + 1, size=1)[0]
-            asset = list(np.random.choice(universe.columns, n_assets))
-            lot = list(random_uniform(self.min_lot, self.max_lot, size=n_assets))
-            entry, exit = sorted(np.random.choice(universe.index, 2))
+        arrays = self.arrays(universe)
+        if self.columnar:
+            return arrays
+        return self.__trades(universe, arrays)
+
+    def __trades(self, universe, arrays):
+        # Yield `Trade` objects of arrays
+        asset = universe.columns.values[arrays.asset]
+        # Labels of the same type as those given by the index (e.g. Timestamp)
+        entry = universe.index[arrays.entry].tolist()
+        exit = universe.index[arrays.exit].tolist()
+        bounds = arrays.indptr.tolist()
+
+        for i in range(arrays.n_trades):
+            legs = slice(bounds[i], bounds[i + 1])
+            yield Trade(
+                asset[legs],
+                entry=entry[i],
+                exit=exit[i],
+                take=self.take,
+                stop=self.stop,
+                lot=arrays.lot[legs],
+            )
+
+    def __bars(self, n_trades, n_bars, rng, randint):
+        # Return index positions of entries and exits
+        if self.holding is None:
+            bars = np.sort(rng.choice(n_bars, (n_trades, 2)), axis=1)
+            return bars[:, 0], bars[:, 1]
+
+        if callable(self.holding):
+            length = np.asarray(self.holding(rng, n_trades), dtype=int)
+        else:
+            length = np.full(n_trades, self.holding, dtype=int)
+        length = np.clip(length, 0, n_bars - 1)
 
-            yield (lot * trade(asset, entry=entry, exit=exit))
+        entry = randint(0, n_bars - length)
+        return entry, entry + length
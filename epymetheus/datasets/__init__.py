@@ -1,4 +1,6 @@
 # flake8: noqa
 
+from .cache import CachedReader
 from .randomwalk import make_randomwalk
+from .store import PriceStore
 from .usstocks import fetch_usstocks
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -29,3 +30,84 @@ def fill_and_cut(series, begin_date=None, method="ffill"):
     f_index = pd.date_range(series.index[0], series.index[-1])
     n_index = pd.date_range(begin_date or series.index[0], series.index[-1])
     return series.reindex(f_index, method=method).reindex(n_index)
+
+
+def align(times, values, calendar, fill=True, fill_after=True) -> np.array:
+    """
+    Align multiple series on a calendar.
+
+    All observations are placed on the calendar at once by `searchsorted`
+    and forward-filled by a cumulative maximum of their positions,
+    so that the cost is linear in the total number of observations.
+
+    Parameters
+    ----------
+    - times : list of numpy.array
+        Sorted timestamps of each series.
+    - values : list of numpy.array
+        Values of each series.
+    - calendar : numpy.array, shape (n_bars,)
+        Sorted timestamps to align series on.
+    - fill : bool, default True
+        If True, the value at a timestamp in the calendar is the last
+        observation at or before it. Otherwise, it is the observation
+        exactly at the timestamp.
+    - fill_after : bool, default True
+        If False, values after the last observation of each series are NaN.
+
+    Returns
+    -------
+    aligned : numpy.array, shape (n_bars, n_series)
+
+    Examples
+    --------
+    >>> times = [np.array([0, 2, 3]), np.array([1, 5])]
+    >>> values = [np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0])]
+    >>> align(times, values, np.arange(1, 5))
+    array([[1., 4.],
+           [2., 4.],
+           [3., 4.],
+           [3., 4.]])
+    >>> align(times, values, np.arange(1, 5), fill=False)
+    array([[nan,  4.],
+           [ 2., nan],
+           [ 3., nan],
+           [nan, nan]])
+    >>> align(times, values, np.arange(1, 5), fill_after=False)
+    array([[ 1.,  4.],
+           [ 2.,  4.],
+           [ 3.,  4.],
+           [nan,  4.]])
+    """
+    calendar = np.asarray(calendar)
+    n_series = len(times)
+    sizes = np.array([len(t) for t in times], dtype=int)
+    times = np.concatenate(times) if n_series else np.empty(0, calendar.dtype)
+    values = np.concatenate(values) if n_series else np.empty(0)
+    series = np.repeat(np.arange(n_series), sizes)
+    if times.size == 0:
+        return np.full((calendar.size, n_series), np.nan)
+
+    # Observation k is in effect from the first bar at or after times[k]
+    bar = np.searchsorted(calendar, times)
+    valid = bar < calendar.size
+    if not fill:
+        valid &= calendar[bar.clip(max=max(calendar.size - 1, 0))] == times
+    # The last observation wins among those falling on the same bar
+    last = np.ones(times.size, dtype=bool)
+    last[:-1] = (bar[:-1] != bar[1:]) | (series[:-1] != series[1:])
+    k = np.flatnonzero(valid & last)
+
+    position = np.full((calendar.size, n_series), -1, dtype=int)
+    position[bar[k], series[k]] = k
+    if fill:
+        # Positions increase along each series
+        np.maximum.accumulate(position, axis=0, out=position)
+        if not fill_after:
+            end = np.cumsum(sizes) - 1
+            after = calendar.reshape(-1, 1) > times[end.clip(0)]
+            position[after | (sizes == 0)] = -1
+
+    aligned = np.full(position.shape, np.nan)
+    aligned[position >= 0] = values[position[position >= 0]]
+    return aligned
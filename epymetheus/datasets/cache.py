@@ -0,0 +1,167 @@
+import json
+import os
+from datetime import datetime
+from threading import Lock
+
+import pandas as pd
+
+from .store import PriceStore
+
+
+class CachedReader:
+    """
+    Reader of historical prices with a persistent on-disk cache.
+
+    Prices are cached in a `PriceStore` and only the date ranges not yet
+    fetched are requested to the underlying reader.
+    Fetched date ranges and times are recorded in `fetch.json`.
+    It can be called from multiple threads for different tickers.
+
+    Parameters
+    ----------
+    - reader : callable
+        Function `reader(ticker, begin_date, end_date) -> pandas.Series`
+        that fetches prices within `[begin_date, end_date]`.
+    - path : str or path-like
+        Directory of the cache.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> def reader(ticker, begin_date, end_date):
+    ...     print(f"Fetch {ticker} from {begin_date.date()} to {end_date.date()}")
+    ...     index = pd.date_range(begin_date, end_date)
+    ...     return pd.Series(range(len(index)), index=index, dtype=float)
+    >>> cached_reader = CachedReader(reader, tempfile.mkdtemp())
+    >>> _ = cached_reader("A", "2000-01-01", "2000-01-10")
+    Fetch A from 2000-01-01 to 2000-01-10
+    >>> _ = cached_reader("A", "2000-01-05", "2000-01-20")
+    Fetch A from 2000-01-11 to 2000-01-20
+    >>> _ = cached_reader("A", "2000-01-01", "2000-01-20")
+    """
+
+    def __init__(self, reader, path):
+        self.reader = reader
+        self.path = path
+        self.store = PriceStore(path)
+        self.metadata = self.__read_metadata()
+        self._lock = Lock()
+
+    def __call__(self, ticker, begin_date, end_date) -> pd.Series:
+        """
+        Return prices of a ticker within `[begin_date, end_date]`.
+
+        Returns
+        -------
+        series : pandas.Series
+        """
+        begin_date, end_date = pd.Timestamp(begin_date), pd.Timestamp(end_date)
+
+        for begin, end in self.missing_ranges(ticker, begin_date, end_date):
+            self.__fetch(ticker, begin, end)
+
+        if ticker not in self.store.manifest:
+            return pd.Series(dtype=float, name=ticker)
+        return self.store.read(ticker, begin_date, end_date)
+
+    def missing_ranges(self, ticker, begin_date, end_date) -> list:
+        """
+        Return date ranges of a ticker within `[begin_date, end_date]`
+        that have not been fetched.
+
+        Returns
+        -------
+        ranges : list of tuple of pandas.Timestamp
+        """
+        one_day = pd.Timedelta(days=1)
+
+        ranges = []
+        begin = begin_date
+        for fetched_begin, fetched_end in self.fetched_ranges(ticker):
+            if fetched_end < begin:
+                continue
+            if fetched_begin > end_date:
+                break
+            if fetched_begin > begin:
+                ranges.append((begin, fetched_begin - one_day))
+            begin = fetched_end + one_day
+        if begin <= end_date:
+            ranges.append((begin, end_date))
+        return ranges
+
+    def fetched_ranges(self, ticker) -> list:
+        """
+        Return disjoint date ranges of a ticker that have been fetched
+        sorted by date.
+
+        Returns
+        -------
+        ranges : list of tuple of pandas.Timestamp
+        """
+        if ticker not in self.metadata:
+            return []
+        info = self.metadata[ticker]
+        # Metadata written before ranges were recorded has a single range
+        ranges = info.get("ranges", [[info.get("begin"), info.get("end")]])
+        return [(pd.Timestamp(begin), pd.Timestamp(end)) for begin, end in ranges]
+
+    def fetched_range(self, ticker) -> tuple:
+        """
+        Return the span of date ranges of a ticker that have been fetched.
+        Dates within it may not have been fetched; see `fetched_ranges`.
+
+        Returns
+        -------
+        date_range : tuple of pandas.Timestamp
+        """
+        ranges = self.fetched_ranges(ticker)
+        return ranges[0][0], ranges[-1][1]
+
+    def __fetch(self, ticker, begin, end):
+        series = self.reader(ticker, begin, end)
+
+        # Fetch concurrently but write the store and metadata one by one
+        with self._lock:
+            self.store.write(ticker, series)
+
+            ranges = _merge_ranges(self.fetched_ranges(ticker) + [(begin, end)])
+            self.metadata[ticker] = {
+                "ranges": [[str(b), str(e)] for b, e in ranges],
+                "fetched_at": datetime.now().isoformat(),
+            }
+            self.__write_metadata()
+
+    def __read_metadata(self) -> dict:
+        filepath = os.path.join(self.path, "fetch.json")
+        if not os.path.exists(filepath):
+            return {}
+        with open(filepath) as f:
+            return json.load(f)
+
+    def __write_metadata(self):
+        filepath = os.path.join(self.path, "fetch.json")
+        with open(filepath + ".tmp", "w") as f:
+            json.dump(self.metadata, f, indent=2, sort_keys=True)
+        os.replace(filepath + ".tmp", filepath)
+
+
+def _merge_ranges(ranges) -> list:
+    """
+    Merge overlapping or adjacent date ranges.
+
+    Examples
+    --------
+    >>> days = [(5, 9), (1, 4), (20, 31)]
+    >>> ranges = [(pd.Timestamp(2000, 1, b), pd.Timestamp(2000, 1, e)) for b, e in days]
+    >>> [(b.day, e.day) for b, e in _merge_ranges(ranges)]
+    [(1, 9), (20, 31)]
+    """
+    one_day = pd.Timedelta(days=1)
+
+    merged = []
+    for begin, end in sorted(ranges):
+        if merged and begin <= merged[-1][1] + one_day:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((begin, end))
+    return merged
@@ -13,11 +13,12 @@ def make_randomwalk(
     name="RandomWalk",
     bars=None,
     assets=None,
+    seed=None,
 ) -> pd.DataFrame:
     """
     Return `pandas.DataFrame` of random-walking prices (geometric Brownian motion).
     Daily returns follow log-normal distribution.
-    Seed can be set by `np.random.seed(...)`.
+    Seed can be set by `seed` or `np.random.seed(...)`.
 
     Parameters
     ----------
@@ -27,7 +28,9 @@ def make_randomwalk(
     - name : str, default='RandomWalk'
     - bars
     - assets
-    - seed : int
+    - seed : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
 
     Returns
     -------
@@ -50,6 +53,12 @@ def make_randomwalk(
     7  1.029200  0.956554  0.994996
     8  1.026827  0.957152  0.980871
     9  1.021202  0.958167  0.969598
+
+    >>> make_randomwalk(3, 2, seed=42)
+              0         1
+    0  1.000000  1.000000
+    1  1.003002  0.989605
+    2  1.010506  0.998906
     """
     data = generate_geometric_brownian(
         n_steps=n_steps,
@@ -58,6 +67,7 @@ def make_randomwalk(
         init_value=init_value,
         dt=dt,
         drift=drift,
+        rng=seed,
     )
     index = bars or list(range(n_steps))
     columns = assets or [str(i) for i in range(n_assets)]
@@ -0,0 +1,208 @@
+import json
+import os
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from ._utils import align
+
+_dtype = np.dtype([("time", "<i8"), ("value", "<f8")])
+
+
+class PriceStore:
+    """
+    Local store of historical prices.
+
+    Prices of each asset are stored as a `.npy` file of records
+    `(time, value)` sorted by time, and `manifest.json` records the file
+    and the date range of each asset.
+    Loading reads only the files of requested assets (column pruning)
+    and only the records within the requested date range, which are
+    located by binary search on memory-mapped files (predicate pushdown).
+
+    Parameters
+    ----------
+    - path : str or path-like
+        Directory of the store. It is created if it does not exist.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> store = PriceStore(tempfile.mkdtemp())
+    >>> index = pd.date_range("2000-01-01", periods=4)
+    >>> store.write("A", pd.Series([1.0, 2.0, 3.0, 4.0], index=index))
+    >>> store.write("B", pd.Series([5.0, 6.0], index=index[[0, 2]]))
+    >>> store.assets
+    ['A', 'B']
+    >>> store.load(begin="2000-01-02")
+                  A    B
+    2000-01-02  2.0  5.0
+    2000-01-03  3.0  6.0
+    2000-01-04  4.0  6.0
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.manifest = self.__read_manifest()
+
+    @property
+    def assets(self) -> list:
+        """
+        Return the names of assets in the store.
+        """
+        return sorted(self.manifest)
+
+    def date_range(self, asset) -> tuple:
+        """
+        Return the first and last timestamps of an asset.
+
+        Returns
+        -------
+        date_range : tuple of pandas.Timestamp
+        """
+        info = self.manifest[asset]
+        return pd.Timestamp(info["begin"]), pd.Timestamp(info["end"])
+
+    def write(self, asset, series, overwrite=False):
+        """
+        Write prices of an asset.
+
+        Prices are merged into existing ones and new values take precedence
+        on overlapping timestamps unless `overwrite=True`.
+
+        Parameters
+        ----------
+        - asset : str
+            Name of asset.
+        - series : pandas.Series
+            Prices indexed by timestamps.
+        - overwrite : bool, default False
+            If True, replace existing prices of the asset.
+        """
+        self.__write_records(asset, series, overwrite=overwrite)
+        self.__write_manifest()
+
+    def write_frame(self, universe, overwrite=False):
+        """
+        Write prices of assets in `pandas.DataFrame`.
+
+        Parameters
+        ----------
+        - universe : pandas.DataFrame
+            Prices indexed by timestamps. Columns are names of assets.
+        - overwrite : bool, default False
+            If True, replace existing prices of the assets.
+        """
+        for asset in universe.columns:
+            self.__write_records(asset, universe[asset], overwrite=overwrite)
+        self.__write_manifest()
+
+    def read(self, asset, begin=None, end=None) -> pd.Series:
+        """
+        Read prices of an asset within `[begin, end]`.
+
+        Returns
+        -------
+        series : pandas.Series
+        """
+        records = self.__read_records(asset, begin, end)
+        return pd.Series(
+            records["value"], index=pd.DatetimeIndex(records["time"]), name=asset
+        )
+
+    def load(self, assets=None, begin=None, end=None, fill=True) -> pd.DataFrame:
+        """
+        Load prices of assets into an aligned `pandas.DataFrame`.
+
+        The index is the union of timestamps of assets within `[begin, end]`.
+
+        Parameters
+        ----------
+        - assets : list of str, optional
+            Names of assets to load. If None, load all assets.
+        - begin : str or pandas.Timestamp, optional
+        - end : str or pandas.Timestamp, optional
+        - fill : bool, default True
+            If True, forward-fill missing prices,
+            including the last price before `begin`.
+
+        Returns
+        -------
+        universe : pandas.DataFrame, shape (n_bars, n_assets)
+        """
+        assets = self.assets if assets is None else list(assets)
+
+        # The last record before begin is read to forward-fill prices at begin
+        records = [self.__read_records(a, begin, end, lookback=fill) for a in assets]
+        times = [r["time"] for r in records]
+
+        calendar = np.unique(np.concatenate(times)) if times else np.empty(0, "i8")
+        if begin is not None:
+            calendar = calendar[calendar >= pd.Timestamp(begin).value]
+
+        values = align(times, [r["value"] for r in records], calendar, fill=fill)
+
+        return pd.DataFrame(
+            values, index=pd.DatetimeIndex(calendar), columns=assets, copy=False
+        )
+
+    def __read_records(self, asset, begin=None, end=None, lookback=False):
+        if asset not in self.manifest:
+            raise KeyError(f"asset {asset} not in store")
+        if self.manifest[asset]["n_records"] == 0:
+            return np.empty(0, dtype=_dtype)
+        filepath = os.path.join(self.path, self.manifest[asset]["file"])
+        records = np.load(filepath, mmap_mode="r")
+        time = records["time"]
+
+        i_begin = 0
+        if begin is not None:
+            i_begin = np.searchsorted(time, pd.Timestamp(begin).value)
+            i_begin = max(i_begin - 1, 0) if lookback else i_begin
+        i_end = time.size
+        if end is not None:
+            i_end = np.searchsorted(time, pd.Timestamp(end).value, side="right")
+
+        return np.array(records[i_begin:i_end])
+
+    def __write_records(self, asset, series, overwrite=False):
+        series = series.dropna()
+        records = np.empty(series.size, dtype=_dtype)
+        records["time"] = pd.DatetimeIndex(series.index).asi8
+        records["value"] = series.values
+
+        if asset in self.manifest and not overwrite:
+            records = np.concatenate([self.__read_records(asset), records])
+        # Keep the last occurrence of each timestamp
+        records = records[::-1]
+        _, first = np.unique(records["time"], return_index=True)
+        records = records[first]
+
+        filename = self.manifest.get(asset, {}).get(
+            "file", quote(asset, safe="") + ".npy"
+        )
+        filepath = os.path.join(self.path, filename)
+        np.save(filepath + ".tmp.npy", records)
+        os.replace(filepath + ".tmp.npy", filepath)
+
+        self.manifest[asset] = {
+            "file": filename,
+            "begin": str(pd.Timestamp(records["time"][0])) if records.size else None,
+            "end": str(pd.Timestamp(records["time"][-1])) if records.size else None,
+            "n_records": int(records.size),
+        }
+
+    def __read_manifest(self) -> dict:
+        filepath = os.path.join(self.path, "manifest.json")
+        if not os.path.exists(filepath):
+            return {}
+        with open(filepath) as f:
+            return json.load(f)
+
+    def __write_manifest(self):
+        filepath = os.path.join(self.path, "manifest.json")
+        with open(filepath + ".tmp", "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(filepath + ".tmp", filepath)
@@ -1,10 +1,14 @@
+import os
+from functools import partial
 from os.path import dirname
 from pathlib import Path
+from time import sleep
 
+import numpy as np
 import pandas as pd
-from pandas_datareader import DataReader
 
-from ._utils import fill_and_cut
+from ._utils import align
+from .cache import CachedReader
 
 module_path = Path(dirname(__file__))
 
@@ -16,6 +20,11 @@ def fetch_usstocks(
     column="Adj Close",
     verbose=True,
     fill=True,
+    reader=None,
+    cache_dir=None,
+    n_jobs=1,
+    max_retries=3,
+    backoff=1.0,
 ) -> pd.DataFrame:
     """
     Return `pandas.DataFrame` of historical prices of US stocks.
@@ -25,6 +34,21 @@ def fetch_usstocks(
     - begin_date : str
     - end_date : str
     - n_assets : int
+    - reader : callable, optional
+        Function `reader(ticker, begin_date, end_date) -> pandas.Series`
+        that fetches prices within `[begin_date, end_date]`.
+        If None, `column` of Yahoo Finance is fetched by `pandas_datareader`.
+    - cache_dir : str or path-like, optional
+        If given, prices are cached in this directory by `CachedReader`
+        and only date ranges not yet fetched are requested to `reader`.
+    - n_jobs : int, default 1
+        Number of threads to fetch tickers concurrently.
+        If -1, use as many threads as cores.
+    - max_retries : int, default 3
+        Number of times to retry fetching a ticker when `reader` fails.
+    - backoff : float, default 1.0
+        Seconds to wait before the first retry.
+        The wait doubles at each retry.
 
     Returns
     -------
@@ -40,20 +64,65 @@ def fetch_usstocks(
     if n_assets > len(tickers):
         raise ValueError("n_assets should be <=", len(tickers))
 
-    prices_dict = {
-        ticker: DataReader(
-            name=ticker,
-            data_source="yahoo",
-            start=begin_date - pd.Timedelta(days=10),
-            end=end_date,
-        )[column]
-        for ticker in tickers[:n_assets]
-    }
+    if reader is None:
+        reader = partial(_read_yahoo, column=column)
+    if cache_dir is not None:
+        reader = CachedReader(reader, os.path.join(cache_dir, column))
 
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    fetch = partial(
+        _fetch,
+        reader=reader,
+        begin_date=begin_date - pd.Timedelta(days=10),
+        end_date=end_date,
+        max_retries=max_retries,
+        backoff=backoff,
+    )
+
+    tickers = tickers[:n_assets]
+    if n_jobs == 1:
+        prices = [fetch(ticker) for ticker in tickers]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # map yields results in the order of tickers
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            prices = list(executor.map(fetch, tickers))
+
+    # Align all tickers at once on the daily calendar,
+    # or on the observed dates if not fill
+    times = [pd.DatetimeIndex(price.index).asi8 for price in prices]
+    values = [np.asarray(price, dtype=float) for price in prices]
+    observed = np.unique(np.concatenate(times))
     if fill:
-        prices_dict = {
-            k: fill_and_cut(price, begin_date=begin_date)
-            for k, price in prices_dict.items()
-        }
+        calendar = pd.date_range(begin_date, pd.Timestamp(observed[-1])).asi8
+    else:
+        calendar = observed
+    aligned = align(times, values, calendar, fill=fill, fill_after=False)
+
+    return pd.DataFrame(
+        aligned, index=pd.DatetimeIndex(calendar), columns=tickers, copy=False
+    )
+
+
+def _fetch(ticker, reader, begin_date, end_date, max_retries=3, backoff=1.0):
+    """
+    Fetch prices of a ticker and retry with exponential backoff on failure.
+    """
+    for i in range(max_retries + 1):
+        try:
+            return reader(ticker, begin_date, end_date)
+        except Exception:
+            if i == max_retries:
+                raise
+            sleep(backoff * 2 ** i)
+
+
+def _read_yahoo(ticker, begin_date, end_date, column="Adj Close") -> pd.Series:
+    # pandas_datareader takes long to import and is needed only here
+    from pandas_datareader import DataReader
 
-    return pd.DataFrame(prices_dict)
+    prices = DataReader(
+        name=ticker, data_source="yahoo", start=begin_date, end=end_date
+    )
+    return prices[column]
@@ -4,7 +4,8 @@ from .. import ts
 
 
 def _pnls(trades, universe) -> np.array:
-    return np.array([np.sum(t.final_pnl(universe)) for t in trades])
+    # Accumulate in float64 even if prices are float32
+    return np.array([np.sum(t.final_pnl(universe), dtype=float) for t in trades])
 
 
 def final_wealth(trades, universe) -> float:
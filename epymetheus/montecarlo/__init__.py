@@ -0,0 +1,3 @@
+# flake8: noqa
+
+from .montecarlo import run_montecarlo
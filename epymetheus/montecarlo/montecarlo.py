@@ -0,0 +1,237 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .. import batch
+from ..exceptions import NoTradeError
+from ..stochastic import generate_geometric_brownian
+from ..stochastic import spawn_seeds
+
+
+def run_montecarlo(
+    strategy,
+    n_paths=100,
+    n_steps=1000,
+    n_assets=10,
+    volatility=0.01,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    metrics=("final_wealth", "max_drawdown"),
+    batch_trades=False,
+    n_jobs=1,
+    bars=None,
+    assets=None,
+    seed=None,
+    method="pseudo",
+    dtype=np.float64,
+) -> pd.DataFrame:
+    """
+    Run backtestings of strategy over random-walking universes
+    and return the distribution of metrics.
+
+    Prices of paths are generated as an array of shape
+    (n_paths, n_steps, n_assets) by `generate_geometric_brownian`.
+    Seed can be set by `seed` or `np.random.seed(...)`.
+
+    Parameters
+    ----------
+    - strategy : Strategy
+        Strategy to evaluate.
+    - n_paths : int, default 100
+        Number of simulated universes.
+    - n_steps : int, default 1000
+    - n_assets : int, default 10
+    - volatility : float, default 0.01
+    - init_value : float, default 1.0
+    - dt : float, default 1.0
+    - drift : float, default 0.0
+    - metrics : sequence of str, default ("final_wealth", "max_drawdown")
+        Names of metrics to evaluate. See `epymetheus.metrics`.
+    - batch_trades : bool, default False
+        If True, trades are generated only once from the first path and
+        evaluated on all paths at once.
+        This is valid only if the logic of strategy does not depend on prices.
+    - n_jobs : int, default 1
+        Number of processes. If -1, use all cores.
+        Strategy should be picklable if `n_jobs != 1`.
+    - bars : sequence of length n_steps, optional
+        Index of universes. If None, `range(n_steps)` is used.
+    - assets : sequence of length n_assets, optional
+        Columns of universes. If None, `"0"`, `"1"`, ... are used.
+    - seed : int or numpy.random.SeedSequence, optional
+        If given, independent random streams are spawned for each path
+        and paths are generated in workers.
+        The result is then identical for any `n_jobs`.
+        If None, all paths are generated from the global state of `np.random`.
+    - method : {"pseudo", "antithetic", "sobol"}, default "pseudo"
+        Method to draw normal random numbers. See `generate_geometric_brownian`.
+        If "antithetic", `n_paths` should be even and the path `i + n_paths // 2`
+        is the antithetic path of the path `i`.
+        If "sobol", `n_paths * n_assets` should be a power of 2.
+        Unless "pseudo", all paths are generated in the main process
+        since they are not independent.
+    - dtype : data-type, default numpy.float64
+        Data type of prices. With `numpy.float32`, prices and wealth take
+        half memory while metrics are accumulated in float64.
+
+    Returns
+    -------
+    metrics : pandas.DataFrame, shape (n_paths, n_metrics)
+        Metrics of each path.
+
+    Examples
+    --------
+    >>> import epymetheus as ep
+    >>> from epymetheus.benchmarks import DeterminedStrategy
+    >>> np.random.seed(42)
+    >>> strategy = DeterminedStrategy([ep.trade("0", entry=0, exit=9)])
+    >>> run_montecarlo(strategy, n_paths=3, n_steps=10, n_assets=2)
+       final_wealth  max_drawdown
+    0      0.006578     -0.020956
+    1     -0.037029     -0.046544
+    2     -0.018478     -0.022430
+    """
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+
+    index = pd.Index(list(range(n_steps)) if bars is None else bars)
+    columns = pd.Index([str(i) for i in range(n_assets)] if assets is None else assets)
+    if len(index) != n_steps:
+        raise ValueError(f"Length of bars {len(index)} != n_steps {n_steps}")
+    if len(columns) != n_assets:
+        raise ValueError(f"Length of assets {len(columns)} != n_assets {n_assets}")
+    if method == "antithetic" and n_paths % 2 == 1:
+        raise ValueError(f"n_paths should be even for antithetic: {n_paths}")
+
+    params = dict(
+        n_steps=n_steps,
+        n_assets=n_assets,
+        volatility=volatility,
+        init_value=init_value,
+        dt=dt,
+        drift=drift,
+        dtype=dtype,
+    )
+
+    if seed is None or method != "pseudo":
+        prices = generate_geometric_brownian(
+            n_steps=n_steps,
+            n_paths=n_paths * n_assets,
+            volatility=volatility,
+            init_value=init_value,
+            dt=dt,
+            drift=drift,
+            rng=seed,
+            method=method,
+            dtype=dtype,
+        )
+        prices = prices.reshape(n_steps, n_paths, n_assets).transpose(1, 0, 2)
+        prices = np.ascontiguousarray(prices)
+        chunks = np.array_split(prices, max(n_jobs, 1))
+    else:
+        # Each path has its own random stream so that the result
+        # does not depend on how paths are distributed over workers.
+        seeds = spawn_seeds(seed, n_paths)
+        chunks = [
+            [seeds[i] for i in indices]
+            for indices in np.array_split(np.arange(n_paths), max(n_jobs, 1))
+        ]
+    chunks = [chunk for chunk in chunks if len(chunk) > 0]
+
+    if batch_trades:
+        first = _get_paths(chunks[0][:1], params)[0]
+        universe = pd.DataFrame(first, index=index, columns=columns, copy=False)
+        arrays = _generate_arrays(strategy, universe)
+        func, args = _evaluate_arrays, (arrays, metrics)
+    else:
+        func, args = _evaluate_strategy, (strategy, index, columns, metrics)
+
+    if n_jobs == 1:
+        results = [_run_chunk(chunk, params, func, args) for chunk in chunks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_run_chunk, chunk, params, func, args)
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+
+    return pd.DataFrame(np.concatenate(results), columns=list(metrics))
+
+
+def _get_paths(chunk, params) -> np.array:
+    """
+    Return prices of paths in a chunk.
+
+    Parameters
+    ----------
+    - chunk : numpy.array or list of numpy.random.SeedSequence
+        Prices, or seeds of paths to generate.
+    - params : dict
+        Parameters of geometric Brownian motion.
+
+    Returns
+    -------
+    prices : numpy.array, shape (n_paths, n_steps, n_assets)
+    """
+    if isinstance(chunk, np.ndarray):
+        return chunk
+
+    n_steps, n_assets = params["n_steps"], params["n_assets"]
+    prices = np.empty((len(chunk), n_steps, n_assets), dtype=params["dtype"])
+    for i, seed in enumerate(chunk):
+        generate_geometric_brownian(
+            n_steps=n_steps,
+            n_paths=n_assets,
+            volatility=params["volatility"],
+            init_value=params["init_value"],
+            dt=params["dt"],
+            drift=params["drift"],
+            rng=seed,
+            out=prices[i],
+        )
+    return prices
+
+
+def _run_chunk(chunk, params, func, args) -> np.array:
+    return func(_get_paths(chunk, params), *args)
+
+
+def _evaluate_arrays(prices, arrays, metrics) -> np.array:
+    """
+    Evaluate trades on all paths at once.
+
+    Returns
+    -------
+    metrics : numpy.array, shape (n_paths, n_metrics)
+    """
+    close = batch.execute(prices, arrays)
+    pnls = batch.trade_pnls(prices, arrays, close)
+    wealth = batch.wealth(prices, arrays, close) if "max_drawdown" in metrics else None
+    return np.stack([batch.metric(m, pnls, wealth) for m in metrics], axis=-1)
+
+
+def _evaluate_strategy(prices, strategy, index, columns, metrics) -> np.array:
+    """
+    Generate and evaluate trades path by path.
+
+    Returns
+    -------
+    metrics : numpy.array, shape (n_paths, n_metrics)
+    """
+    results = np.empty((prices.shape[0], len(metrics)))
+    for i, price in enumerate(prices):
+        universe = pd.DataFrame(price, index=index, columns=columns, copy=False)
+        arrays = _generate_arrays(strategy, universe)
+        results[i] = _evaluate_arrays(price, arrays, metrics)
+    return results
+
+
+def _generate_arrays(strategy, universe) -> batch.TradeArrays:
+    arrays = batch.to_trade_arrays(strategy(universe, to_list=False), universe)
+    if arrays.n_trades == 0:
+        raise NoTradeError("No trade.")
+    return arrays
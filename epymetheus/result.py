@@ -0,0 +1,408 @@
+import json
+import os
+from datetime import datetime
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+from numpy.lib.format import open_memmap
+
+from . import batch
+from .exceptions import NotRunError
+
+# Columns of trade history saved as arrays
+_columns = ("trade_id", "asset", "lot", "entry", "close", "exit", "take", "stop", "pnl")
+# Series saved as arrays
+_series = ("wealth", "net_exposure", "abs_exposure")
+# Data types of columns of trade history
+_dtypes = dict(
+    trade_id=np.int64,
+    asset=np.int32,
+    lot=np.float64,
+    entry=np.int64,
+    close=np.int64,
+    exit=np.int64,
+    take=np.float64,
+    stop=np.float64,
+    pnl=np.float64,
+)
+
+
+class Result:
+    """
+    Result of a backtesting loaded by `load_result`
+    or returned by `Strategy.backtest`.
+
+    It has the same methods as `Strategy` to view the result,
+    which return pandas objects sharing memory with the loaded arrays.
+    Its attributes cannot be reassigned.
+
+    Attributes
+    ----------
+    - arrays : dict[str, numpy.array]
+        Arrays of trade history, wealth and exposure.
+        Assets are codes of `assets` and bars (entry, close and exit)
+        are positions in `index`. -1 stands for None.
+    - index : pandas.Index
+        Bars of universe.
+    - assets : pandas.Index
+        Assets of universe.
+    - metadata : dict
+        Metadata of the run.
+    """
+
+    __slots__ = ("arrays", "index", "assets", "metadata")
+
+    def __init__(self, arrays, index, assets, metadata):
+        object.__setattr__(self, "arrays", MappingProxyType(arrays))
+        object.__setattr__(self, "index", index)
+        object.__setattr__(self, "assets", assets)
+        object.__setattr__(self, "metadata", MappingProxyType(metadata))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Result is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Result is immutable")
+
+    def __reduce__(self):
+        arrays, metadata = dict(self.arrays), dict(self.metadata)
+        return (self.__class__, (arrays, self.index, self.assets, metadata))
+
+    @classmethod
+    def from_strategy(cls, strategy):
+        """
+        Return the result of a strategy that has been run held in memory.
+
+        Arrays of the result are read-only.
+
+        Parameters
+        ----------
+        - strategy : Strategy
+            Strategy that has been run.
+
+        Returns
+        -------
+        result : Result
+        """
+        if not _is_run(strategy):
+            raise NotRunError("Strategy has not been run")
+
+        universe = strategy.universe
+        batch_arrays = strategy._batch_arrays()
+        if batch_arrays is not None:
+            n_trades = batch_arrays[0].n_trades
+            columns = _history_arrays_chunk(*batch_arrays, universe.values, 0, n_trades)
+        else:
+            columns = _history_chunk(strategy.trades, universe, 0)
+
+        arrays = {
+            name: np.array(columns[name], dtype=dtype)
+            for name, dtype in _dtypes.items()
+        }
+        arrays["wealth"] = np.array(strategy.wealth().values)
+        arrays["net_exposure"] = np.array(strategy.net_exposure().values)
+        arrays["abs_exposure"] = np.array(strategy.abs_exposure().values)
+        for array in arrays.values():
+            array.setflags(write=False)
+
+        return cls(arrays, universe.index, universe.columns, _metadata(strategy))
+
+    def history(self) -> pd.DataFrame:
+        """
+        Return `pandas.DataFrame` of trade history.
+
+        Returns
+        -------
+        history : pandas.DataFrame
+            Trade History.
+        """
+        labels = self.index.astype(object).values
+
+        data = {}
+        for column in _columns:
+            array = self.arrays[column]
+            if column == "asset":
+                array = self.assets.values[array]
+            if column in ("entry", "close", "exit"):
+                # Restore labels of bars
+                array = np.where(array >= 0, labels[array], None)
+            if column in ("take", "stop"):
+                array = np.where(np.isnan(array), None, array.astype(object))
+            data[column] = array
+        return pd.DataFrame(data, copy=False)
+
+    def score(self, metric_name) -> float:
+        """
+        Returns the value of a metric of the result.
+
+        Parameters
+        ----------
+        - metric_name : str
+            Metric to evaluate.
+
+        Returns
+        -------
+        metric_value : float
+            Metric.
+        """
+        pnls = np.bincount(self.arrays["trade_id"], weights=self.arrays["pnl"])
+        wealth = np.asarray(self.arrays["wealth"])
+        return batch.metric(metric_name, pnls, wealth).item()
+
+    def wealth(self) -> pd.Series:
+        return pd.Series(self.arrays["wealth"], index=self.index, copy=False)
+
+    def drawdown(self) -> pd.Series:
+        wealth = self.arrays["wealth"]
+        return pd.Series(wealth - np.maximum.accumulate(wealth), index=self.index)
+
+    def net_exposure(self) -> pd.Series:
+        return pd.Series(self.arrays["net_exposure"], index=self.index, copy=False)
+
+    def abs_exposure(self) -> pd.Series:
+        return pd.Series(self.arrays["abs_exposure"], index=self.index, copy=False)
+
+    def __repr__(self):
+        return f"Result({self.metadata.get('strategy')})"
+
+
+def save_result(strategy, path):
+    """
+    Save the result of a backtesting in a directory.
+
+    Each column of trade history, wealth and exposure is saved as `.npy`
+    so that it can be loaded by memory mapping,
+    and metadata of the run is saved as `metadata.json`.
+
+    Parameters
+    ----------
+    - strategy : Strategy
+        Strategy that has been run.
+    - path : str or path-like
+        Directory to save the result. It is created if it does not exist.
+
+    Labels of index and columns of universe are saved without pickle,
+    so they should be numbers, datetimes or str (not mixed).
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import epymetheus as ep
+    >>> from epymetheus.benchmarks import DeterminedStrategy
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 1.0, 2.0]})
+    >>> trades = [ep.trade("A", entry=0, exit=1), -ep.trade("B", entry=1)]
+    >>> strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+    >>> path = tempfile.mkdtemp()
+    >>> save_result(strategy, path)
+    >>> result = load_result(path)
+    >>> result.history()
+       trade_id asset  lot entry close  exit  take  stop  pnl
+    0         0     A  1.0     0     1     1  None  None  1.0
+    1         1     B -1.0     1     2  None  None  None -1.0
+    >>> result.wealth()
+    0    0.0
+    1    1.0
+    2    0.0
+    dtype: float64
+    """
+    if not _is_run(strategy):
+        raise NotRunError("Strategy has not been run")
+
+    index = _to_array(strategy.universe.index)
+    write_history(strategy, path)
+
+    arrays = {
+        "wealth": strategy.wealth().values,
+        "net_exposure": strategy.net_exposure().values,
+        "abs_exposure": strategy.abs_exposure().values,
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(path, name + ".npy"), array)
+    np.save(os.path.join(path, "index.npy"), index)
+
+    metadata = _metadata(strategy)
+    metadata["saved_at"] = datetime.now().isoformat()
+    with open(os.path.join(path, "metadata.json"), "w") as f:
+        json.dump(metadata, f, indent=2)
+
+
+def load_result(path, mmap_mode="r") -> Result:
+    """
+    Load the result of a backtesting saved by `save_result`.
+
+    Parameters
+    ----------
+    - path : str or path-like
+        Directory of the result.
+    - mmap_mode : {None, "r", "r+", "c"}, default "r"
+        Mode to memory-map arrays. See `numpy.load`.
+        If "r", arrays are read on demand without being copied.
+
+    Returns
+    -------
+    result : Result
+    """
+    arrays = {
+        name: np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode)
+        for name in _columns + _series
+    }
+    index = pd.Index(np.load(os.path.join(path, "index.npy")))
+    assets = pd.Index(np.load(os.path.join(path, "assets.npy")))
+    with open(os.path.join(path, "metadata.json")) as f:
+        metadata = json.load(f)
+    return Result(arrays, index, assets, metadata)
+
+
+def write_history(strategy, path, chunk_size=100000):
+    """
+    Write trade history of a strategy to a directory by chunks of trades.
+
+    Each column is written as `.npy` allocated on disk in advance
+    and filled chunk by chunk, so that peak memory is bounded by `chunk_size`.
+    Assets are written as codes of `assets.npy` (categorical) and bars
+    (entry, close and exit) as positions in the index of universe.
+    -1 stands for None. Profit-take and stop-loss are NaN if None.
+
+    Parameters
+    ----------
+    - strategy : Strategy
+        Strategy that has been run.
+    - path : str or path-like
+        Directory to write. It is created if it does not exist.
+    - chunk_size : int, default 100000
+        Number of trades in each chunk.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import epymetheus as ep
+    >>> from epymetheus.benchmarks import DeterminedStrategy
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 1.0, 2.0]})
+    >>> trades = [ep.trade("A", entry=0, exit=1), [1, -1] * ep.trade(["A", "B"])]
+    >>> strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+    >>> path = tempfile.mkdtemp()
+    >>> write_history(strategy, path, chunk_size=1)
+    >>> np.load(path + "/asset.npy"), np.load(path + "/assets.npy")
+    (array([0, 0, 1], dtype=int32), array(['A', 'B'], dtype='<U1'))
+    """
+    if not _is_run(strategy):
+        raise NotRunError("Strategy has not been run")
+
+    universe = strategy.universe
+    assets = _to_array(universe.columns)
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, "assets.npy"), assets)
+
+    batch_arrays = strategy._batch_arrays()
+    if batch_arrays is not None:
+        n_trades, n_legs = batch_arrays[0].n_trades, batch_arrays[0].n_legs
+    else:
+        n_trades = len(strategy.trades)
+        n_legs = sum(t.asset.size for t in strategy.trades)
+    out = {
+        name: open_memmap(
+            os.path.join(path, name + ".npy"), "w+", dtype=dtype, shape=(n_legs,)
+        )
+        for name, dtype in _dtypes.items()
+    }
+
+    begin = 0
+    for i in range(0, n_trades, chunk_size):
+        if batch_arrays is not None:
+            j = min(i + chunk_size, n_trades)
+            columns = _history_arrays_chunk(*batch_arrays, universe.values, i, j)
+        else:
+            columns = _history_chunk(strategy.trades[i : i + chunk_size], universe, i)
+        end = begin + columns["trade_id"].size
+        for name, array in columns.items():
+            out[name][begin:end] = array
+        begin = end
+
+    for array in out.values():
+        array.flush()
+
+
+def _history_chunk(trades, universe, offset) -> dict:
+    """
+    Return columns of trade history of trades whose ids begin with `offset`.
+    """
+    n_orders = np.array([t.asset.size for t in trades])
+
+    def repeat(values, dtype=None):
+        return np.repeat(np.array(values, dtype=dtype), n_orders)
+
+    columns = {}
+    columns["trade_id"] = repeat(np.arange(offset, offset + len(trades)))
+    columns["asset"] = universe.columns.get_indexer(
+        np.concatenate([t.asset for t in trades])
+    )
+    columns["lot"] = np.concatenate([t.lot for t in trades])
+    for name in ("entry", "close", "exit"):
+        bars = np.array([getattr(t, name) for t in trades], dtype=object)
+        columns[name] = repeat(universe.index.get_indexer(bars))
+    for name in ("take", "stop"):
+        columns[name] = repeat([getattr(t, name) for t in trades], float)
+    columns["pnl"] = np.concatenate([t.final_pnl(universe) for t in trades])
+
+    return columns
+
+
+def _history_arrays_chunk(arrays, close, prices, begin, end) -> dict:
+    """
+    Return columns of trade history of trades `begin:end` of `TradeArrays`.
+    """
+    legs = slice(arrays.indptr[begin], arrays.indptr[end])
+    n_orders = np.diff(arrays.indptr[begin : end + 1])
+
+    def repeat(values):
+        return np.repeat(values[begin:end], n_orders)
+
+    columns = {}
+    columns["trade_id"] = np.repeat(np.arange(begin, end), n_orders)
+    columns["asset"] = arrays.asset[legs]
+    columns["lot"] = arrays.lot[legs]
+    columns["entry"] = repeat(arrays.entry)
+    columns["close"] = repeat(close)
+    columns["exit"] = repeat(arrays.exit)
+    for name in ("take", "stop"):
+        values = repeat(getattr(arrays, name))
+        columns[name] = np.where(np.isinf(values), np.nan, values)
+
+    p_entry = prices[columns["entry"], columns["asset"]]
+    p_close = prices[columns["close"], columns["asset"]]
+    columns["pnl"] = columns["lot"] * (p_close - p_entry)
+
+    return columns
+
+
+def _is_run(strategy) -> bool:
+    return any(hasattr(strategy, a) for a in ("trades", "trade_arrays", "holdings"))
+
+
+def _n_trades(strategy) -> int:
+    batch_arrays = strategy._batch_arrays()
+    if batch_arrays is not None:
+        return batch_arrays[0].n_trades
+    return len(strategy.trades)
+
+
+def _metadata(strategy) -> dict:
+    return {
+        "strategy": repr(strategy),
+        "params": {k: repr(v) for k, v in strategy.get_params().items()},
+        "n_trades": _n_trades(strategy),
+        "n_bars": len(strategy.universe.index),
+        "assets": [str(a) for a in strategy.universe.columns],
+    }
+
+
+def _to_array(index):
+    # Save labels without pickle
+    array = np.asarray(index)
+    if array.dtype == object:
+        for label in array:
+            if not isinstance(label, str):
+                raise TypeError(f"Label should be str, not {label!r}")
+        array = array.astype(str)
+    return array
@@ -1,4 +1,16 @@
 # flake8: noqa
 
 from epymetheus.stochastic.brownian import generate_brownian
+from epymetheus.stochastic.brownian import generate_correlated_geometric_brownian
 from epymetheus.stochastic.brownian import generate_geometric_brownian
+from epymetheus.stochastic.brownian import iter_brownian
+from epymetheus.stochastic.brownian import iter_correlated_geometric_brownian
+from epymetheus.stochastic.brownian import iter_geometric_brownian
+from epymetheus.stochastic.jump import generate_merton_jump_diffusion
+from epymetheus.stochastic.jump import iter_merton_jump_diffusion
+from epymetheus.stochastic.ornstein_uhlenbeck import generate_ornstein_uhlenbeck
+from epymetheus.stochastic.ornstein_uhlenbeck import iter_ornstein_uhlenbeck
+from epymetheus.stochastic.regime import generate_regime_switching
+from epymetheus.stochastic.regime import iter_regime_switching
+from epymetheus.stochastic.rng import check_rng
+from epymetheus.stochastic.rng import spawn_seeds
@@ -0,0 +1,107 @@
+import numpy as np
+
+# Maximum number of dimensions of a Sobol sequence supported by scipy
+_SOBOL_MAX_DIMS = 21201
+
+
+def fill_standard_normal(a, rng=None, method="pseudo"):
+    """
+    Fill an array with standard normal random numbers in place.
+
+    Parameters
+    ----------
+    - a : numpy.array, shape (n_steps, n_paths)
+    - rng : numpy.random.Generator, optional
+        If None, the global state of `np.random` is used.
+    - method : {"pseudo", "antithetic", "sobol"}, default "pseudo"
+        - "pseudo" : Pseudo-random numbers.
+        - "antithetic" : Antithetic variates.
+          The latter half of paths are the negatives of the former half.
+        - "sobol" : Scrambled Sobol sequence with paths as points and
+          time steps as dimensions. It requires scipy.
+          Time steps beyond 21201, the maximum dimensionality supported
+          by scipy, are drawn from independently scrambled sequences.
+
+    Examples
+    --------
+    >>> a = np.empty((2, 4))
+    >>> fill_standard_normal(a, np.random.default_rng(42), method="antithetic")
+    >>> a
+    array([[ 0.30471708, -1.03998411, -0.30471708,  1.03998411],
+           [ 0.7504512 ,  0.94056472, -0.7504512 , -0.94056472]])
+    """
+    if method == "pseudo":
+        if rng is None:
+            a[...] = np.random.randn(*a.shape)
+        elif a.flags.c_contiguous and a.dtype in (np.float32, np.float64):
+            rng.standard_normal(out=a, dtype=a.dtype)
+        else:
+            a[...] = rng.standard_normal(a.shape)
+    elif method == "antithetic":
+        half = a.shape[-1] // 2
+        fill_standard_normal(a[..., :half], rng=rng)
+        np.negative(a[..., :half], out=a[..., half : 2 * half])
+        if a.shape[-1] % 2 == 1:
+            fill_standard_normal(a[..., -1:], rng=rng)
+    elif method == "sobol":
+        if a.size > 0:
+            a[...] = _sobol_standard_normal(a.shape, rng=rng)
+    else:
+        raise ValueError(f"Invalid method: {method}")
+
+
+def _sobol_standard_normal(shape, rng=None):
+    """
+    Return standard normal random numbers from a scrambled Sobol sequence.
+    The first axis is dimensions and the second axis is points.
+
+    Dimensions are drawn by blocks of at most `_SOBOL_MAX_DIMS`,
+    each of which is an independently scrambled sequence.
+    """
+    try:
+        from scipy.special import ndtri
+        from scipy.stats import qmc
+    except ImportError as e:
+        raise ImportError("method='sobol' requires scipy>=1.7") from e
+
+    n_dims, n_points = shape
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(2 ** 31))
+    out = np.empty(shape)
+    for begin in range(0, n_dims, _SOBOL_MAX_DIMS):
+        end = min(begin + _SOBOL_MAX_DIMS, n_dims)
+        sobol = qmc.Sobol(d=end - begin, scramble=True, seed=rng)
+        out[begin:end] = sobol.random(n_points).T
+    out = np.clip(out, np.finfo(float).tiny, 1 - np.finfo(float).epsneg)
+
+    return ndtri(out)
+
+
+def iter_chunk_views(n_steps, n_paths, dtype, chunk_size, out=None):
+    """
+    Yield `(begin, end, chunk)` where `chunk` is an array for time steps
+    `begin:end`, which is a view of `out` if given.
+
+    Examples
+    --------
+    >>> for begin, end, chunk in iter_chunk_views(5, 2, float, 2):
+    ...     print(begin, end, chunk.shape)
+    0 2 (2, 2)
+    2 4 (2, 2)
+    4 5 (1, 2)
+    """
+    for begin in range(0, n_steps, chunk_size):
+        end = min(begin + chunk_size, n_steps)
+        if out is None:
+            yield begin, end, np.empty((end - begin, n_paths), dtype=dtype)
+        else:
+            yield begin, end, out[begin:end]
+
+
+def consume(chunks, out):
+    """
+    Exhaust chunks written into `out` and return `out`.
+    """
+    for _ in chunks:
+        pass
+    return out
@@ -1,10 +1,192 @@
 import numpy as np
 
+from ._utils import consume
+from ._utils import fill_standard_normal
+from ._utils import iter_chunk_views
+from .rng import check_rng
+
+
+def iter_brownian(
+    n_steps,
+    n_paths,
+    volatility,
+    init_value=0.0,
+    dt=1.0,
+    drift=0.0,
+    rng=None,
+    dtype=np.float64,
+    chunk_size=1000,
+    out=None,
+    method="pseudo",
+):
+    """
+    Yield chunks of Brownian motions along the time axis.
+
+    The cumulative state is carried forward from one chunk to the next so that
+    the concatenation of chunks is a Brownian motion with `n_steps` steps.
+    Only a single chunk is kept in memory at a time.
+
+    Parameters
+    ----------
+    - n_steps : int
+        Number of time steps.
+    - n_paths : int
+        Number of paths.
+    - volatility : float
+    - init_value : float, default 0.0
+    - dt : float, default 1.0
+    - drift : float, default 0.0
+    - rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - dtype : data-type, default numpy.float64
+        Data type of paths, e.g. `np.float32`.
+    - chunk_size : int, default 1000
+        Number of time steps in each chunk.
+    - out : numpy.array, shape (n_steps, n_paths), optional
+        Array (e.g. `np.memmap`) to write paths in place.
+        If given, chunks are views of it.
+    - method : {"pseudo", "antithetic", "sobol"}, default "pseudo"
+        Method to draw normal random numbers.
+        - "pseudo" : Pseudo-random numbers.
+        - "antithetic" : Antithetic variates. The latter half of paths are
+          driven by the negatives of the normal random numbers of the former half.
+        - "sobol" : Scrambled Sobol sequence with paths as points.
+          The number of paths should be a power of 2.
+          Each chunk is an independently scrambled sequence, and so is each
+          block of 21201 time steps, the maximum dimensionality supported
+          by scipy. It requires scipy.
+
+    Yields
+    ------
+    chunk : numpy.array, shape (chunk_size, n_paths)
+        The last chunk may be shorter.
+
+    Examples
+    --------
+    >>> rng = np.random.default_rng(42)
+    >>> for chunk in iter_brownian(5, 2, 0.01, rng=rng, chunk_size=2):
+    ...     print(chunk)
+    [[ 0.          0.        ]
+     [ 0.00304717 -0.01039984]]
+    [[ 0.01055168 -0.00099419]
+     [-0.00895867 -0.01401599]]
+    [[-0.00768027 -0.01717841]]
+    """
+    rng = check_rng(rng)
+    dtype = np.dtype(dtype) if out is None else out.dtype
+    scale = volatility * np.sqrt(dt)
+    last = np.zeros(n_paths, dtype=dtype)
+
+    for begin, end, chunk in iter_chunk_views(
+        n_steps, n_paths, dtype, chunk_size, out=out
+    ):
+        if begin == 0:
+            chunk[0] = 0
+            fill_standard_normal(chunk[1:], rng=rng, method=method)
+        else:
+            fill_standard_normal(chunk, rng=rng, method=method)
+
+        np.cumsum(chunk, axis=0, out=chunk)
+        chunk *= scale
+        chunk += last
+        last = chunk[-1].copy()
+        chunk += (init_value + drift * np.arange(begin, end)).reshape(-1, 1)
+
+        yield chunk
+
+
+def iter_geometric_brownian(
+    n_steps,
+    n_paths,
+    volatility,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    rng=None,
+    dtype=np.float64,
+    chunk_size=1000,
+    out=None,
+    method="pseudo",
+):
+    """
+    Yield chunks of geometric Brownian motions along the time axis.
+
+    See `iter_brownian` for parameters.
+
+    Examples
+    --------
+    >>> rng = np.random.default_rng(42)
+    >>> for chunk in iter_geometric_brownian(5, 2, 0.01, rng=rng, chunk_size=2):
+    ...     print(chunk)
+    [[1.         1.        ]
+     [1.00300167 0.98960457]]
+    [[1.01050649 0.9989064 ]
+     [0.99093269 0.98593388]]
+    [[0.9921507  0.98277172]]
+    """
+    chunks = iter_brownian(
+        n_steps=n_steps,
+        n_paths=n_paths,
+        volatility=volatility,
+        init_value=0.0,
+        dt=dt,
+        drift=drift - (volatility ** 2 / 2),
+        rng=rng,
+        dtype=dtype,
+        chunk_size=chunk_size,
+        out=out,
+        method=method,
+    )
+    for chunk in chunks:
+        np.exp(chunk, out=chunk)
+        chunk *= init_value
+        yield chunk
+
 
 def generate_brownian(
-    n_steps, n_paths, volatility, init_value=0.0, dt=1.0, drift=0.0
+    n_steps,
+    n_paths,
+    volatility,
+    init_value=0.0,
+    dt=1.0,
+    drift=0.0,
+    rng=None,
+    dtype=np.float64,
+    out=None,
+    chunk_size=None,
+    method="pseudo",
 ) -> np.array:
     """
+    Return Brownian motions.
+
+    Parameters
+    ----------
+    - n_steps : int
+        Number of time steps.
+    - n_paths : int
+        Number of paths.
+    - volatility : float
+    - init_value : float, default 0.0
+    - dt : float, default 1.0
+    - drift : float, default 0.0
+    - rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - dtype : data-type, default numpy.float64
+        Data type of paths, e.g. `np.float32`.
+    - out : numpy.array, shape (n_steps, n_paths), optional
+        Array (e.g. `np.memmap`) to write paths in place.
+    - chunk_size : int, optional
+        If given, paths are generated by chunks of this number of time steps,
+        which bounds the size of temporary arrays.
+    - method : {"pseudo", "antithetic", "sobol"}, default "pseudo"
+        Method to draw normal random numbers. See `iter_brownian`.
+
+    Returns
+    -------
+    paths : numpy.array, shape (n_steps, n_paths)
+
     Examples
     --------
     >>> np.random.seed(42)
@@ -19,20 +201,49 @@ def generate_brownian(
            [ 0.02913168, -0.04406816, -0.00466674],
            [ 0.02687391, -0.04339288, -0.01891422],
            [ 0.02143009, -0.04228365, -0.03042416]])
-    """
-    randn = np.random.randn(n_steps - 1, n_paths)
-    zeros = np.zeros_like(randn[:1])
-    drift = (drift * np.arange(n_steps)).reshape(-1, 1)
 
-    w = np.concatenate((zeros, randn), 0).cumsum(0)
+    >>> rng = np.random.default_rng(42)
+    >>> generate_brownian(3, 2, 0.01, rng=rng, dtype=np.float32)
+    array([[ 0.        ,  0.        ],
+           [ 0.00141907, -0.01668508],
+           [-0.01190201, -0.01085954]], dtype=float32)
+    """
+    if out is None:
+        out = np.empty((n_steps, n_paths), dtype=dtype)
 
-    return init_value + drift + volatility * np.sqrt(dt) * w
+    chunks = iter_brownian(
+        n_steps=n_steps,
+        n_paths=n_paths,
+        volatility=volatility,
+        init_value=init_value,
+        dt=dt,
+        drift=drift,
+        rng=rng,
+        chunk_size=chunk_size or max(n_steps, 1),
+        out=out,
+        method=method,
+    )
+    return consume(chunks, out)
 
 
 def generate_geometric_brownian(
-    n_steps, n_paths, volatility, init_value=1.0, dt=1.0, drift=0.0
+    n_steps,
+    n_paths,
+    volatility,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    rng=None,
+    dtype=np.float64,
+    out=None,
+    chunk_size=None,
+    method="pseudo",
 ) -> np.array:
     """
+    Return geometric Brownian motions.
+
+    See `generate_brownian` for parameters.
+
     Examples
     --------
     >>> np.random.seed(42)
@@ -47,14 +258,192 @@ def generate_geometric_brownian(
            [1.02919987, 0.95655388, 0.99499582],
            [1.02682746, 0.95715219, 0.9808711 ],
            [1.02120171, 0.95816656, 0.96959758]])
+
+    Paths can be written into a memory-mapped file:
+
+    >>> import tempfile
+    >>> from numpy.lib.format import open_memmap
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     out = open_memmap(f"{tmpdir}/paths.npy", "w+", np.float32, (1000, 100))
+    ...     paths = generate_geometric_brownian(
+    ...         1000, 100, 0.01, rng=np.random.default_rng(42), out=out, chunk_size=100
+    ...     )
+    ...     paths.shape, paths.dtype
+    ((1000, 100), dtype('float32'))
     """
-    w = generate_brownian(
+    if out is None:
+        out = np.empty((n_steps, n_paths), dtype=dtype)
+
+    chunks = iter_geometric_brownian(
         n_steps=n_steps,
         n_paths=n_paths,
         volatility=volatility,
-        init_value=0.0,
+        init_value=init_value,
         dt=dt,
-        drift=drift - (volatility ** 2 / 2),
+        drift=drift,
+        rng=rng,
+        chunk_size=chunk_size or max(n_steps, 1),
+        out=out,
+        method=method,
     )
+    return consume(chunks, out)
+
+
+def _matmul_lower(a, lower, out, block_size):
+    """
+    Compute `a @ lower.T` blockwise for a lower triangular matrix `lower`.
+
+    Zero blocks of `lower` in its upper triangle are skipped.
+    """
+    n = lower.shape[0]
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+        out[:, j0:j1] = a[:, :j1] @ lower[j0:j1, :j1].T
+    return out
+
+
+def iter_correlated_geometric_brownian(
+    n_steps,
+    cov=None,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    cholesky=None,
+    rng=None,
+    dtype=np.float64,
+    chunk_size=1000,
+    block_size=256,
+    out=None,
+):
+    """
+    Yield chunks of correlated geometric Brownian motions along the time axis.
+
+    Log-returns of assets per unit time have the covariance matrix `cov`.
+    Cholesky factor of `cov` is applied to normal random numbers blockwise
+    so that only the lower triangle contributes to computation.
 
-    return init_value * np.exp(w)
+    Parameters
+    ----------
+    - n_steps : int
+        Number of time steps.
+    - cov : numpy.array, shape (n_assets, n_assets), optional
+        Covariance matrix of log-returns per unit time.
+    - init_value : float or numpy.array, default 1.0
+    - dt : float, default 1.0
+    - drift : float or numpy.array, default 0.0
+    - cholesky : numpy.array, shape (n_assets, n_assets), optional
+        Lower triangular Cholesky factor of `cov`.
+        If given, `cov` is ignored.
+    - rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - dtype : data-type, default numpy.float64
+    - chunk_size : int, default 1000
+        Number of time steps in each chunk.
+    - block_size : int, default 256
+        Number of assets in each block to apply Cholesky factor.
+    - out : numpy.array, shape (n_steps, n_assets), optional
+        Array (e.g. `np.memmap`) to write paths in place.
+
+    Yields
+    ------
+    chunk : numpy.array, shape (chunk_size, n_assets)
+
+    Examples
+    --------
+    >>> cov = [[1e-4, 9e-5], [9e-5, 1e-4]]
+    >>> for chunk in iter_correlated_geometric_brownian(
+    ...     4, cov, rng=42, chunk_size=2
+    ... ):
+    ...     print(chunk)
+    [[1.         1.        ]
+     [1.00300167 0.99816096]]
+    [[1.01050649 1.00900344]
+     [0.99093269 0.98577985]]
+    """
+    rng = check_rng(rng)
+    if cholesky is None:
+        cholesky = np.linalg.cholesky(np.asarray(cov, dtype=float))
+    cholesky = np.asarray(cholesky)
+
+    n_assets = cholesky.shape[0]
+    dtype = np.dtype(dtype) if out is None else out.dtype
+    cholesky = cholesky.astype(dtype)
+    variance = (cholesky.astype(float) ** 2).sum(axis=1)
+    mean = (np.asarray(drift) - variance / 2) * dt
+    scale = np.sqrt(dt)
+    last = np.zeros(n_assets, dtype=dtype)
+
+    for begin, end, chunk in iter_chunk_views(
+        n_steps, n_assets, dtype, chunk_size, out=out
+    ):
+        randn = np.empty_like(chunk)
+        if begin == 0:
+            randn[0] = 0
+            fill_standard_normal(randn[1:], rng=rng)
+        else:
+            fill_standard_normal(randn, rng=rng)
+        _matmul_lower(randn, cholesky, chunk, block_size)
+        del randn
+
+        chunk *= scale
+        chunk += mean
+        if begin == 0:
+            chunk[0] = 0
+
+        np.cumsum(chunk, axis=0, out=chunk)
+        chunk += last
+        last = chunk[-1].copy()
+        np.exp(chunk, out=chunk)
+        chunk *= init_value
+
+        yield chunk
+
+
+def generate_correlated_geometric_brownian(
+    n_steps,
+    cov=None,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    cholesky=None,
+    rng=None,
+    dtype=np.float64,
+    out=None,
+    chunk_size=None,
+    block_size=256,
+) -> np.array:
+    """
+    Return correlated geometric Brownian motions.
+
+    See `iter_correlated_geometric_brownian` for parameters.
+
+    Returns
+    -------
+    paths : numpy.array, shape (n_steps, n_assets)
+
+    Examples
+    --------
+    >>> cov = [[1e-4, 9e-5], [9e-5, 1e-4]]
+    >>> paths = generate_correlated_geometric_brownian(10000, cov, rng=42)
+    >>> np.corrcoef(np.diff(np.log(paths), axis=0).T).round(2)
+    array([[1. , 0.9],
+           [0.9, 1. ]])
+    """
+    n_assets = np.asarray(cov if cholesky is None else cholesky).shape[0]
+    if out is None:
+        out = np.empty((n_steps, n_assets), dtype=dtype)
+
+    chunks = iter_correlated_geometric_brownian(
+        n_steps=n_steps,
+        cov=cov,
+        init_value=init_value,
+        dt=dt,
+        drift=drift,
+        cholesky=cholesky,
+        rng=rng,
+        chunk_size=chunk_size or max(n_steps, 1),
+        block_size=block_size,
+        out=out,
+    )
+    return consume(chunks, out)
@@ -0,0 +1,158 @@
+import numpy as np
+
+from ._utils import consume
+from ._utils import fill_standard_normal
+from ._utils import iter_chunk_views
+from .rng import split_rng
+
+
+def iter_merton_jump_diffusion(
+    n_steps,
+    n_paths,
+    volatility,
+    jump_intensity,
+    jump_mean=0.0,
+    jump_std=0.0,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    rng=None,
+    dtype=np.float64,
+    chunk_size=1000,
+    out=None,
+):
+    """
+    Yield chunks of Merton jump-diffusion processes along the time axis.
+
+    Jumps arrive as a Poisson process with intensity `jump_intensity` and
+    log-jump sizes follow normal distribution with mean `jump_mean` and
+    standard deviation `jump_std`.
+    The drift is compensated so that `drift` is the expected rate of return.
+
+    Parameters
+    ----------
+    - n_steps : int
+        Number of time steps.
+    - n_paths : int
+        Number of paths.
+    - volatility : float
+        Volatility of the diffusion part.
+    - jump_intensity : float
+        Expected number of jumps per unit time.
+    - jump_mean : float, default 0.0
+        Mean of log-jump sizes.
+    - jump_std : float, default 0.0
+        Standard deviation of log-jump sizes.
+    - init_value : float, default 1.0
+    - dt : float, default 1.0
+    - drift : float, default 0.0
+    - rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - dtype : data-type, default numpy.float64
+    - chunk_size : int, default 1000
+        Number of time steps in each chunk.
+    - out : numpy.array, shape (n_steps, n_paths), optional
+        Array (e.g. `np.memmap`) to write paths in place.
+
+    Yields
+    ------
+    chunk : numpy.array, shape (chunk_size, n_paths)
+
+    Examples
+    --------
+    >>> for chunk in iter_merton_jump_diffusion(
+    ...     4, 2, 0.01, 0.1, jump_mean=-0.1, rng=42, chunk_size=2
+    ... ):
+    ...     print(chunk)
+    [[1.         1.        ]
+     [1.00306421 1.00360675]]
+    [[1.02853203 1.01269618]
+     [1.05425162 0.8305051 ]]
+    """
+    # Diffusions, numbers of jumps and jump sizes are drawn from separate streams
+    rng, rng_count, rng_size = split_rng(rng, 3)
+    dtype = np.dtype(dtype) if out is None else out.dtype
+
+    compensator = jump_intensity * (np.exp(jump_mean + jump_std ** 2 / 2) - 1)
+    mean = (drift - volatility ** 2 / 2 - compensator) * dt
+    scale = volatility * np.sqrt(dt)
+    last = np.zeros(n_paths, dtype=dtype)
+
+    for begin, end, chunk in iter_chunk_views(
+        n_steps, n_paths, dtype, chunk_size, out=out
+    ):
+        increment = chunk[1:] if begin == 0 else chunk
+        fill_standard_normal(increment, rng=rng)
+        increment *= scale
+        increment += mean
+
+        # Sum of n log-jumps follows N(n * jump_mean, n * jump_std ** 2)
+        n_jumps = rng_count.poisson(jump_intensity * dt, size=increment.shape)
+        i, j = np.nonzero(n_jumps)
+        n = n_jumps[i, j]
+        increment[i, j] += n * jump_mean + np.sqrt(n) * jump_std * (
+            rng_size.standard_normal(size=n.size)
+        )
+
+        if begin == 0:
+            chunk[0] = 0
+        np.cumsum(chunk, axis=0, out=chunk)
+        chunk += last
+        last = chunk[-1].copy()
+        np.exp(chunk, out=chunk)
+        chunk *= init_value
+
+        yield chunk
+
+
+def generate_merton_jump_diffusion(
+    n_steps,
+    n_paths,
+    volatility,
+    jump_intensity,
+    jump_mean=0.0,
+    jump_std=0.0,
+    init_value=1.0,
+    dt=1.0,
+    drift=0.0,
+    rng=None,
+    dtype=np.float64,
+    out=None,
+    chunk_size=None,
+) -> np.array:
+    """
+    Return Merton jump-diffusion processes.
+
+    See `iter_merton_jump_diffusion` for parameters.
+
+    Returns
+    -------
+    paths : numpy.array, shape (n_steps, n_paths)
+
+    Examples
+    --------
+    >>> paths = generate_merton_jump_diffusion(
+    ...     1000, 2, 0.0, 0.01, jump_mean=-0.1, rng=42
+    ... )
+    >>> (np.diff(np.log(paths), axis=0) < -0.05).sum(axis=0)
+    array([11,  7])
+    """
+    if out is None:
+        out = np.empty((n_steps, n_paths), dtype=dtype)
+
+    chunks = iter_merton_jump_diffusion(
+        n_steps=n_steps,
+        n_paths=n_paths,
+        volatility=volatility,
+        jump_intensity=jump_intensity,
+        jump_mean=jump_mean,
+        jump_std=jump_std,
+        init_value=init_value,
+        dt=dt,
+        drift=drift,
+        rng=rng,
+        chunk_size=chunk_size or max(n_steps, 1),
+        out=out,
+    )
+    return consume(chunks, out)
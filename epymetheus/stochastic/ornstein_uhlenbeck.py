@@ -0,0 +1,133 @@
+import numpy as np
+
+from ._utils import consume
+from ._utils import fill_standard_normal
+from ._utils import iter_chunk_views
+from .rng import check_rng
+
+
+def iter_ornstein_uhlenbeck(
+    n_steps,
+    n_paths,
+    volatility,
+    mean_reversion,
+    mean=0.0,
+    init_value=0.0,
+    dt=1.0,
+    rng=None,
+    dtype=np.float64,
+    chunk_size=1000,
+    out=None,
+):
+    """
+    Yield chunks of Ornstein-Uhlenbeck processes along the time axis.
+
+    The process follows `dX = mean_reversion * (mean - X) dt + volatility dW`
+    and is sampled by its exact discretization.
+
+    Parameters
+    ----------
+    - n_steps : int
+        Number of time steps.
+    - n_paths : int
+        Number of paths.
+    - volatility : float
+    - mean_reversion : float >= 0
+        Speed of mean reversion.
+    - mean : float or numpy.array, default 0.0
+        Long-term mean.
+    - init_value : float or numpy.array, default 0.0
+    - dt : float, default 1.0
+    - rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - dtype : data-type, default numpy.float64
+    - chunk_size : int, default 1000
+        Number of time steps in each chunk.
+    - out : numpy.array, shape (n_steps, n_paths), optional
+        Array (e.g. `np.memmap`) to write paths in place.
+
+    Yields
+    ------
+    chunk : numpy.array, shape (chunk_size, n_paths)
+
+    Examples
+    --------
+    >>> for chunk in iter_ornstein_uhlenbeck(
+    ...     4, 2, 0.1, 0.5, init_value=1.0, rng=42, chunk_size=2
+    ... ):
+    ...     print(chunk)
+    [[1.         1.        ]
+     [0.66619604 0.68131121]]
+    [[0.2489493  0.30970504]
+     [0.16115946 0.16270242]]
+    """
+    rng = check_rng(rng)
+    dtype = np.dtype(dtype) if out is None else out.dtype
+
+    decay = np.exp(-mean_reversion * dt)
+    if mean_reversion > 0:
+        scale = volatility * np.sqrt((1 - decay ** 2) / (2 * mean_reversion))
+    else:
+        scale = volatility * np.sqrt(dt)
+    value = np.broadcast_to(np.asarray(init_value, dtype=dtype), (n_paths,))
+
+    for begin, end, chunk in iter_chunk_views(
+        n_steps, n_paths, dtype, chunk_size, out=out
+    ):
+        fill_standard_normal(chunk, rng=rng)
+        chunk *= scale
+
+        # AR(1) recursion is sequential in time but vectorized over paths
+        for i in range(chunk.shape[0]):
+            if begin + i > 0:
+                value = mean + decay * (value - mean) + chunk[i]
+            chunk[i] = value
+
+        yield chunk
+
+
+def generate_ornstein_uhlenbeck(
+    n_steps,
+    n_paths,
+    volatility,
+    mean_reversion,
+    mean=0.0,
+    init_value=0.0,
+    dt=1.0,
+    rng=None,
+    dtype=np.float64,
+    out=None,
+    chunk_size=None,
+) -> np.array:
+    """
+    Return Ornstein-Uhlenbeck processes.
+
+    See `iter_ornstein_uhlenbeck` for parameters.
+
+    Returns
+    -------
+    paths : numpy.array, shape (n_steps, n_paths)
+
+    Examples
+    --------
+    >>> paths = generate_ornstein_uhlenbeck(10000, 2, 0.1, 0.5, mean=1.0, rng=42)
+    >>> paths.mean(axis=0).round(1)
+    array([1., 1.])
+    """
+    if out is None:
+        out = np.empty((n_steps, n_paths), dtype=dtype)
+
+    chunks = iter_ornstein_uhlenbeck(
+        n_steps=n_steps,
+        n_paths=n_paths,
+        volatility=volatility,
+        mean_reversion=mean_reversion,
+        mean=mean,
+        init_value=init_value,
+        dt=dt,
+        rng=rng,
+        chunk_size=chunk_size or max(n_steps, 1),
+        out=out,
+    )
+    return consume(chunks, out)
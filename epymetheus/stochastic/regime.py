@@ -0,0 +1,168 @@
+import numpy as np
+
+from ._utils import consume
+from ._utils import fill_standard_normal
+from ._utils import iter_chunk_views
+from .rng import split_rng
+
+
+def iter_regime_switching(
+    n_steps,
+    n_paths,
+    volatility,
+    drift,
+    transition,
+    init_value=1.0,
+    dt=1.0,
+    init_regime=0,
+    common=False,
+    rng=None,
+    dtype=np.float64,
+    chunk_size=1000,
+    out=None,
+):
+    """
+    Yield chunks of regime-switching geometric Brownian motions
+    along the time axis.
+
+    Regimes follow a Markov chain with the transition matrix `transition`
+    and volatility and drift depend on the current regime.
+
+    Parameters
+    ----------
+    - n_steps : int
+        Number of time steps.
+    - n_paths : int
+        Number of paths.
+    - volatility : array-like, shape (n_regimes,)
+        Volatility in each regime.
+    - drift : array-like, shape (n_regimes,)
+        Drift in each regime.
+    - transition : array-like, shape (n_regimes, n_regimes)
+        Transition probabilities per time step.
+        `transition[i, j]` is the probability to switch from regime i to j.
+    - init_value : float, default 1.0
+    - dt : float, default 1.0
+    - init_regime : int, default 0
+        Initial regime.
+    - common : bool, default False
+        If True, all paths share the same regime (e.g. market regime).
+        Otherwise, each path switches its own regime.
+    - rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        Seed or random number generator.
+        If None, the global state of `np.random` is used.
+    - dtype : data-type, default numpy.float64
+    - chunk_size : int, default 1000
+        Number of time steps in each chunk.
+    - out : numpy.array, shape (n_steps, n_paths), optional
+        Array (e.g. `np.memmap`) to write paths in place.
+
+    Yields
+    ------
+    chunk : numpy.array, shape (chunk_size, n_paths)
+
+    Examples
+    --------
+    >>> transition = [[0.9, 0.1], [0.2, 0.8]]
+    >>> for chunk in iter_regime_switching(
+    ...     4, 2, [0.01, 0.05], [0.0, -0.01], transition, rng=42, chunk_size=2
+    ... ):
+    ...     print(chunk)
+    [[1.         1.        ]
+     [0.99356406 0.99410147]]
+    [[1.00914159 0.99360428]
+     [1.02457959 0.94489175]]
+    """
+    # Diffusions and regimes are drawn from separate streams
+    rng, rng_regime = split_rng(rng, 2)
+    dtype = np.dtype(dtype) if out is None else out.dtype
+
+    volatility = np.asarray(volatility, dtype=float)
+    drift = np.asarray(drift, dtype=float)
+    cumulative = np.cumsum(np.asarray(transition, dtype=float), axis=1)
+    n_regimes = cumulative.shape[0]
+
+    mean = (drift - volatility ** 2 / 2) * dt
+    scale = volatility * np.sqrt(dt)
+    regime = np.full(1 if common else n_paths, init_regime, dtype=int)
+    last = np.zeros(n_paths, dtype=dtype)
+
+    for begin, end, chunk in iter_chunk_views(
+        n_steps, n_paths, dtype, chunk_size, out=out
+    ):
+        increment = chunk[1:] if begin == 0 else chunk
+        fill_standard_normal(increment, rng=rng)
+
+        # Markov chain is sequential in time but vectorized over paths
+        regimes = np.empty((increment.shape[0], regime.size), dtype=int)
+        uniform = rng_regime.random(regimes.shape)
+        for i in range(regimes.shape[0]):
+            regime = (uniform[i].reshape(-1, 1) >= cumulative[regime]).sum(axis=1)
+            regime = np.minimum(regime, n_regimes - 1)
+            regimes[i] = regime
+
+        increment *= scale[regimes]
+        increment += mean[regimes]
+
+        if begin == 0:
+            chunk[0] = 0
+        np.cumsum(chunk, axis=0, out=chunk)
+        chunk += last
+        last = chunk[-1].copy()
+        np.exp(chunk, out=chunk)
+        chunk *= init_value
+
+        yield chunk
+
+
+def generate_regime_switching(
+    n_steps,
+    n_paths,
+    volatility,
+    drift,
+    transition,
+    init_value=1.0,
+    dt=1.0,
+    init_regime=0,
+    common=False,
+    rng=None,
+    dtype=np.float64,
+    out=None,
+    chunk_size=None,
+) -> np.array:
+    """
+    Return regime-switching geometric Brownian motions.
+
+    See `iter_regime_switching` for parameters.
+
+    Returns
+    -------
+    paths : numpy.array, shape (n_steps, n_paths)
+
+    Examples
+    --------
+    >>> transition = [[0.99, 0.01], [0.05, 0.95]]
+    >>> paths = generate_regime_switching(
+    ...     1000, 3, [0.01, 0.05], [0.0, 0.0], transition, common=True, rng=42
+    ... )
+    >>> paths.shape
+    (1000, 3)
+    """
+    if out is None:
+        out = np.empty((n_steps, n_paths), dtype=dtype)
+
+    chunks = iter_regime_switching(
+        n_steps=n_steps,
+        n_paths=n_paths,
+        volatility=volatility,
+        drift=drift,
+        transition=transition,
+        init_value=init_value,
+        dt=dt,
+        init_regime=init_regime,
+        common=common,
+        rng=rng,
+        chunk_size=chunk_size or max(n_steps, 1),
+        out=out,
+    )
+    return consume(chunks, out)
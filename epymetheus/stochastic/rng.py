@@ -0,0 +1,87 @@
+import numpy as np
+
+
+def check_rng(rng=None):
+    """
+    Return `numpy.random.Generator` from a seed.
+
+    Parameters
+    ----------
+    - rng : None, int, numpy.random.SeedSequence or numpy.random.Generator
+        If None, return None, which stands for the global state of `np.random`.
+
+    Returns
+    -------
+    rng : numpy.random.Generator or None
+
+    Examples
+    --------
+    >>> check_rng(None) is None
+    True
+    >>> isinstance(check_rng(42), np.random.Generator)
+    True
+    >>> rng = np.random.default_rng(42)
+    >>> check_rng(rng) is rng
+    True
+    """
+    return None if rng is None else np.random.default_rng(rng)
+
+
+def spawn_seeds(seed, n) -> list:
+    """
+    Return independent seeds spawned from a seed.
+
+    Random streams from the spawned seeds are statistically independent and
+    do not depend on how they are distributed over workers.
+
+    Parameters
+    ----------
+    - seed : None, int or numpy.random.SeedSequence
+    - n : int
+        Number of seeds to spawn.
+
+    Returns
+    -------
+    seeds : list of numpy.random.SeedSequence
+
+    Examples
+    --------
+    >>> seeds = spawn_seeds(42, 3)
+    >>> [np.random.default_rng(s).integers(100) for s in seeds]
+    [49, 7, 70]
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
+
+
+def split_rng(rng, n) -> list:
+    """
+    Return independent random number generators derived from `rng`.
+
+    Drawing different kinds of random numbers from separate streams keeps
+    the result independent of how the draws are chunked.
+
+    Parameters
+    ----------
+    - rng : None, int, numpy.random.SeedSequence or numpy.random.Generator
+        If None, the global state of `np.random` is used to derive a seed.
+    - n : int
+        Number of generators.
+
+    Returns
+    -------
+    rngs : list of numpy.random.Generator
+
+    Examples
+    --------
+    >>> rng_0, rng_1 = split_rng(42, 2)
+    >>> rng_0.integers(100), rng_1.integers(100)
+    (59, 58)
+    """
+    rng = check_rng(rng)
+    if rng is None:
+        entropy = np.random.randint(0, 2 ** 31, size=4)
+    else:
+        entropy = rng.integers(0, 2 ** 31, size=4)
+    return [np.random.default_rng(s) for s in spawn_seeds(entropy.tolist(), n)]
@@ -1,14 +1,19 @@
 import abc
+import copy
+import numbers
 from functools import partial
 from time import time
 
 import numpy as np
 import pandas as pd
 
+from .. import batch
 from .. import ts
 from ..exceptions import NoTradeError
 from ..exceptions import NotRunError
 from ..metrics import metric_from_name
+from ..result import Result
+from ..universe import to_frame
 
 
 def create_strategy(f, **params):
@@ -77,10 +82,13 @@ class Strategy(abc.ABC):
         return self
 
     def __call__(self, universe, to_list=True):
+        logic = self.logic
         if hasattr(self, "_f"):
-            setattr(self, "logic", partial(self._f, **self.get_params()))
-        trades = self.logic(universe)
-        trades = list(trades) if to_list else trades
+            logic = partial(self._f, **self.get_params())
+        trades = logic(universe)
+        if to_list and not _is_columnar(trades):
+            if not isinstance(trades, batch.Target):
+                trades = list(trades)
         return trades
 
     def logic(self, universe):
@@ -98,33 +106,118 @@ class Strategy(abc.ABC):
 
         Returns
         ------
-        trades : iterable of trades
+        trades : iterable of trades, pandas.DataFrame, TradeArrays or Target
+            Trades may be given as a table of legs
+            (see `epymetheus.batch.TradeArrays.from_frame`).
+            `epymetheus.batch.Target` gives target positions at each bar instead.
         """
 
-    def run(self, universe, verbose=True):
+    def run(self, universe, verbose=True, dtype=None):
         """
         Run a backtesting of strategy.
 
         Parameters
         ----------
-        - universe : pandas.DataFrame
+        - universe : pandas.DataFrame or MemmapUniverse
             Historical price data to apply this strategy.
             The index represents timestamps and the column is the assets.
+            `MemmapUniverse` is passed to the logic as its `pandas.DataFrame` view.
         - verbose : bool, default True
             Verbose mode.
+        - dtype : data-type, optional
+            If given, prices are cast to this dtype.
+            With `numpy.float32`, prices, wealth and exposure are kept in
+            float32 to halve memory while they are accumulated in float64.
 
         Returns
         -------
         self
+
+        Notes
+        -----
+        If the logic returns trades as `pandas.DataFrame` or `TradeArrays`,
+        they are executed at once without `Trade` objects.
+        The trades are then stored as `self.trade_arrays` and the index positions
+        of their closes as `self.trade_close` instead of `self.trades`.
+
+        If the logic returns `Target`, lots to hold at each bar are stored as
+        `self.holdings` and wealth and exposure are evaluated by matrix operations.
+        Each run of the same non-zero lot of an asset is regarded as a trade
+        to evaluate metrics of trades and history.
+
+        Examples
+        --------
+        >>> from epymetheus.benchmarks import DeterminedStrategy
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+        >>> trades = pd.DataFrame({"asset": ["A", "B"], "lot": [1.0, -1.0]})
+        >>> strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+        >>> strategy.score("final_wealth")
+        4.0
+        """
+        return self.__run(universe, verbose, dtype, batch_trades=False)
+
+    def backtest(self, universe, dtype=None) -> Result:
+        """
+        Run a backtesting and return its result leaving the strategy unchanged.
+
+        Unlike `run`, neither the strategy nor the trades returned by its logic
+        are modified: trades are executed at once as `TradeArrays`.
+        The same strategy can thus be backtested concurrently, e.g. over
+        several universes in a thread pool, as long as its logic itself
+        does not modify shared state.
+
+        Parameters
+        ----------
+        - universe : pandas.DataFrame or MemmapUniverse
+            Historical price data to apply this strategy.
+        - dtype : data-type, optional
+            If given, prices are cast to this dtype.
+
+        Returns
+        -------
+        result : Result
+            Immutable result of the backtesting.
+
+        Examples
+        --------
+        >>> import epymetheus as ep
+        >>> from epymetheus.benchmarks import DeterminedStrategy
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+        >>> strategy = DeterminedStrategy([ep.trade("A"), -ep.trade("B")])
+        >>> result = strategy.backtest(universe)
+        >>> result.score("final_wealth")
+        4.0
+        >>> hasattr(strategy, "trades")
+        False
         """
+        strategy = copy.copy(self)
+        strategy.__run(universe, False, dtype, batch_trades=True)
+        return Result.from_strategy(strategy)
+
+    def __run(self, universe, verbose, dtype, batch_trades):
         _begin_time = time()
 
+        universe = to_frame(universe)
+        if dtype is not None:
+            universe = universe.astype(dtype, copy=False)
         self.universe = universe
+        for attr in ("trades", "trade_arrays", "trade_close", "holdings"):
+            self.__dict__.pop(attr, None)
+
+        returned = self._generate(universe)
+        if batch_trades and not _is_columnar(returned):
+            if not isinstance(returned, batch.Target):
+                # Execute trades at once so that they are left unchanged
+                returned = batch.TradeArrays.from_trades(returned or [], universe)
+        if _is_columnar(returned):
+            return self.__run_arrays(returned, verbose, _begin_time)
+        if isinstance(returned, batch.Target):
+            return self.__run_target(returned, verbose, _begin_time)
 
         # Yield trades
         _begin_time_yield = time()
         trades = []
-        for i, t in enumerate(self(universe, to_list=False) or []):
+        for i, t in enumerate(returned or []):
             if verbose:
                 print(f"\r{i + 1} trades returned: {t} ... ", end="")
             trades.append(t)
@@ -153,6 +246,63 @@ class Strategy(abc.ABC):
 
         return self
 
+    def __run_arrays(self, trades, verbose, _begin_time):
+        universe = self.universe
+
+        arrays = batch.to_trade_arrays(trades, universe)
+        if arrays.n_trades == 0:
+            raise NoTradeError("No trade.")
+        if verbose:
+            print(f"{arrays.n_trades} trades returned. Executing ... ", end="")
+
+        self.trade_arrays = arrays
+        self.trade_close = batch.execute(universe.values, arrays)
+
+        if verbose:
+            _time = time() - _begin_time
+            final_wealth = self.score("final_wealth")
+            print(f"Done. Final wealth: {final_wealth:.2f} (Runtime: {_time:.4f} sec)")
+
+        return self
+
+    def __run_target(self, target, verbose, _begin_time):
+        universe = self.universe
+
+        holdings = target.lots(universe).astype(batch.result_dtype(universe.values))
+        if not holdings.any():
+            raise NoTradeError("No trade.")
+
+        self.holdings = holdings
+
+        if verbose:
+            _time = time() - _begin_time
+            final_wealth = self.score("final_wealth")
+            print(f"Done. Final wealth: {final_wealth:.2f} (Runtime: {_time:.4f} sec)")
+
+        return self
+
+    def _generate(self, universe):
+        """
+        Return trades returned by the logic to run.
+        Override this to keep information on the trades of a run.
+        """
+        return self(universe, to_list=False)
+
+    def __is_run(self) -> bool:
+        return any(hasattr(self, a) for a in ("trades", "trade_arrays", "holdings"))
+
+    def _batch_arrays(self):
+        """
+        Return `TradeArrays` and index positions of closes of trades
+        if they have been executed at once, or None.
+        """
+        if hasattr(self, "holdings"):
+            arrays = batch.TradeArrays.from_holdings(self.holdings)
+            return arrays, arrays.exit
+        if hasattr(self, "trade_arrays"):
+            return self.trade_arrays, self.trade_close
+        return None
+
     def score(self, metric_name) -> float:
         """
         Returns the value of a metric of self.
@@ -167,9 +317,16 @@ class Strategy(abc.ABC):
         metric_value : float
             Metric.
         """
-        if not hasattr(self, "trades"):
+        if not self.__is_run():
             raise NotRunError("Strategy has not been run")
 
+        if hasattr(self, "holdings") or hasattr(self, "trade_arrays"):
+            if metric_name == "max_drawdown":
+                return self.drawdown().min()
+            arrays, close = self._batch_arrays()
+            pnls = batch.trade_pnls(self.universe.values, arrays, close)
+            return batch.metric(metric_name, pnls, None)
+
         return metric_from_name(metric_name)(self.trades, self.universe)
 
     def history(self) -> pd.DataFrame:
@@ -181,9 +338,12 @@ class Strategy(abc.ABC):
         history : pandas.DataFrame
             Trade History.
         """
-        if not hasattr(self, "trades"):
+        if not self.__is_run():
             raise NotRunError("Strategy has not been run")
 
+        if self._batch_arrays() is not None:
+            return self.__history_arrays()
+
         data = {}
 
         n_orders = np.array([t.asset.size for t in self.trades])
@@ -200,6 +360,29 @@ class Strategy(abc.ABC):
 
         return pd.DataFrame(data)
 
+    def __history_arrays(self) -> pd.DataFrame:
+        arrays, close = self._batch_arrays()
+        index = self.universe.index
+        trade_id = arrays.trade_id
+        prices = self.universe.values
+
+        def none_if_inf(values):
+            values = values[trade_id]
+            return np.where(np.isinf(values), None, values.astype(object))
+
+        data = {}
+        data["trade_id"] = trade_id
+        data["asset"] = self.universe.columns.values[arrays.asset]
+        data["lot"] = arrays.lot
+        data["entry"] = index.values[arrays.entry[trade_id]]
+        data["close"] = index.values[close[trade_id]]
+        data["exit"] = index.values[arrays.exit[trade_id]]
+        data["take"] = none_if_inf(arrays.take)
+        data["stop"] = none_if_inf(arrays.stop)
+        data["pnl"] = batch.leg_pnls(prices, arrays, close)
+
+        return pd.DataFrame(data)
+
     def wealth(self) -> pd.Series:
         """
         Return `pandas.Series` of wealth.
@@ -209,12 +392,19 @@ class Strategy(abc.ABC):
         wealth : pandas.Series
             Series of wealth.
         """
-        if not hasattr(self, "trades"):
+        if not self.__is_run():
             raise NotRunError("Strategy has not been run")
 
-        return pd.Series(
-            ts.wealth(self.trades, self.universe), index=self.universe.index
-        )
+        if hasattr(self, "holdings"):
+            wealth = batch.holdings_wealth(self.universe.values, self.holdings)
+        elif hasattr(self, "trade_arrays"):
+            wealth = batch.sparse_wealth(
+                self.universe.values, self.trade_arrays, self.trade_close
+            )
+        else:
+            wealth = ts.wealth(self.trades, self.universe)
+
+        return pd.Series(wealth, index=self.universe.index)
 
     def drawdown(self) -> pd.Series:
         """
@@ -222,29 +412,192 @@ class Strategy(abc.ABC):
         -------
         drawdown : pandas.Series
         """
-        if not hasattr(self, "trades"):
-            raise NotRunError("Strategy has not been run")
+        wealth = self.wealth()
 
-        drawdown = ts.drawdown(self.trades, self.universe)
-
-        return pd.Series(drawdown, index=self.universe.index)
+        return wealth - np.maximum.accumulate(wealth)
 
     def net_exposure(self) -> pd.Series:
-        if not hasattr(self, "trades"):
+        if not self.__is_run():
             raise NotRunError("Strategy has not been run")
 
-        exposure = ts.net_exposure(self.trades, self.universe)
+        if hasattr(self, "holdings"):
+            exposure = batch.holdings_exposure(
+                self.universe.values, self.holdings, net=True
+            )
+        elif hasattr(self, "trade_arrays"):
+            exposure = batch.sparse_exposure(
+                self.universe.values, self.trade_arrays, self.trade_close, net=True
+            )
+        else:
+            exposure = ts.net_exposure(self.trades, self.universe)
 
         return pd.Series(exposure, index=self.universe.index)
 
     def abs_exposure(self) -> pd.Series:
-        if not hasattr(self, "trades"):
+        if not self.__is_run():
             raise NotRunError("Strategy has not been run")
 
-        exposure = ts.abs_exposure(self.trades, self.universe)
+        if hasattr(self, "holdings"):
+            exposure = batch.holdings_exposure(
+                self.universe.values, self.holdings, net=False
+            )
+        elif hasattr(self, "trade_arrays"):
+            exposure = batch.sparse_exposure(
+                self.universe.values, self.trade_arrays, self.trade_close, net=False
+            )
+        else:
+            exposure = ts.abs_exposure(self.trades, self.universe)
 
         return pd.Series(exposure, index=self.universe.index)
 
+    def pnl_by_asset(self, sparse=False, freq=None):
+        """
+        Return profit-loss of each asset at each bar.
+
+        Profit-loss at a bar is earned from the previous bar, so that its sum
+        over assets is the change of wealth and its cumulative sum over bars
+        is the wealth attributed to each asset.
+
+        Parameters
+        ----------
+        - sparse : bool, default False
+            If True, return `pandas.Series` of non-zero values
+            indexed by pairs of bar and asset.
+        - freq : int or str, optional
+            If given, sum values over every `freq` bars or, if the index of
+            universe is `DatetimeIndex`, over periods of offset alias `freq`.
+            Each period is labeled by its last bar.
+
+        Returns
+        -------
+        pnl : pandas.DataFrame or pandas.Series
+
+        Examples
+        --------
+        >>> from epymetheus import trade
+        >>> from epymetheus.benchmarks import DeterminedStrategy
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [4.0, 2.0, 1.0]})
+        >>> trades = [trade("A", exit=1), -trade("B", entry=1)]
+        >>> strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+        >>> strategy.pnl_by_asset()
+             A    B
+        0  0.0  0.0
+        1  1.0  0.0
+        2  0.0  1.0
+        >>> strategy.pnl_by_asset(sparse=True)
+        bar  asset
+        1    A        1.0
+        2    B        1.0
+        dtype: float64
+        >>> strategy.pnl_by_asset(freq=2)
+             A    B
+        1  1.0  0.0
+        2  0.0  1.0
+        """
+        bar, asset, value = self.__pairs("pnl")
+        return _by_asset(bar, asset, value, self.universe, "sum", sparse, freq)
+
+    def exposure_by_asset(self, net=True, sparse=False, freq=None):
+        """
+        Return net or absolute exposure of each asset at each bar.
+
+        Parameters
+        ----------
+        - net : bool, default True
+            If False, return absolute exposure.
+        - sparse : bool, default False
+            If True, return `pandas.Series` of non-zero values
+            indexed by pairs of bar and asset.
+        - freq : int or str, optional
+            If given, return exposure at the last bar of every `freq` bars or,
+            if the index of universe is `DatetimeIndex`, of each period of
+            offset alias `freq`.
+
+        Returns
+        -------
+        exposure : pandas.DataFrame or pandas.Series
+
+        Examples
+        --------
+        >>> from epymetheus import trade
+        >>> from epymetheus.benchmarks import DeterminedStrategy
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [4.0, 2.0, 1.0]})
+        >>> trades = [trade("A", exit=1), -trade("B", entry=1)]
+        >>> strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+        >>> strategy.exposure_by_asset()
+             A    B
+        0  1.0  0.0
+        1  2.0 -2.0
+        2  0.0 -1.0
+        >>> strategy.exposure_by_asset(net=False, freq=2)
+             A    B
+        1  2.0  2.0
+        2  0.0  1.0
+        """
+        bar, asset, value = self.__pairs("net" if net else "abs")
+        return _by_asset(bar, asset, value, self.universe, "last", sparse, freq)
+
+    def __pairs(self, kind):
+        # Return pairs of bar and asset with non-zero pnl or exposure
+        if not self.__is_run():
+            raise NotRunError("Strategy has not been run")
+
+        prices = self.universe.values
+        if hasattr(self, "holdings"):
+            if kind == "pnl":
+                value = np.zeros(prices.shape, dtype=self.holdings.dtype)
+                value[1:] = self.holdings[:-1] * np.diff(prices, axis=0)
+            elif kind == "net":
+                value = self.holdings * prices
+            else:
+                value = np.abs(self.holdings) * np.abs(prices)
+            bar, asset = np.nonzero(value)
+            return bar, asset, value[bar, asset]
+
+        if hasattr(self, "trade_arrays"):
+            arrays, close = self.trade_arrays, self.trade_close
+        else:
+            arrays = batch.TradeArrays.from_trades(self.trades, self.universe)
+            close = self.universe.index.get_indexer([t.close for t in self.trades])
+
+        if kind == "pnl":
+            return batch.pnl_pairs(prices, arrays, close)
+        return batch.exposure_pairs(prices, arrays, close, net=(kind == "net"))
+
+    def turnover(self) -> pd.Series:
+        """
+        Return `pandas.Series` of value traded at each bar to rebalance holdings.
+
+        It is available if the logic returns `epymetheus.batch.Target`.
+
+        Returns
+        -------
+        turnover : pandas.Series
+
+        Examples
+        --------
+        >>> from epymetheus.batch import Target
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [4.0, 2.0, 1.0]})
+        >>> weight = pd.DataFrame({"A": [0.5, 0.5, 0.5], "B": [0.5, 0.5, 0.5]})
+        >>> strategy = create_strategy(lambda universe: Target(weight, by="weight"))
+        >>> strategy.run(universe, verbose=False).turnover()
+        0    1.00
+        1    0.75
+        2    0.75
+        dtype: float64
+        >>> strategy.wealth()
+        0    0.00
+        1    0.25
+        2    0.50
+        dtype: float64
+        """
+        if not hasattr(self, "holdings"):
+            raise NotRunError("Strategy has not been run with target positions")
+
+        turnover = batch.holdings_turnover(self.universe.values, self.holdings)
+
+        return pd.Series(turnover, index=self.universe.index)
+
     def get_params(self) -> dict:
         """
         Set the parameters of this strategy.
@@ -308,3 +661,48 @@ class Strategy(abc.ABC):
         raise DeprecationWarning(
             "Strategy.evaluate(...) is deprecated. Use Strategy.score(...) instead."
         )
+
+
+def _is_columnar(trades) -> bool:
+    # Whether trades are given as a table instead of an iterable of Trade
+    return isinstance(trades, (pd.DataFrame, batch.TradeArrays))
+
+
+def _by_asset(bar, asset, value, universe, how, sparse, freq):
+    """
+    Aggregate values at pairs of bar and asset into pandas object.
+
+    Values are summed (`how="sum"`) or taken at the last bar (`how="last"`)
+    of each period given by `freq`.
+    """
+    index, columns = universe.index, universe.columns
+    n_bars, n_assets = universe.shape
+    dtype = batch.result_dtype(universe.values)
+
+    # Index positions of the last bar of each period
+    if freq is None:
+        ends = np.arange(n_bars)
+    elif isinstance(freq, numbers.Integral):
+        ends = np.union1d(np.arange(freq - 1, n_bars, freq), [n_bars - 1])
+    else:
+        ends = pd.Series(np.arange(n_bars), index=index).resample(freq).max()
+        ends = ends.dropna().values.astype(int)
+
+    period = np.searchsorted(ends, bar)
+    if how == "last":
+        at_end = ends[period] == bar
+        period, asset, value = period[at_end], asset[at_end], value[at_end]
+    key = period * n_assets + asset
+
+    if sparse:
+        key, inverse = np.unique(key, return_inverse=True)
+        value = np.bincount(inverse, weights=value, minlength=key.size)
+        period, asset = np.divmod(key, n_assets)
+        multi_index = pd.MultiIndex.from_arrays(
+            [index[ends[period]], columns[asset]], names=["bar", "asset"]
+        )
+        return pd.Series(value.astype(dtype, copy=False), index=multi_index)
+
+    value = np.bincount(key, weights=value, minlength=ends.size * n_assets)
+    value = value.reshape(ends.size, n_assets).astype(dtype, copy=False)
+    return pd.DataFrame(value, index=index[ends], columns=columns)
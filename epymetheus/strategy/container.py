@@ -1,13 +1,42 @@
+import os
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
+
+from .. import batch
+from ..exceptions import NotRunError
 from .base import Strategy
 
 
 class StrategyContainer(Strategy):
     """
+    Parameters
+    ----------
+    - n_jobs : int, default 1
+        Number of workers to generate trades of child strategies concurrently.
+        If -1, use as many workers as cores.
+    - backend : {"thread", "process"}, default "thread"
+        Pool of workers to use if `n_jobs != 1`.
+        Child strategies should be picklable if "process".
+    - **kwargs
+        Child strategies keyed by their names.
+        Children named "n_jobs" or "backend" should be given by
+        `add_strategy`, `StrategyDict` or `StrategyList` instead.
+
+    Trades of child strategies are yielded in the order of children
+    irrespective of `n_jobs`.
+
     Attributes
     ----------
     - _strategies : OrderedDict
+    - trade_keys : list of str
+        Key of the child strategy that yields each trade.
+        It is set by `run` and aligned with `self.trades`.
+
+    If any child returns trades as a table or `Target`, trades of all children
+    are concatenated as `TradeArrays` and executed at once
+    (see `Strategy.run`); `trade_keys` is then aligned with `self.trade_arrays`.
 
     >>> from epymetheus import trade
     >>> from epymetheus import create_strategy
@@ -19,9 +48,18 @@ class StrategyContainer(Strategy):
     2
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, *, n_jobs=1, backend="thread", **kwargs):
         super().__init__()
 
+        if isinstance(n_jobs, Strategy) or isinstance(backend, Strategy):
+            raise TypeError(
+                "Options n_jobs and backend cannot be names of child strategies"
+            )
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Invalid backend: {backend}")
+
+        self.n_jobs = n_jobs
+        self.backend = backend
         self._strategies = OrderedDict()
 
         for key, value in kwargs.items():
@@ -51,9 +89,196 @@ class StrategyContainer(Strategy):
         self._strategies[name] = strategy
 
     def logic(self, universe):
-        for strategy in self:
-            for trade in strategy(universe, to_list=False):
-                yield trade
+        trades, _ = self.__generate_keys(universe)
+        return trades
+
+    def _generate(self, universe):
+        trades, self.trade_keys = self.__generate_keys(universe)
+        return trades
+
+    def __generate_keys(self, universe):
+        """
+        Return trades of all children and the key of the child of each trade.
+
+        Trades of children are concatenated as `TradeArrays`
+        if any child returns a table or `Target`.
+        """
+        returned = list(self.__generate(universe))
+        if any(_is_table(trades) for trades in returned):
+            arrays = [batch.to_trade_arrays(trades, universe) for trades in returned]
+            n_trades = [a.n_trades for a in arrays]
+            keys = np.repeat(list(self.keys()), n_trades).tolist()
+            return batch.TradeArrays.concat(arrays), keys
+
+        trades, keys = [], []
+        for key, child_trades in zip(self.keys(), returned):
+            for trade in child_trades or []:
+                trades.append(trade)
+                keys.append(key)
+        return trades, keys
+
+    def __generate(self, universe):
+        """
+        Return trades of each child strategy in the order of children.
+        """
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+
+        if n_jobs == 1:
+            return (s(universe, to_list=False) for s in self.values())
+
+        if self.backend == "thread":
+            from concurrent.futures import ThreadPoolExecutor as Executor
+        else:
+            from concurrent.futures import ProcessPoolExecutor as Executor
+
+        with Executor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(_generate, s, universe) for s in self.values()]
+            return [future.result() for future in futures]
+
+    def history(self) -> pd.DataFrame:
+        """
+        Return `pandas.DataFrame` of trade history.
+
+        Returns
+        -------
+        history : pandas.DataFrame
+            Trade history with the key of the child strategy of each trade
+            in the column "strategy".
+        """
+        history = super().history()
+        if self._batch_arrays() is not None:
+            n_orders = np.diff(self._batch_arrays()[0].indptr)
+        else:
+            n_orders = [t.asset.size for t in self.trades]
+        history.insert(1, "strategy", np.repeat(self.trade_keys, n_orders))
+        return history
+
+    def wealth_by_strategy(self) -> pd.DataFrame:
+        """
+        Return wealth of each child strategy.
+
+        Trades are not executed again; wealth of all children is evaluated
+        from the trades executed in `run`.
+
+        Returns
+        -------
+        wealth : pandas.DataFrame
+            Wealth of each child strategy in each column.
+
+        Examples
+        --------
+        >>> from epymetheus import trade
+        >>> from epymetheus import create_strategy
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [3.0, 2.0, 1.0]})
+        >>> strategy1 = create_strategy(lambda universe: [trade("A")])
+        >>> strategy2 = create_strategy(lambda universe: [-trade("B")])
+        >>> s = StrategyDict({"S1": strategy1, "S2": strategy2})
+        >>> s.run(universe, verbose=False).wealth_by_strategy()
+            S1   S2
+        0  0.0  0.0
+        1  1.0  1.0
+        2  3.0  2.0
+        """
+        arrays, close, group = self.__arrays()
+        wealth = batch.group_wealth(
+            self.universe.values, arrays, close, group, len(self)
+        )
+        return pd.DataFrame(
+            wealth, index=self.universe.index, columns=list(self.keys())
+        )
+
+    def score_by_strategy(self, metric_name) -> pd.Series:
+        """
+        Return the value of a metric of each child strategy.
+
+        Parameters
+        ----------
+        - metric_name : str
+            Metric to evaluate.
+
+        Returns
+        -------
+        metric_values : pandas.Series
+            Metric of each child strategy.
+
+        Examples
+        --------
+        >>> from epymetheus import trade
+        >>> from epymetheus import create_strategy
+        >>> universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [3.0, 2.0, 1.0]})
+        >>> strategy1 = create_strategy(lambda universe: [trade("A")])
+        >>> strategy2 = create_strategy(lambda universe: [-trade("B")])
+        >>> s = StrategyDict({"S1": strategy1, "S2": strategy2})
+        >>> s.run(universe, verbose=False).score_by_strategy("final_wealth")
+        S1    3.0
+        S2    2.0
+        dtype: float64
+
+        A child strategy without trades scores 0.0 for every metric.
+        """
+        arrays, close, group = self.__arrays()
+        prices = self.universe.values
+        pnls = batch.trade_pnls(prices, arrays, close)
+        wealth = None
+        if metric_name == "max_drawdown":
+            wealth = batch.group_wealth(prices, arrays, close, group, len(self)).T
+
+        values = [
+            batch.metric(
+                metric_name,
+                pnls[group == i],
+                wealth[i] if wealth is not None else None,
+            )
+            if (group == i).any()
+            else 0.0
+            for i in range(len(self))
+        ]
+        return pd.Series(values, index=list(self.keys()), dtype=float)
+
+    def corr(self) -> pd.DataFrame:
+        """
+        Return correlation of returns of child strategies.
+
+        Returns are changes of wealth from the previous bar.
+
+        Returns
+        -------
+        corr : pandas.DataFrame
+            Correlation matrix indexed by the keys of child strategies.
+        """
+        return self.wealth_by_strategy().diff().corr()
+
+    def __arrays(self):
+        """
+        Return `TradeArrays`, index positions of closes and index of the child
+        strategy of the executed trades.
+        """
+        if self._batch_arrays() is not None:
+            arrays, close = self._batch_arrays()
+        elif hasattr(self, "trades"):
+            universe = self.universe
+            arrays = batch.TradeArrays.from_trades(self.trades, universe)
+            close = universe.index.get_indexer([t.close for t in self.trades])
+        else:
+            raise NotRunError("Strategy has not been run")
+
+        group = pd.Index(list(self.keys())).get_indexer(self.trade_keys)
+
+        return arrays, close, group
+
+
+def _generate(strategy, universe):
+    """
+    Return trades of a child strategy as a list, or as returned
+    if they are given as a table or `Target`.
+    """
+    returned = strategy(universe, to_list=False)
+    return returned if _is_table(returned) else list(returned or [])
+
+
+def _is_table(trades) -> bool:
+    # Whether trades are given as a table or target instead of Trade objects
+    return isinstance(trades, (pd.DataFrame, batch.TradeArrays, batch.Target))
 
 
 class StrategyList(StrategyContainer):
@@ -63,6 +288,10 @@ class StrategyList(StrategyContainer):
     Parameters
     ----------
     - strategies : iterable of Strategies
+    - n_jobs : int, default 1
+        See `StrategyContainer`.
+    - backend : {"thread", "process"}, default "thread"
+        See `StrategyContainer`.
 
     Examples
     --------
@@ -77,8 +306,11 @@ class StrategyList(StrategyContainer):
     [trade(['A'], lot=[1.]), trade(['B'], lot=[1.]), trade(['C'], lot=[1.])]
     """
 
-    def __init__(self, strategies: list):
-        super().__init__(**{self.__get_key(i): s for i, s in enumerate(strategies)})
+    def __init__(self, strategies: list, *, n_jobs=1, backend="thread"):
+        super().__init__(n_jobs=n_jobs, backend=backend)
+
+        for strategy in strategies:
+            self.append(strategy)
 
     def __get_key(self, i: int) -> str:
         return f"strategy_{i}"
@@ -116,6 +348,10 @@ class StrategyDict(StrategyContainer):
     Parameters
     ----------
     - strategies : iterable of Strategies
+    - n_jobs : int, default 1
+        See `StrategyContainer`.
+    - backend : {"thread", "process"}, default "thread"
+        See `StrategyContainer`.
 
     Examples
     --------
@@ -130,8 +366,11 @@ class StrategyDict(StrategyContainer):
     [trade(['A'], lot=[1.]), trade(['B'], lot=[1.]), trade(['C'], lot=[1.])]
     """
 
-    def __init__(self, strategies: dict):
-        super().__init__(**strategies)
+    def __init__(self, strategies: dict, *, n_jobs=1, backend="thread"):
+        super().__init__(n_jobs=n_jobs, backend=backend)
+
+        for key, value in strategies.items():
+            self.add_strategy(key, value)
 
     def __repr__(self):
         """
@@ -2,7 +2,7 @@ from copy import deepcopy
 
 import numpy as np
 
-from epymetheus.universe import Universe
+from epymetheus.universe import to_frame
 
 
 def trade(asset, entry=None, exit=None, take=None, stop=None, lot=1.0, **kwargs):
@@ -113,7 +113,7 @@ class Trade:
 
         Parameters
         ----------
-        universe : pandas.DataFrame
+        universe : pandas.DataFrame or MemmapUniverse
 
         Returns
         -------
@@ -144,7 +144,7 @@ class Trade:
         >>> t.close
         3
         """
-        universe = self.__to_dataframe(universe)
+        universe = to_frame(universe)
 
         entry = universe.index[0] if self.entry is None else self.entry
         exit = universe.index[-1] if self.exit is None else self.exit
@@ -162,29 +162,36 @@ class Trade:
             i_entry = universe.index.get_indexer([entry]).item()
             i_exit = universe.index.get_indexer([exit]).item()
 
-            # Compute pnl
-            value = self.array_value(universe).sum(axis=1)
-            pnl = value - value[i_entry]
-            pnl[:i_entry] = 0
+            if i_entry <= i_exit:
+                # Compute pnl only within [entry, exit]
+                value = self.array_value(universe, i_entry, i_exit + 1).sum(axis=1)
+                pnl = value - value[0]
 
-            # Place profit-take or loss-cut order
-            take = self.take if self.take is not None else np.inf
-            stop = self.stop if self.stop is not None else -np.inf
-            signal = np.logical_or(pnl >= take, pnl <= stop)
+                # Place profit-take or loss-cut order
+                take = self.take if self.take is not None else np.inf
+                stop = self.stop if self.stop is not None else -np.inf
+                signal = np.logical_or(pnl >= take, pnl <= stop)
 
-            # Compute close
-            i_order = np.searchsorted(signal, True)
-            i_close = min(i_exit, i_order)
-            close = universe.index[i_close]
+                # Compute close at the first signal
+                if signal.any():
+                    close = universe.index[i_entry + np.argmax(signal)]
 
         self.close = close
 
         return self
 
-    def array_value(self, universe):
+    def array_value(self, universe, begin=None, end=None):
         """
         Return value of self for each asset.
 
+        Parameters
+        ----------
+        - universe : pandas.DataFrame or MemmapUniverse
+        - begin : int, optional
+            Position of the first bar to read.
+        - end : int, optional
+            Position of the bar next to the last bar to read.
+
         Returns
         -------
         array_value : numpy.array, shape (n_bars, n_orders)
@@ -207,9 +214,18 @@ class Trade:
                [  6., -15.],
                [  8., -18.],
                [ 10., -21.]])
+        >>> trade.array_value(universe, 1, 3)
+        array([[  4., -12.],
+               [  6., -15.]])
         """
-        universe = self.__to_dataframe(universe)
-        array_value = self.lot * universe.loc[:, self.asset].values
+        universe = to_frame(universe)
+        i_asset = universe.columns.get_indexer(self.asset)
+        if (i_asset == -1).any():
+            raise KeyError(f"asset {self.asset} not in universe.columns")
+        values = universe.iloc[begin:end, i_asset].values
+        # Keep the precision of float prices (e.g. float32)
+        lot = self.lot.astype(values.dtype) if values.dtype.kind == "f" else self.lot
+        array_value = lot * values
         return array_value
 
     def final_pnl(self, universe):
@@ -235,17 +251,19 @@ class Trade:
         >>> t.final_pnl(universe)
         array([2., 2.])
         """
-        universe = self.__to_dataframe(universe)
+        universe = to_frame(universe)
 
+        # Trade without entry enters at the first bar
         i_entry = universe.index.get_indexer([self.entry]).item()
+        i_entry = i_entry if i_entry != -1 else 0
         i_close = universe.index.get_indexer([self.close]).item()
 
-        value = self.array_value(universe)
-        pnl = value - value[i_entry]
-        pnl[:i_entry] = 0
-        pnl[i_close:] = pnl[i_close]
+        if i_close < i_entry:
+            return np.zeros(self.asset.size)
 
-        final_pnl = pnl[-1]
+        # Only values at entry and close are needed
+        value = self.array_value(universe.iloc[[i_entry, i_close]])
+        final_pnl = value[1] - value[0]
 
         return final_pnl
 
@@ -331,8 +349,3 @@ class Trade:
                 params.append(f"{attr}={value}")
 
         return f"trade({', '.join(params)})"
-
-    @staticmethod
-    def __to_dataframe(universe):
-        # Backward compatibility
-        return universe.prices if isinstance(universe, Universe) else universe
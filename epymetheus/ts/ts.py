@@ -1,21 +1,33 @@
 import numpy as np
 
+from ..universe import to_frame
+
+
+def _dtype(universe) -> np.dtype:
+    # Float dtype of prices in which series are returned
+    dtype = np.result_type(*universe.dtypes)
+    return dtype if dtype.kind == "f" else np.dtype(float)
+
 
 def wealth(trades, universe) -> np.array:
-    wealth = np.zeros_like(universe.iloc[:, 0], dtype=float)
+    # Read prices of each trade only within [entry, close]
+    # and accumulate in float64 even if prices are float32
+    universe = to_frame(universe)
+    wealth = np.zeros(universe.shape[0], dtype=np.float64)
     for t in trades:
         i_entry = universe.index.get_indexer([t.entry]).item()
         i_entry = i_entry if i_entry != -1 else 0
         i_close = universe.index.get_loc(t.close)
+        if i_close < i_entry:
+            continue
 
-        value = t.array_value(universe).sum(axis=1)
-        pnl = value - value[i_entry]
-        pnl[:i_entry] = 0
-        pnl[i_close:] = pnl[i_close]
+        value = t.array_value(universe, i_entry, i_close + 1).sum(axis=1, dtype=float)
+        pnl = value - value[0]
 
-        wealth += pnl
+        wealth[i_entry : i_close + 1] += pnl
+        wealth[i_close + 1 :] += pnl[-1]
 
-    return wealth
+    return wealth.astype(_dtype(universe), copy=False)
 
 
 def drawdown(trades, universe) -> np.array:
@@ -25,17 +37,21 @@ def drawdown(trades, universe) -> np.array:
 
 
 def _exposure(trades, universe, net: bool):
-    exposure = np.zeros_like(universe.iloc[:, 0], dtype=float)
+    # Read prices of each trade only within [entry, close]
+    universe = to_frame(universe)
+    exposure = np.zeros(universe.shape[0], dtype=np.float64)
     for t in trades:
         i_entry = universe.index.get_indexer([t.entry]).item()
+        i_entry = i_entry if i_entry != -1 else 0
         i_close = universe.index.get_indexer([t.close]).item()
-        value = t.array_value(universe).astype(exposure.dtype)
-        value[:i_entry] = 0
-        value[i_close + 1 :] = 0
+        if i_close < i_entry:
+            continue
+
+        value = t.array_value(universe, i_entry, i_close + 1)
         value = value if net else np.abs(value)
-        exposure += value.sum(axis=1)
+        exposure[i_entry : i_close + 1] += value.sum(axis=1, dtype=float)
 
-    return exposure
+    return exposure.astype(_dtype(universe), copy=False)
 
 
 def net_exposure(trades, universe) -> np.array:
@@ -1,5 +1,197 @@
+import os
+
+import numpy as np
+import pandas as pd
+from numpy.lib.format import open_memmap
+
+
 class Universe:
     def __init__(self, prices, name=None):
         self.prices = prices
         self.name = name
         raise DeprecationWarning("Universe is deprecated. Just use pandas.DataFrame.")
+
+
+class MemmapUniverse:
+    """
+    Universe of prices backed by a memory-mapped array.
+
+    Prices are stored in a directory as `values.npy` in column-major order,
+    so that each asset is contiguous on disk, with sidecars `index.npy` and
+    `columns.npy`.
+    Only the columns and windows actually read are loaded into memory.
+
+    `Trade.execute`, `epymetheus.ts` and `epymetheus.metrics` accept it in place
+    of `pandas.DataFrame` and strategies get its pandas-compatible view
+    `self.to_frame()`, which shares memory with the memory-mapped array.
+
+    Parameters
+    ----------
+    - values : numpy.array, shape (n_bars, n_assets)
+        Prices, typically `numpy.memmap`.
+    - index : array-like, shape (n_bars,), optional
+    - columns : array-like, shape (n_assets,), optional
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [4.0, 5.0, 6.0]})
+    >>> path = tempfile.mkdtemp()
+    >>> _ = MemmapUniverse.save(universe, path)
+    >>> universe = MemmapUniverse.open(path)
+    >>> universe
+    MemmapUniverse(n_bars=3, n_assets=2)
+    >>> universe.iloc[1:, 1]
+    1    5.0
+    2    6.0
+    Name: B, dtype: float64
+    """
+
+    def __init__(self, values, index=None, columns=None):
+        n_bars, n_assets = values.shape
+        self.values = values
+        self.index = pd.RangeIndex(n_bars) if index is None else pd.Index(index)
+        self.columns = pd.RangeIndex(n_assets) if columns is None else pd.Index(columns)
+
+    @classmethod
+    def open(cls, path, mode="r"):
+        """
+        Open universe saved in a directory.
+
+        Parameters
+        ----------
+        - path : str or path-like
+            Directory of universe.
+        - mode : {"r", "r+", "c"}, default "r"
+            Mode to open `values.npy`. See `numpy.memmap`.
+
+        Returns
+        -------
+        universe : MemmapUniverse
+        """
+        values = np.load(os.path.join(path, "values.npy"), mmap_mode=mode)
+        index = np.load(os.path.join(path, "index.npy"))
+        columns = np.load(os.path.join(path, "columns.npy"))
+        return cls(values, index=index, columns=columns)
+
+    @classmethod
+    def create(cls, path, index, columns, dtype=np.float64):
+        """
+        Create a writable universe in a directory.
+        Prices can be written by chunks to `universe.values`.
+
+        Parameters
+        ----------
+        - path : str or path-like
+            Directory of universe. It is created if it does not exist.
+        - index : array-like, shape (n_bars,)
+        - columns : array-like, shape (n_assets,)
+            Labels of index and columns are saved without pickle,
+            so they should be numbers, datetimes or str (not mixed).
+        - dtype : data-type, default numpy.float64
+
+        Returns
+        -------
+        universe : MemmapUniverse
+        """
+        index, columns = pd.Index(index), pd.Index(columns)
+        index_array, columns_array = cls.__to_array(index), cls.__to_array(columns)
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "index.npy"), index_array)
+        np.save(os.path.join(path, "columns.npy"), columns_array)
+        values = open_memmap(
+            os.path.join(path, "values.npy"),
+            mode="w+",
+            dtype=dtype,
+            shape=(index.size, columns.size),
+            fortran_order=True,
+        )
+        return cls(values, index=index, columns=columns)
+
+    @classmethod
+    def save(cls, universe, path, dtype=np.float64):
+        """
+        Save `pandas.DataFrame` of prices in a directory.
+
+        Parameters
+        ----------
+        - universe : pandas.DataFrame
+        - path : str or path-like
+        - dtype : data-type, default numpy.float64
+
+        Returns
+        -------
+        universe : MemmapUniverse
+        """
+        self = cls.create(path, universe.index, universe.columns, dtype=dtype)
+        for i in range(universe.shape[1]):
+            self.values[:, i] = universe.iloc[:, i].values
+        self.values.flush()
+        return self
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def iloc(self):
+        return self.to_frame().iloc
+
+    @property
+    def loc(self):
+        return self.to_frame().loc
+
+    def __getitem__(self, key):
+        return self.to_frame()[key]
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return `pandas.DataFrame` view of self without loading prices.
+
+        Returns
+        -------
+        universe : pandas.DataFrame
+        """
+        if not hasattr(self, "_frame"):
+            self._frame = pd.DataFrame(
+                self.values, index=self.index, columns=self.columns, copy=False
+            )
+        return self._frame
+
+    def __repr__(self):
+        n_bars, n_assets = self.shape
+        return f"MemmapUniverse(n_bars={n_bars}, n_assets={n_assets})"
+
+    @staticmethod
+    def __to_array(index):
+        # Save labels without pickle
+        array = np.asarray(index)
+        if array.dtype == object:
+            for label in array:
+                if not isinstance(label, str):
+                    raise TypeError(f"Label should be str, not {label!r}")
+            array = array.astype(str)
+        return array
+
+
+def to_frame(universe) -> pd.DataFrame:
+    """
+    Return `pandas.DataFrame` of prices from universe.
+
+    Parameters
+    ----------
+    - universe : pandas.DataFrame or MemmapUniverse
+
+    Returns
+    -------
+    universe : pandas.DataFrame
+    """
+    if isinstance(universe, Universe):
+        # Backward compatibility
+        return universe.prices
+    if isinstance(universe, MemmapUniverse):
+        return universe.to_frame()
+    return universe
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_equal
+
+from epymetheus import trade
+from epymetheus import ts
+from epymetheus.batch import TradeArrays
+from epymetheus.batch import execute
+from epymetheus.batch import exposure
+from epymetheus.batch import metric
+from epymetheus.batch import trade_pnls
+from epymetheus.batch import wealth
+from epymetheus.benchmarks import RandomStrategy
+from epymetheus.datasets import make_randomwalk
+from epymetheus.metrics import metric_from_name
+
+
+def make_trades(universe, n_trades=100, max_n_assets=3):
+    trades = RandomStrategy(n_trades=n_trades, max_n_assets=max_n_assets, min_lot=-1.0)(
+        universe
+    )
+    for i, t in enumerate(trades):
+        if i % 3 == 0:
+            t.take, t.stop = 0.02, -0.02
+        if i % 3 == 1:
+            t.stop = -0.01
+    return trades
+
+
+class TestBatch:
+    @pytest.fixture(scope="function", autouse=True)
+    def setup(self):
+        np.random.seed(42)
+
+    def test_execute(self):
+        universe = make_randomwalk(100, 10)
+        trades = make_trades(universe)
+        arrays = TradeArrays.from_trades(trades, universe)
+
+        result = execute(universe.values, arrays)
+        expected = [t.execute(universe).close for t in trades]
+
+        assert_equal(result, expected)
+
+    @pytest.mark.parametrize("chunk_size", [1, 10, 2 ** 22])
+    def test_execute_chunk(self, chunk_size):
+        universe = make_randomwalk(100, 10)
+        arrays = TradeArrays.from_trades(make_trades(universe), universe)
+
+        result = execute(universe.values, arrays, chunk_size=chunk_size)
+        expected = execute(universe.values, arrays)
+
+        assert_equal(result, expected)
+
+    def test_execute_paths(self):
+        universes = [make_randomwalk(100, 10) for _ in range(3)]
+        trades = make_trades(universes[0])
+        arrays = TradeArrays.from_trades(trades, universes[0])
+        prices = np.stack([u.values for u in universes])
+
+        result = execute(prices, arrays)
+        expected = np.stack([execute(u.values, arrays) for u in universes])
+
+        assert_equal(result, expected)
+
+    def test_ts(self):
+        universe = make_randomwalk(100, 10)
+        trades = [t.execute(universe) for t in make_trades(universe)]
+        arrays = TradeArrays.from_trades(trades, universe)
+        close = execute(universe.values, arrays)
+
+        assert_allclose(
+            wealth(universe.values, arrays, close), ts.wealth(trades, universe)
+        )
+        assert_allclose(
+            exposure(universe.values, arrays, close, net=True),
+            ts.net_exposure(trades, universe),
+            atol=1e-10,
+        )
+        assert_allclose(
+            exposure(universe.values, arrays, close, net=False),
+            ts.abs_exposure(trades, universe),
+            atol=1e-10,
+        )
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "avg_lose",
+            "avg_pnl",
+            "avg_win",
+            "final_wealth",
+            "max_drawdown",
+            "num_lose",
+            "num_win",
+            "rate_lose",
+            "rate_win",
+        ],
+    )
+    def test_metric(self, name):
+        universe = make_randomwalk(100, 10)
+        trades = [t.execute(universe) for t in make_trades(universe)]
+        arrays = TradeArrays.from_trades(trades, universe)
+        close = execute(universe.values, arrays)
+        pnls = trade_pnls(universe.values, arrays, close)
+        w = wealth(universe.values, arrays, close)
+
+        result = metric(name, pnls, w)
+        expected = metric_from_name(name)(trades, universe)
+
+        assert_allclose(result, expected)
+
+    def test_from_trades_keyerror(self):
+        universe = pd.DataFrame({"A": range(10)})
+
+        with pytest.raises(KeyError):
+            TradeArrays.from_trades([trade("NONEXISTENT")], universe)
+        with pytest.raises(KeyError):
+            TradeArrays.from_trades([trade("A", entry=99)], universe)
+
+    @pytest.mark.parametrize("bars", [None, "date"])
+    def test_from_frame(self, bars):
+        if bars == "date":
+            bars = list(pd.date_range("2000-01-01", periods=100))
+        universe = make_randomwalk(100, 10, bars=bars)
+        trades = make_trades(universe)
+        trades[0].entry, trades[1].exit = None, None
+        n_legs = [t.asset.size for t in trades]
+        frame = pd.DataFrame(
+            {
+                "trade_id": np.repeat(np.arange(len(trades)), n_legs),
+                "asset": np.concatenate([t.asset for t in trades]),
+                "lot": np.concatenate([t.lot for t in trades]),
+            }
+        )
+        for name in ("entry", "exit", "take", "stop"):
+            frame[name] = np.repeat([getattr(t, name) for t in trades], n_legs)
+
+        result = TradeArrays.from_frame(frame, universe)
+        expected = TradeArrays.from_trades(trades, universe)
+
+        for name in ("asset", "lot", "indptr", "entry", "exit", "take", "stop"):
+            assert_equal(getattr(result, name), getattr(expected, name))
+
+    def test_from_frame_default(self):
+        universe = pd.DataFrame({"A": range(10), "B": range(10)})
+        arrays = TradeArrays.from_frame({"asset": ["B", "A"]}, universe)
+
+        assert_equal(arrays.asset, [1, 0])
+        assert_equal(arrays.lot, [1.0, 1.0])
+        assert_equal(arrays.indptr, [0, 1, 2])
+        assert_equal(arrays.entry, [0, 0])
+        assert_equal(arrays.exit, [9, 9])
+        assert_equal(arrays.take, [np.inf, np.inf])
+        assert_equal(arrays.stop, [-np.inf, -np.inf])
+
+    def test_from_frame_keyerror(self):
+        universe = pd.DataFrame({"A": range(10)})
+
+        with pytest.raises(KeyError):
+            TradeArrays.from_frame({"asset": ["NONEXISTENT"]}, universe)
+        with pytest.raises(KeyError):
+            TradeArrays.from_frame({"asset": ["A"], "entry": [99]}, universe)
+
+    def test_float32(self):
+        universe = make_randomwalk(100, 10)
+        arrays = TradeArrays.from_trades(make_trades(universe), universe)
+        prices = universe.values
+        prices32 = prices.astype(np.float32)
+
+        close = execute(prices, arrays)
+        assert_equal(execute(prices32, arrays), close)
+        assert wealth(prices32, arrays, close).dtype == np.float32
+        assert exposure(prices32, arrays, close).dtype == np.float32
+        assert_allclose(
+            wealth(prices32, arrays, close), wealth(prices, arrays, close), atol=1e-5
+        )
+        assert_allclose(
+            exposure(prices32, arrays, close, net=False),
+            exposure(prices, arrays, close, net=False),
+            rtol=1e-5,
+        )
+        assert_allclose(
+            trade_pnls(prices32, arrays, close),
+            trade_pnls(prices, arrays, close),
+            atol=1e-5,
+        )
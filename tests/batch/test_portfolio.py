@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_equal
+
+from epymetheus.batch import TradeArrays
+from epymetheus.batch import execute
+from epymetheus.batch import fill_trades
+from epymetheus.batch import simulate_portfolio
+from epymetheus.batch import sparse_wealth
+from epymetheus.benchmarks import RandomStrategy
+from epymetheus.datasets import make_randomwalk
+
+
+def make_arrays(universe, n_trades=100, seed=42):
+    strategy = RandomStrategy(
+        n_trades=n_trades,
+        max_n_assets=3,
+        min_lot=-1.0,
+        holding=lambda rng, size: rng.integers(1, 20, size),
+        take=0.1,
+        stop=-0.1,
+        seed=seed,
+    )
+    arrays = strategy.arrays(universe)
+    return arrays, execute(universe.values, arrays)
+
+
+def naive(prices, arrays, close, cash, min_cash, max_leverage, max_positions, how):
+    """
+    Simulate a portfolio bar by bar.
+    """
+    n_bars, n_assets = prices.shape
+    fill = np.zeros(arrays.n_trades)
+    holdings = np.zeros(n_assets)
+    is_open = np.zeros(arrays.n_trades, dtype=bool)
+
+    def lots(i):
+        lots = np.zeros(n_assets)
+        legs = slice(arrays.indptr[i], arrays.indptr[i + 1])
+        np.add.at(lots, arrays.asset[legs], arrays.lot[legs])
+        return lots
+
+    def feasible(i, f, cash, bar):
+        p = prices[bar]
+        after = holdings + f * lots(i)
+        cash_after = cash - f * lots(i) @ p
+        equity = cash + holdings @ p
+        gross, gross_after = np.abs(holdings) @ np.abs(p), np.abs(after) @ np.abs(p)
+        if min_cash is not None and cash_after < min_cash - 1e-9:
+            return False
+        if max_leverage is not None:
+            if gross_after > max(max_leverage * equity, gross) + 1e-9:
+                return False
+        return True
+
+    for bar in range(n_bars):
+        for i in np.flatnonzero(is_open & (close == bar)):
+            holdings -= fill[i] * lots(i)
+            cash += fill[i] * lots(i) @ prices[bar]
+            is_open[i] = False
+        for i in np.flatnonzero(arrays.entry == bar):
+            if max_positions is not None and is_open.sum() >= max_positions:
+                continue
+            if feasible(i, 1.0, cash, bar):
+                f = 1.0
+            elif how == "scale":
+                lo, hi = 0.0, 1.0
+                for _ in range(60):
+                    mid = (lo + hi) / 2
+                    lo, hi = (mid, hi) if feasible(i, mid, cash, bar) else (lo, mid)
+                f = lo
+            else:
+                f = 0.0
+            if f > 0:
+                fill[i] = f
+                holdings += f * lots(i)
+                cash -= f * lots(i) @ prices[bar]
+                is_open[i] = True
+                if close[i] == bar:
+                    holdings -= f * lots(i)
+                    cash += f * lots(i) @ prices[bar]
+                    is_open[i] = False
+    return fill
+
+
+class TestSimulatePortfolio:
+    @pytest.mark.parametrize("how", ["reject", "scale"])
+    @pytest.mark.parametrize(
+        "constraints",
+        [
+            dict(cash=2.0, min_cash=0.0),
+            dict(cash=10.0, min_cash=None, max_leverage=1.0),
+            dict(cash=10.0, min_cash=None, max_positions=5),
+            dict(cash=20.0, min_cash=5.0, max_leverage=2.0, max_positions=10),
+        ],
+    )
+    def test_naive(self, how, constraints):
+        universe = make_randomwalk(100, 10, seed=42)
+        arrays, close = make_arrays(universe)
+        params = dict(min_cash=0.0, max_leverage=None, max_positions=None)
+        params.update(constraints)
+
+        result = simulate_portfolio(universe.values, arrays, close, how=how, **params)
+        expected = naive(universe.values, arrays, close, how=how, **params)
+
+        assert_allclose(result, expected, atol=1e-6)
+        assert 0 < (result > 0).sum() < arrays.n_trades
+        if how == "reject":
+            assert set(np.unique(result)) <= {0.0, 1.0}
+
+    def test_unconstrained(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        arrays, close = make_arrays(universe)
+
+        fill = simulate_portfolio(universe.values, arrays, close, min_cash=None)
+
+        assert_equal(fill, np.ones(arrays.n_trades))
+
+    def test_max_positions(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        arrays, close = make_arrays(universe)
+
+        fill = simulate_portfolio(
+            universe.values, arrays, close, min_cash=None, max_positions=3
+        )
+
+        filled = np.flatnonzero(fill > 0)
+        for bar in range(100):
+            is_open = (arrays.entry[filled] <= bar) & (close[filled] > bar)
+            assert is_open.sum() <= 3
+
+    def test_duplicate_assets(self):
+        universe = make_randomwalk(10, 2, seed=42)
+        inf = np.full(2, np.inf)
+        arrays = TradeArrays(
+            [0, 0, 1], np.ones(3), [0, 2, 3], [0, 0], [9, 9], inf, -inf
+        )
+        prices = universe.values
+        cash = 2 * prices[0, 0] + prices[0, 1]
+
+        fill = simulate_portfolio(prices, arrays, execute(prices, arrays), cash=cash)
+
+        assert_equal(fill, [1.0, 1.0])
+
+    def test_invalid_how(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        arrays, close = make_arrays(universe)
+
+        with pytest.raises(ValueError):
+            simulate_portfolio(universe.values, arrays, close, how="NONEXISTENT")
+
+
+class TestFillTrades:
+    def test_wealth(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        arrays, close = make_arrays(universe)
+        prices = universe.values
+        fill = simulate_portfolio(prices, arrays, close, cash=10.0, how="scale")
+
+        filled_arrays, filled_close = fill_trades(arrays, close, fill)
+
+        assert filled_arrays.n_trades == (fill > 0).sum()
+        assert_equal(execute(prices, filled_arrays), filled_close)
+        expected = sum(
+            f * sparse_wealth(prices, *fill_trades(arrays, close, np.eye(1, 100, i)[0]))
+            for i, f in enumerate(fill)
+            if f > 0
+        )
+        assert_allclose(sparse_wealth(prices, filled_arrays, filled_close), expected)
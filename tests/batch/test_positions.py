@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_equal
+
+from epymetheus.batch import Positions
+from epymetheus.batch import TradeArrays
+from epymetheus.batch import execute
+from epymetheus.batch import exposure
+from epymetheus.batch import sparse_exposure
+from epymetheus.batch import sparse_wealth
+from epymetheus.batch import wealth
+from epymetheus.benchmarks import RandomStrategy
+from epymetheus.datasets import make_randomwalk
+
+
+def make_intervals(n=100, n_bars=50, n_assets=10, seed=42):
+    rng = np.random.default_rng(seed)
+    asset = rng.integers(n_assets, size=n)
+    begin = rng.integers(n_bars, size=n)
+    end = begin + rng.integers(0, 10, size=n)
+    lot = rng.standard_normal(n)
+    return asset, begin, np.minimum(end, n_bars), lot
+
+
+def dense(asset, begin, end, lot, shape):
+    lots = np.zeros(shape)
+    for a, b, e, x in zip(asset, begin, end, lot):
+        lots[b:e, a] += x
+    return lots
+
+
+class TestPositions:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_to_dense(self, seed):
+        intervals = make_intervals(seed=seed)
+        positions = Positions.from_intervals(*intervals, shape=(50, 10))
+
+        assert_allclose(positions.to_dense(), dense(*intervals, (50, 10)))
+
+    def test_csr(self):
+        intervals = make_intervals()
+        positions = Positions.from_intervals(*intervals, shape=(50, 10))
+
+        assert positions.indptr.shape == (11,)
+        assert positions.indptr[-1] == positions.n_events
+        for j in range(10):
+            bar = positions.bar[positions.indptr[j] : positions.indptr[j + 1]]
+            assert (np.diff(bar) > 0).all()
+
+    def test_nonzero(self):
+        intervals = make_intervals()
+        positions = Positions.from_intervals(*intervals, shape=(50, 10))
+        bar, asset, lot = positions.nonzero()
+        lots = dense(*intervals, (50, 10))
+
+        assert bar.size == np.count_nonzero(lots)
+        assert_allclose(lot, lots[bar, asset])
+
+    def test_cancel(self):
+        # Lots that cancel out are not held even with rounding errors
+        positions = Positions.from_intervals(
+            asset=[0, 0, 0, 0],
+            begin=[0, 0, 5, 5],
+            end=[3, 3, 8, 8],
+            lot=[0.1, 0.2, 0.1, 0.2],
+            shape=(10, 1),
+        )
+        bar, _, _ = positions.nonzero()
+
+        assert_equal(bar, [0, 1, 2, 5, 6, 7])
+
+    def test_empty(self):
+        positions = Positions.from_intervals([], [], [], [], shape=(10, 3))
+
+        assert positions.n_events == 0
+        assert_equal(positions.to_dense(), np.zeros((10, 3)))
+
+
+class TestSparse:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("take_stop", [False, True])
+    def test_dense(self, seed, take_stop):
+        universe = make_randomwalk(100, 20, seed=seed)
+        take, stop = (0.05, -0.05) if take_stop else (None, None)
+        arrays = RandomStrategy(
+            n_trades=100, max_n_assets=3, min_lot=-1.0, take=take, stop=stop, seed=seed
+        ).arrays(universe)
+        prices = universe.values
+        close = execute(prices, arrays)
+
+        assert_allclose(
+            sparse_wealth(prices, arrays, close), wealth(prices, arrays, close)
+        )
+        for net in (True, False):
+            assert_allclose(
+                sparse_exposure(prices, arrays, close, net=net),
+                exposure(prices, arrays, close, net=net),
+                atol=1e-10,
+            )
+
+    def test_float32(self):
+        universe = make_randomwalk(100, 20, seed=42)
+        arrays = RandomStrategy(n_trades=100, seed=42).arrays(universe)
+        prices = universe.values.astype(np.float32)
+        close = execute(prices, arrays)
+
+        assert sparse_wealth(prices, arrays, close).dtype == np.float32
+        assert sparse_exposure(prices, arrays, close).dtype == np.float32
+
+    def test_no_position(self):
+        universe = make_randomwalk(10, 2, seed=42)
+        arrays = TradeArrays([0], [1.0], [0, 1], [3], [3], [np.inf], [-np.inf])
+        close = execute(universe.values, arrays)
+
+        assert_equal(sparse_wealth(universe.values, arrays, close), np.zeros(10))
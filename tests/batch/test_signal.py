@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from epymetheus.batch import signal_to_trades
+
+
+def naive_signal_to_trades(signal):
+    rows = []
+    n_bars = signal.shape[0]
+    for asset in signal.columns:
+        values = signal[asset].fillna(0).values
+        i = 0
+        while i < n_bars:
+            j = i
+            while j + 1 < n_bars and values[j + 1] == values[i]:
+                j += 1
+            if values[i] != 0:
+                rows.append((i, asset, values[i], signal.index[min(j + 1, n_bars - 1)]))
+            i = j + 1
+    rows = sorted(rows, key=lambda row: row[0])
+    return pd.DataFrame(
+        {
+            "asset": [row[1] for row in rows],
+            "lot": [float(row[2]) for row in rows],
+            "entry": [signal.index[row[0]] for row in rows],
+            "exit": [row[3] for row in rows],
+        }
+    )
+
+
+class TestSignalToTrades:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("bars", [None, "date"])
+    def test_naive(self, seed, bars):
+        np.random.seed(seed)
+        values = np.random.choice([0.0, 1.0, -2.0, np.nan], size=(50, 5))
+        signal = pd.DataFrame(values, columns=list("ABCDE"))
+        if bars == "date":
+            signal.index = pd.date_range("2000-01-01", periods=50)
+
+        result = signal_to_trades(signal)
+        expected = naive_signal_to_trades(signal)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_array(self):
+        result = signal_to_trades(np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]))
+        assert list(result["asset"]) == [0, 1]
+        assert list(result["entry"]) == [0, 1]
+        assert list(result["exit"]) == [2, 2]
+
+    def test_take_stop(self):
+        signal = pd.DataFrame({"A": [1, 1, 0, 1]})
+
+        assert list(signal_to_trades(signal).columns) == [
+            "asset",
+            "lot",
+            "entry",
+            "exit",
+        ]
+
+        result = signal_to_trades(signal, take=1.0, stop=-1.0)
+        assert list(result["take"]) == [1.0, 1.0]
+        assert list(result["stop"]) == [-1.0, -1.0]
+
+    def test_zero(self):
+        result = signal_to_trades(pd.DataFrame({"A": [0.0, np.nan, 0.0]}))
+        assert len(result) == 0
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_equal
+
+from epymetheus.batch import Target
+from epymetheus.batch import TradeArrays
+from epymetheus.batch import execute
+from epymetheus.batch import holdings_exposure
+from epymetheus.batch import holdings_turnover
+from epymetheus.batch import holdings_wealth
+from epymetheus.batch import wealth
+from epymetheus.datasets import make_randomwalk
+
+
+def make_holdings(n_bars=100, n_assets=10, seed=42):
+    np.random.seed(seed)
+    values = np.random.choice([0.0, 1.0, -2.0], size=(n_bars, n_assets))
+    # Keep positions for a while
+    return values[np.arange(n_bars) // 5 * 5]
+
+
+class TestHoldings:
+    def test_wealth(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        holdings = make_holdings()
+        arrays = TradeArrays.from_holdings(holdings)
+        close = execute(universe.values, arrays)
+
+        assert_allclose(
+            holdings_wealth(universe.values, holdings),
+            wealth(universe.values, arrays, close),
+        )
+
+    def test_exposure(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        holdings = make_holdings()
+        value = holdings * universe.values
+
+        assert_allclose(holdings_exposure(universe.values, holdings), value.sum(1))
+        assert_allclose(
+            holdings_exposure(universe.values, holdings, net=False),
+            np.abs(value).sum(1),
+        )
+
+    def test_turnover(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        holdings = make_holdings()
+        result = holdings_turnover(universe.values, holdings)
+
+        previous = np.zeros(10)
+        for i in range(100):
+            traded = np.abs(holdings[i] - previous) * universe.values[i]
+            assert result[i] == pytest.approx(traded.sum())
+            previous = holdings[i]
+
+    def test_paths(self):
+        prices = np.stack([make_randomwalk(100, 10, seed=i).values for i in range(3)])
+        holdings = make_holdings()
+
+        result = holdings_wealth(prices, holdings)
+        expected = np.stack([holdings_wealth(p, holdings) for p in prices])
+        assert_allclose(result, expected)
+
+    def test_float32(self):
+        prices = make_randomwalk(100, 10, seed=42).values
+        holdings = make_holdings()
+        prices32 = prices.astype(np.float32)
+
+        for f in (holdings_wealth, holdings_exposure, holdings_turnover):
+            assert f(prices32, holdings).dtype == np.float32
+            assert_allclose(f(prices32, holdings), f(prices, holdings), rtol=1e-4)
+
+
+class TestTarget:
+    def test_lots(self):
+        universe = pd.DataFrame({"A": [1.0, 2.0, 4.0], "B": [4.0, 2.0, 1.0]})
+        values = pd.DataFrame({"B": [1.0, np.nan, 2.0]}, index=[2, 1, 0])
+
+        assert_equal(Target(values).lots(universe), [[0, 2], [0, 0], [0, 1]])
+        assert_equal(
+            Target(values, by="weight").lots(universe), [[0, 0.5], [0, 0], [0, 1]]
+        )
+
+    def test_array(self):
+        universe = pd.DataFrame({"A": [1.0, 2.0], "B": [4.0, 2.0]})
+
+        assert_equal(Target(np.ones((2, 2))).lots(universe), np.ones((2, 2)))
+        with pytest.raises(ValueError):
+            Target(np.ones((3, 2))).lots(universe)
+
+    def test_by(self):
+        with pytest.raises(ValueError):
+            Target(np.ones((2, 2)), by="value")
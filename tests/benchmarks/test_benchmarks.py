@@ -2,7 +2,9 @@ import pandas as pd
 import pytest
 
 from epymetheus import create_strategy
+from epymetheus.batch import TradeArrays
 from epymetheus.benchmarks import BuyAndHold
+from epymetheus.benchmarks import RandomStrategy
 from epymetheus.benchmarks import dumb_strategy
 from epymetheus.datasets import make_randomwalk
 
@@ -27,3 +29,75 @@ class TestDumbStrategy:
         ]
         strategy = create_strategy(dumb_strategy, profit_take=2.0, stop_loss=-1.0)
         strategy.run(universe)
+
+
+class TestRandomStrategy:
+    def test_seed(self):
+        universe = make_randomwalk(seed=42)
+        strategy = RandomStrategy(max_n_assets=3, seed=42)
+
+        assert strategy(universe) == strategy(universe)
+        assert RandomStrategy(seed=0)(universe) != RandomStrategy(seed=1)(universe)
+
+    def test_arrays(self):
+        universe = make_randomwalk(seed=42)
+        strategy = RandomStrategy(n_trades=100, max_n_assets=3, seed=42)
+        arrays = strategy.arrays(universe)
+        trades = strategy(universe)
+
+        assert arrays.n_trades == len(trades) == 100
+        for i, t in enumerate(trades):
+            legs = slice(arrays.indptr[i], arrays.indptr[i + 1])
+            assert (t.asset == universe.columns[arrays.asset[legs]]).all()
+            assert (t.lot == arrays.lot[legs]).all()
+            assert t.entry == universe.index[arrays.entry[i]]
+            assert t.exit == universe.index[arrays.exit[i]]
+            assert 1 <= t.asset.size <= 3
+
+    @pytest.mark.parametrize("holding", [0, 5, 10000])
+    def test_holding_int(self, holding):
+        universe = make_randomwalk(seed=42)
+        arrays = RandomStrategy(n_trades=100, holding=holding, seed=42).arrays(universe)
+        length = min(holding, universe.index.size - 1)
+
+        assert ((arrays.exit - arrays.entry) == length).all()
+        assert (arrays.entry >= 0).all()
+        assert (arrays.exit < universe.index.size).all()
+
+    def test_holding_callable(self):
+        universe = make_randomwalk(seed=42)
+
+        def holding(rng, size):
+            return rng.geometric(0.1, size)
+
+        arrays = RandomStrategy(n_trades=1000, holding=holding, seed=42).arrays(
+            universe
+        )
+        length = arrays.exit - arrays.entry
+
+        assert (length >= 1).all()
+        assert (arrays.exit < universe.index.size).all()
+        assert 5 < length.mean() < 15
+
+    def test_take_stop(self):
+        universe = make_randomwalk(seed=42)
+        strategy = RandomStrategy(n_trades=10, take=1.0, stop=-2.0, seed=42)
+        trades = strategy.run(universe, verbose=False).trades
+
+        assert all(t.take == 1.0 and t.stop == -2.0 for t in trades)
+        assert (strategy.arrays(universe).take == 1.0).all()
+        assert (strategy.arrays(universe).stop == -2.0).all()
+
+    def test_columnar(self):
+        universe = make_randomwalk(seed=42)
+        params = dict(n_trades=100, max_n_assets=3, take=0.1, stop=-0.1, seed=42)
+        strategy = RandomStrategy(columnar=True, **params).run(universe, verbose=False)
+        expected = RandomStrategy(**params).run(universe, verbose=False)
+
+        assert isinstance(strategy(universe), TradeArrays)
+        assert strategy.trade_arrays.n_trades == 100
+        assert not hasattr(strategy, "trades")
+        pd.testing.assert_frame_equal(
+            strategy.history(), expected.history(), check_dtype=False
+        )
+        pd.testing.assert_series_equal(strategy.wealth(), expected.wealth())
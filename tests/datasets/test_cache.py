@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from epymetheus.datasets import CachedReader
+from epymetheus.datasets import fetch_usstocks
+
+
+class FakeReader:
+    """
+    Local stand-in for a remote source of business-daily prices.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, ticker, begin_date, end_date):
+        self.calls.append((ticker, begin_date, end_date))
+        index = pd.bdate_range(begin_date, end_date)
+        seed = sum(map(ord, ticker))
+        values = 100 + np.random.default_rng(seed).random(10000)
+        offset = (index - pd.Timestamp("1990-01-01")).days
+        return pd.Series(values[offset], index=index, name=ticker)
+
+
+class TestCachedReader:
+    def test_cache(self, tmp_path):
+        fake = FakeReader()
+        reader = CachedReader(fake, tmp_path)
+
+        result = reader("A", "2000-01-01", "2000-03-01")
+        pd.testing.assert_series_equal(
+            result, fake("A", "2000-01-01", "2000-03-01"), check_freq=False
+        )
+        fake.calls.clear()
+
+        reader("A", "2000-01-10", "2000-02-01")
+        CachedReader(fake, tmp_path)("A", "2000-01-10", "2000-02-01")
+        assert fake.calls == []
+
+    def test_incremental(self, tmp_path):
+        fake = FakeReader()
+        reader = CachedReader(fake, tmp_path)
+        reader("A", "2000-02-01", "2000-03-01")
+        fake.calls.clear()
+
+        result = reader("A", "2000-01-01", "2000-04-01")
+        assert fake.calls == [
+            ("A", pd.Timestamp("2000-01-01"), pd.Timestamp("2000-01-31")),
+            ("A", pd.Timestamp("2000-03-02"), pd.Timestamp("2000-04-01")),
+        ]
+        pd.testing.assert_series_equal(
+            result, fake("A", "2000-01-01", "2000-04-01"), check_freq=False
+        )
+        assert reader.fetched_range("A") == (
+            pd.Timestamp("2000-01-01"),
+            pd.Timestamp("2000-04-01"),
+        )
+        assert "fetched_at" in CachedReader(fake, tmp_path).metadata["A"]
+
+    def test_missing_ranges(self, tmp_path):
+        reader = CachedReader(FakeReader(), tmp_path)
+        begin, end = pd.Timestamp("2000-01-01"), pd.Timestamp("2000-02-01")
+        assert reader.missing_ranges("A", begin, end) == [(begin, end)]
+
+        reader("A", begin, end)
+        assert reader.missing_ranges("A", begin, end) == []
+
+    def test_disjoint(self, tmp_path):
+        fake = FakeReader()
+        reader = CachedReader(fake, tmp_path)
+        reader("A", "2000-01-01", "2000-01-31")
+        reader("A", "2000-05-01", "2000-05-31")
+        fake.calls.clear()
+
+        result = reader("A", "2000-03-01", "2000-03-31")
+        assert fake.calls == [
+            ("A", pd.Timestamp("2000-03-01"), pd.Timestamp("2000-03-31"))
+        ]
+        pd.testing.assert_series_equal(
+            result, fake("A", "2000-03-01", "2000-03-31"), check_freq=False
+        )
+        fake.calls.clear()
+
+        reader("A", "2000-01-15", "2000-06-15")
+        assert fake.calls == [
+            ("A", pd.Timestamp("2000-02-01"), pd.Timestamp("2000-02-29")),
+            ("A", pd.Timestamp("2000-04-01"), pd.Timestamp("2000-04-30")),
+            ("A", pd.Timestamp("2000-06-01"), pd.Timestamp("2000-06-15")),
+        ]
+        assert CachedReader(fake, tmp_path).fetched_ranges("A") == [
+            (pd.Timestamp("2000-01-01"), pd.Timestamp("2000-06-15"))
+        ]
+
+
+class TestFetchUSStocks:
+    @pytest.mark.parametrize("cache", [True, False])
+    def test_reader(self, tmp_path, cache):
+        fake = FakeReader()
+        cache_dir = tmp_path if cache else None
+        universe = fetch_usstocks(
+            "2000-01-01", "2000-12-31", n_assets=3, reader=fake, cache_dir=cache_dir
+        )
+
+        assert universe.shape == (364, 3)
+        assert not np.isnan(universe.values).any()
+
+        fake.calls.clear()
+        result = fetch_usstocks(
+            "2000-01-01", "2000-12-31", n_assets=3, reader=fake, cache_dir=cache_dir
+        )
+        assert len(fake.calls) == (0 if cache else 3)
+        pd.testing.assert_frame_equal(result, universe)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from epymetheus.datasets import PriceStore
+
+
+@pytest.fixture
+def universe():
+    np.random.seed(42)
+    index = pd.date_range("2000-01-01", periods=100)
+    return pd.DataFrame(
+        np.random.rand(100, 3), index=index, columns=["A", "B.C", "D/E"]
+    )
+
+
+class TestPriceStore:
+    def test_roundtrip(self, tmp_path, universe):
+        PriceStore(tmp_path).write_frame(universe)
+        result = PriceStore(tmp_path).load()
+
+        assert PriceStore(tmp_path).assets == ["A", "B.C", "D/E"]
+        pd.testing.assert_frame_equal(result, universe, check_freq=False)
+
+    def test_subset(self, tmp_path, universe):
+        store = PriceStore(tmp_path)
+        store.write_frame(universe)
+
+        result = store.load(["D/E", "A"], begin="2000-01-10", end="2000-02-01")
+        expected = universe.loc["2000-01-10":"2000-02-01", ["D/E", "A"]]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_fill(self, tmp_path, universe):
+        store = PriceStore(tmp_path)
+        store.write("A", universe["A"])
+        store.write("B", universe["B.C"].iloc[::3])
+
+        result = store.load(begin="2000-01-02")
+        assert_allclose(result["B"].values, universe["B.C"].iloc[::3].repeat(3)[1:100])
+
+        result = store.load(begin="2000-01-02", fill=False)
+        assert result["B"].isna().sum() == 66
+
+    def test_merge(self, tmp_path, universe):
+        store = PriceStore(tmp_path)
+        store.write("A", universe["A"].iloc[:60])
+        store.write("A", universe["A"].iloc[40:] + 1.0)
+
+        result = store.read("A")
+        assert_allclose(result.iloc[:40], universe["A"].iloc[:40])
+        assert_allclose(result.iloc[40:], universe["A"].iloc[40:] + 1.0)
+        assert store.date_range("A") == (universe.index[0], universe.index[-1])
+
+        store.write("A", universe["A"].iloc[:10], overwrite=True)
+        assert store.read("A").size == 10
+
+    def test_keyerror(self, tmp_path):
+        with pytest.raises(KeyError):
+            PriceStore(tmp_path).load(["A"])
@@ -1,5 +1,10 @@
+import threading
+import time
+
 import numpy as np
+import pandas as pd
 import pytest  # noqa: F401
+from numpy.testing import assert_array_equal
 from pandas_datareader._utils import RemoteDataError
 
 from epymetheus.datasets import fetch_usstocks
@@ -22,3 +27,63 @@ def test_usstocks():
         assert not np.isnan(universe.values).any(axis=None)
     except RemoteDataError as e:
         print("Skip", e)
+
+
+class SlowReader:
+    """
+    Local stand-in for a remote source that records concurrent calls
+    and fails the first `n_failures` calls of each ticker.
+    """
+
+    def __init__(self, delay=0.05, n_failures=0):
+        self.delay = delay
+        self.n_failures = n_failures
+        self.n_calls = {}
+        self.n_running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, ticker, begin_date, end_date):
+        with self.lock:
+            self.n_calls[ticker] = self.n_calls.get(ticker, 0) + 1
+            n_calls = self.n_calls[ticker]
+            self.n_running += 1
+            self.max_running = max(self.max_running, self.n_running)
+        # Tickers later in order return earlier
+        time.sleep(self.delay / len(ticker))
+        with self.lock:
+            self.n_running -= 1
+
+        if n_calls <= self.n_failures:
+            raise ConnectionError
+        index = pd.bdate_range(begin_date, end_date)
+        return pd.Series(float(sum(map(ord, ticker))), index=index)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 4])
+def test_n_jobs(n_jobs):
+    reader = SlowReader()
+    universe = fetch_usstocks(
+        "2000-01-01", "2000-01-31", n_assets=8, reader=reader, n_jobs=n_jobs
+    )
+    expected = fetch_usstocks("2000-01-01", "2000-01-31", n_assets=8, reader=reader)
+
+    pd.testing.assert_frame_equal(universe, expected)
+    assert reader.max_running <= n_jobs
+    assert reader.max_running > 1 or n_jobs == 1
+    assert_array_equal(universe.iloc[0], [sum(map(ord, c)) for c in universe.columns])
+
+
+def test_retry():
+    reader = SlowReader(delay=0.0, n_failures=2)
+    universe = fetch_usstocks(
+        "2000-01-01", "2000-01-31", n_assets=3, reader=reader, backoff=0.0, n_jobs=2
+    )
+    assert universe.shape[1] == 3
+    assert all(n == 3 for n in reader.n_calls.values())
+
+    reader = SlowReader(delay=0.0, n_failures=2)
+    with pytest.raises(ConnectionError):
+        fetch_usstocks(
+            "2000-01-01", "2000-01-31", n_assets=3, reader=reader, max_retries=1
+        )
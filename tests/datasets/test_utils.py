@@ -1,6 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest  # noqa: F401
+from numpy.testing import assert_allclose
 
+from epymetheus.datasets import fetch_usstocks
+from epymetheus.datasets._utils import align
 from epymetheus.datasets._utils import fill_and_cut
 
 
@@ -20,3 +24,64 @@ def test_fill_and_cut():
     )
 
     assert_series_equal(fill_and_cut(series, "2000-01-01"), series_expected)
+
+
+@pytest.mark.parametrize("fill", [True, False])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_align(fill, seed):
+    rng = np.random.default_rng(seed)
+    series = [
+        pd.Series(rng.random(n), index=np.sort(rng.choice(100, n, replace=False)))
+        for n in (0, 1, 10, 50, 100)
+    ]
+    calendar = np.arange(-5, 110, 2)
+
+    result = align(
+        [s.index.values for s in series], [s.values for s in series], calendar, fill
+    )
+    method = "ffill" if fill else None
+    expected = np.stack(
+        [s.reindex(calendar, method=method).values for s in series], axis=1
+    )
+    assert_allclose(result, expected)
+
+
+def test_align_fill_after():
+    times = [np.array([0, 3]), np.array([5])]
+    values = [np.array([1.0, 2.0]), np.array([3.0])]
+
+    result = align(times, values, np.arange(8), fill_after=False)
+    expected = np.array(
+        [
+            [1.0, 1.0, 1.0, 2.0, np.nan, np.nan, np.nan, np.nan],
+            [np.nan, np.nan, np.nan, np.nan, np.nan, 3.0, np.nan, np.nan],
+        ]
+    ).T
+    assert_allclose(result, expected)
+
+
+def test_fetch_usstocks_align():
+    """
+    Aligned universe is the same as the one made by `fill_and_cut`.
+    """
+    rng = np.random.default_rng(42)
+    index = pd.bdate_range("1999-12-01", "2000-03-01")
+    prices = {
+        ticker: pd.Series(rng.random(index.size), index=index)
+        .sample(frac=0.5, random_state=i)
+        .sort_index()
+        for i, ticker in enumerate(["AAPL", "MSFT", "AMZN"])
+    }
+    prices["MSFT"] = prices["MSFT"][:"2000-02-01"]
+
+    def reader(ticker, begin_date, end_date):
+        return prices[ticker][begin_date:end_date]
+
+    result = fetch_usstocks("2000-01-01", "2000-03-01", n_assets=3, reader=reader)
+    expected = pd.DataFrame(
+        {
+            ticker: fill_and_cut(price["1999-12-22":], begin_date="2000-01-01")
+            for ticker, price in prices.items()
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
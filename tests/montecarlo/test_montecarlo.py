@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from epymetheus import create_strategy
+from epymetheus import trade
+from epymetheus.batch import Target
+from epymetheus.batch import TradeArrays
+from epymetheus.benchmarks import BuyAndHold
+from epymetheus.benchmarks import DeterminedStrategy
+from epymetheus.datasets import make_randomwalk
+from epymetheus.montecarlo import run_montecarlo
+from epymetheus.stochastic import generate_geometric_brownian
+
+metrics = ("final_wealth", "max_drawdown", "num_win", "avg_pnl")
+
+
+class TestRunMontecarlo:
+    def test_shape(self):
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+        result = run_montecarlo(strategy, n_paths=5, n_steps=20, n_assets=3)
+
+        assert isinstance(result, pd.DataFrame)
+        assert result.shape == (5, 2)
+
+    @pytest.mark.parametrize(
+        "bars, assets",
+        [
+            (pd.RangeIndex(20), np.array(["A", "B", "C"])),
+            (pd.date_range("2000-01-01", periods=20), pd.Index(["A", "B", "C"])),
+            (list(range(20)), ["A", "B", "C"]),
+        ],
+    )
+    def test_bars_assets(self, bars, assets):
+        strategy = BuyAndHold({"A": 0.5, "B": 0.5})
+        kwargs = dict(n_paths=3, n_steps=20, n_assets=3, seed=42)
+
+        result = run_montecarlo(strategy, bars=bars, assets=assets, **kwargs)
+        expected = run_montecarlo(BuyAndHold({"0": 0.5, "1": 0.5}), **kwargs)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_bars_assets_length(self):
+        strategy = BuyAndHold({"0": 1.0})
+
+        with pytest.raises(ValueError):
+            run_montecarlo(strategy, n_steps=20, bars=pd.RangeIndex(10))
+        with pytest.raises(ValueError):
+            run_montecarlo(strategy, n_assets=3, assets=["0", "1"])
+
+    def test_paths(self):
+        """
+        Each row is the metrics of a backtesting on the corresponding path.
+        """
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+
+        np.random.seed(42)
+        result = run_montecarlo(
+            strategy, n_paths=4, n_steps=20, n_assets=3, metrics=metrics
+        )
+
+        np.random.seed(42)
+        prices = generate_geometric_brownian(20, 4 * 3, 0.01).reshape(20, 4, 3)
+        for i in range(4):
+            universe = pd.DataFrame(prices[:, i], columns=["0", "1", "2"])
+            strategy.run(universe, verbose=False)
+            expected = [strategy.score(m) for m in metrics]
+            assert_allclose(result.iloc[i].values, expected)
+
+    def test_batch_trades(self):
+        trades = [
+            trade("0", entry=1, exit=15, take=0.01, stop=-0.01),
+            [1.0, -2.0] * trade(["1", "2"], entry=3),
+        ]
+        strategy = DeterminedStrategy(trades)
+
+        np.random.seed(42)
+        result = run_montecarlo(
+            strategy, n_paths=10, n_steps=20, n_assets=3, metrics=metrics
+        )
+        np.random.seed(42)
+        expected = run_montecarlo(
+            strategy,
+            n_paths=10,
+            n_steps=20,
+            n_assets=3,
+            metrics=metrics,
+            batch_trades=True,
+        )
+
+        assert_allclose(result, expected)
+
+    @pytest.mark.parametrize("batch_trades", [True, False])
+    @pytest.mark.parametrize("kind", ["frame", "arrays"])
+    def test_columnar(self, batch_trades, kind):
+        trades = [
+            trade("0", entry=1, exit=15, take=0.01, stop=-0.01),
+            [1.0, -2.0] * trade(["1", "2"], entry=3),
+        ]
+        universe = make_randomwalk(20, 3)
+        arrays = TradeArrays.from_trades(trades, universe)
+        returned = arrays
+        if kind == "frame":
+            returned = pd.DataFrame(
+                {
+                    "trade_id": arrays.trade_id,
+                    "asset": universe.columns[arrays.asset],
+                    "lot": arrays.lot,
+                    "entry": arrays.entry[arrays.trade_id],
+                    "exit": arrays.exit[arrays.trade_id],
+                    "take": arrays.take[arrays.trade_id],
+                    "stop": arrays.stop[arrays.trade_id],
+                }
+            )
+        kwargs = dict(
+            n_steps=20, n_assets=3, metrics=metrics, batch_trades=batch_trades
+        )
+
+        np.random.seed(42)
+        result = run_montecarlo(DeterminedStrategy(returned), n_paths=5, **kwargs)
+        np.random.seed(42)
+        expected = run_montecarlo(DeterminedStrategy(trades), n_paths=5, **kwargs)
+
+        assert_allclose(result, expected)
+
+    @pytest.mark.parametrize("batch_trades", [True, False])
+    def test_target(self, batch_trades):
+        holdings = np.zeros((20, 3))
+        holdings[1:15, 0], holdings[3:, 1] = 1.0, -2.0
+        strategy = create_strategy(lambda universe: Target(holdings))
+        trades = [trade("0", entry=1, exit=15), -2.0 * trade("1", entry=3)]
+        kwargs = dict(
+            n_steps=20, n_assets=3, metrics=metrics, batch_trades=batch_trades
+        )
+
+        np.random.seed(42)
+        result = run_montecarlo(strategy, n_paths=5, **kwargs)
+        np.random.seed(42)
+        expected = run_montecarlo(DeterminedStrategy(trades), n_paths=5, **kwargs)
+
+        assert_allclose(result, expected)
+
+    @pytest.mark.parametrize("batch_trades", [True, False])
+    def test_n_jobs(self, batch_trades):
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+
+        np.random.seed(42)
+        result = run_montecarlo(
+            strategy, n_paths=10, n_steps=20, batch_trades=batch_trades, n_jobs=2
+        )
+        np.random.seed(42)
+        expected = run_montecarlo(
+            strategy, n_paths=10, n_steps=20, batch_trades=batch_trades, n_jobs=1
+        )
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("batch_trades", [True, False])
+    @pytest.mark.parametrize("n_jobs", [2, 3])
+    def test_seed(self, batch_trades, n_jobs):
+        """
+        Parallel output is identical to serial output if seed is given.
+        """
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+        kwargs = dict(n_paths=10, n_steps=20, batch_trades=batch_trades, seed=42)
+
+        result = run_montecarlo(strategy, n_jobs=n_jobs, **kwargs)
+        expected = run_montecarlo(strategy, n_jobs=1, **kwargs)
+
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+    def test_seed_paths(self):
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+        result = run_montecarlo(strategy, n_paths=3, n_steps=20, n_assets=3, seed=42)
+
+        for i, seed in enumerate(np.random.SeedSequence(42).spawn(3)):
+            universe = make_randomwalk(20, 3, seed=seed)
+            strategy.run(universe, verbose=False)
+            expected = [strategy.score(m) for m in result.columns]
+            assert_allclose(result.iloc[i].values, expected)
+
+    def test_antithetic(self):
+        """
+        Antithetic paths of a linear strategy have opposite log returns.
+        """
+        strategy = BuyAndHold({"0": 1.0})
+        result = run_montecarlo(
+            strategy,
+            n_paths=6,
+            n_steps=20,
+            n_assets=2,
+            volatility=0.1,
+            seed=42,
+            method="antithetic",
+            metrics=("final_wealth",),
+        )
+
+        log_return = np.log(1 + result["final_wealth"].values)
+        assert_allclose(log_return[:3], -log_return[3:] - 0.01 * 19)
+
+    def test_antithetic_odd(self):
+        strategy = BuyAndHold({"0": 1.0})
+        with pytest.raises(ValueError):
+            run_montecarlo(strategy, n_paths=5, n_steps=20, method="antithetic")
+
+    @pytest.mark.parametrize("n_jobs", [2, 3])
+    def test_antithetic_n_jobs(self, n_jobs):
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+        kwargs = dict(n_paths=10, n_steps=20, seed=42, method="antithetic")
+
+        result = run_montecarlo(strategy, n_jobs=n_jobs, **kwargs)
+        expected = run_montecarlo(strategy, n_jobs=1, **kwargs)
+
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+    @pytest.mark.parametrize("batch_trades", [True, False])
+    def test_float32(self, batch_trades):
+        strategy = BuyAndHold({"0": 0.5, "1": 0.5})
+        kwargs = dict(n_paths=4, n_steps=20, batch_trades=batch_trades)
+
+        np.random.seed(42)
+        result = run_montecarlo(strategy, dtype=np.float32, **kwargs)
+        np.random.seed(42)
+        expected = run_montecarlo(strategy, **kwargs)
+
+        assert_allclose(result, expected, atol=1e-5)
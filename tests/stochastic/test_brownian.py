@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+from numpy.lib.format import open_memmap
+from numpy.testing import assert_allclose
+from numpy.testing import assert_equal
+
+from epymetheus.stochastic import generate_brownian
+from epymetheus.stochastic import generate_geometric_brownian
+from epymetheus.stochastic import iter_brownian
+from epymetheus.stochastic import iter_geometric_brownian
+
+
+class TestBrownian:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000])
+    def test_chunk(self, chunk_size):
+        result = generate_brownian(
+            100, 5, 0.01, drift=0.001, rng=np.random.default_rng(42)
+        )
+        expected = np.concatenate(
+            list(
+                iter_brownian(
+                    100,
+                    5,
+                    0.01,
+                    drift=0.001,
+                    rng=np.random.default_rng(42),
+                    chunk_size=chunk_size,
+                )
+            )
+        )
+
+        assert_allclose(result, expected)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_chunk_geometric(self, chunk_size):
+        result = generate_geometric_brownian(
+            100, 5, 0.01, rng=np.random.default_rng(42)
+        )
+        expected = generate_geometric_brownian(
+            100, 5, 0.01, rng=np.random.default_rng(42), chunk_size=chunk_size
+        )
+
+        assert_allclose(result, expected)
+
+    def test_chunk_global_state(self):
+        np.random.seed(42)
+        result = generate_brownian(100, 5, 0.01)
+        np.random.seed(42)
+        expected = np.concatenate(list(iter_brownian(100, 5, 0.01, chunk_size=7)))
+
+        assert_allclose(result, expected)
+
+    def test_init_value(self):
+        result = generate_brownian(10, 3, 0.01, init_value=2.0)
+        assert_equal(result[0], [2.0, 2.0, 2.0])
+        result = generate_geometric_brownian(10, 3, 0.01, init_value=2.0)
+        assert_equal(result[0], [2.0, 2.0, 2.0])
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_dtype(self, dtype):
+        rng = np.random.default_rng(42)
+        result = generate_geometric_brownian(100, 5, 0.01, rng=rng, dtype=dtype)
+        assert result.dtype == dtype
+
+        for chunk in iter_geometric_brownian(100, 5, 0.01, rng=rng, dtype=dtype):
+            assert chunk.dtype == dtype
+
+    def test_out(self, tmp_path):
+        out = open_memmap(tmp_path / "paths.npy", "w+", np.float64, (100, 5))
+        result = generate_geometric_brownian(
+            100, 5, 0.01, rng=np.random.default_rng(42), out=out, chunk_size=10
+        )
+        expected = generate_geometric_brownian(
+            100, 5, 0.01, rng=np.random.default_rng(42)
+        )
+
+        assert result is out
+        assert_allclose(np.load(tmp_path / "paths.npy"), expected)
+
+    def test_out_noncontiguous(self):
+        out = np.empty((5, 100)).T
+        result = generate_brownian(100, 5, 0.01, rng=np.random.default_rng(42), out=out)
+
+        assert result is out
+        assert not np.isnan(result).any()
+
+
+class TestVarianceReduction:
+    def test_antithetic(self):
+        paths = generate_brownian(
+            100, 6, 0.01, rng=np.random.default_rng(42), method="antithetic"
+        )
+        assert_allclose(paths[:, :3], -paths[:, 3:])
+
+    def test_antithetic_odd(self):
+        paths = generate_brownian(
+            100, 5, 0.01, rng=np.random.default_rng(42), method="antithetic"
+        )
+        assert_allclose(paths[:, :2], -paths[:, 2:4])
+        assert not np.allclose(paths[:, 4], 0.0)
+
+    def test_antithetic_geometric_mean(self):
+        paths = generate_geometric_brownian(
+            10, 2, 0.1, rng=np.random.default_rng(42), method="antithetic"
+        )
+        assert_allclose(
+            np.log(paths[:, 0]), -np.log(paths[:, 1]) - 0.01 * np.arange(10)
+        )
+
+    def test_sobol(self):
+        pytest.importorskip("scipy.stats.qmc")
+
+        paths = generate_brownian(
+            20, 2 ** 10, 1.0, rng=np.random.default_rng(42), method="sobol"
+        )
+        increments = np.diff(paths, axis=0)
+        assert paths.shape == (20, 2 ** 10)
+        assert_allclose(increments.mean(axis=1), 0.0, atol=0.01)
+        assert_allclose(increments.std(axis=1), 1.0, atol=0.05)
+
+    def test_sobol_chunk(self):
+        pytest.importorskip("scipy.stats.qmc")
+
+        paths = generate_brownian(
+            20, 16, 1.0, rng=np.random.default_rng(42), method="sobol", chunk_size=7
+        )
+        assert np.isfinite(paths).all()
+
+    def test_sobol_max_dims(self):
+        """
+        Time steps beyond the maximum dimensionality of scipy are drawn
+        from another scrambled sequence.
+        """
+        pytest.importorskip("scipy.stats.qmc")
+
+        paths = generate_brownian(
+            30000, 4, 1.0, rng=np.random.default_rng(42), method="sobol"
+        )
+        increments = np.diff(paths, axis=0)
+        assert paths.shape == (30000, 4)
+        assert np.isfinite(paths).all()
+        assert not np.allclose(increments[:8000], increments[21200:29200])
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            generate_brownian(10, 2, 0.01, method="foo")
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from epymetheus.stochastic import generate_correlated_geometric_brownian
+from epymetheus.stochastic import generate_merton_jump_diffusion
+from epymetheus.stochastic import generate_ornstein_uhlenbeck
+from epymetheus.stochastic import generate_regime_switching
+
+generators = [
+    lambda **kwargs: generate_correlated_geometric_brownian(
+        100, np.diag([1e-4, 2e-4, 3e-4]), **kwargs
+    ),
+    lambda **kwargs: generate_merton_jump_diffusion(
+        100, 3, 0.01, 0.1, jump_mean=-0.05, jump_std=0.01, **kwargs
+    ),
+    lambda **kwargs: generate_regime_switching(
+        100, 3, [0.01, 0.05], [0.0, -0.01], [[0.9, 0.1], [0.2, 0.8]], **kwargs
+    ),
+    lambda **kwargs: generate_ornstein_uhlenbeck(100, 3, 0.1, 0.5, **kwargs),
+]
+
+
+class TestProcesses:
+    @pytest.mark.parametrize("generate", generators)
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_chunk(self, generate, chunk_size):
+        result = generate(rng=42, chunk_size=chunk_size)
+        expected = generate(rng=42)
+
+        assert result.shape == (100, 3)
+        assert_allclose(result, expected)
+
+    @pytest.mark.parametrize("generate", generators)
+    def test_out(self, generate):
+        out = np.empty((100, 3))
+        result = generate(rng=42, out=out, chunk_size=10)
+
+        assert result is out
+        assert_allclose(result, generate(rng=42))
+
+    @pytest.mark.parametrize("generate", generators)
+    def test_global_state(self, generate):
+        np.random.seed(42)
+        result = generate()
+        np.random.seed(42)
+        expected = generate()
+
+        assert_allclose(result, expected)
+
+    @pytest.mark.parametrize("block_size", [1, 2, 256])
+    def test_correlated(self, block_size):
+        rng = np.random.default_rng(42)
+        a = rng.standard_normal((5, 5))
+        cov = 1e-4 * (a @ a.T + np.eye(5))
+
+        paths = generate_correlated_geometric_brownian(
+            100000, cov, rng=42, block_size=block_size
+        )
+        result = np.cov(np.diff(np.log(paths), axis=0).T)
+
+        assert_allclose(result, cov, atol=2e-5)
+
+    def test_correlated_cholesky(self):
+        cov = np.array([[1e-4, 5e-5], [5e-5, 1e-4]])
+        result = generate_correlated_geometric_brownian(
+            100, cholesky=np.linalg.cholesky(cov), rng=42
+        )
+        expected = generate_correlated_geometric_brownian(100, cov, rng=42)
+
+        assert_allclose(result, expected)
+
+    def test_merton_no_jump(self):
+        paths = generate_merton_jump_diffusion(1000, 3, 0.01, 0.0, rng=42)
+        returns = np.diff(np.log(paths), axis=0)
+
+        assert np.abs(returns).max() < 0.1
+
+    def test_regime_common(self):
+        """
+        Paths with zero volatility move together if regime is common.
+        """
+        paths = generate_regime_switching(
+            100, 3, [0.0, 0.0], [0.01, -0.01], [[0.5, 0.5], [0.5, 0.5]], common=True
+        )
+
+        assert_allclose(paths[:, 0], paths[:, 1])
+        assert_allclose(paths[:, 0], paths[:, 2])
+
+    def test_ornstein_uhlenbeck(self):
+        paths = generate_ornstein_uhlenbeck(
+            100000, 2, 0.1, 0.5, mean=1.0, init_value=1.0, rng=42
+        )
+        expected_std = 0.1 / np.sqrt(2 * 0.5)
+
+        assert_allclose(paths.mean(axis=0), 1.0, atol=0.01)
+        assert_allclose(paths.std(axis=0), expected_std, rtol=0.05)
@@ -1,12 +1,16 @@
 import numpy as np
 import pandas as pd
 import pytest
+from numpy.testing import assert_allclose
 from numpy.testing import assert_equal
 
 from epymetheus import Strategy
 from epymetheus import create_strategy
 from epymetheus import trade
 from epymetheus import ts
+from epymetheus.batch import Target
+from epymetheus.batch import TradeArrays
+from epymetheus.batch import signal_to_trades
 from epymetheus.benchmarks import DeterminedStrategy
 from epymetheus.benchmarks import RandomStrategy
 from epymetheus.datasets import make_randomwalk
@@ -194,6 +198,19 @@ class TestStrategy:
         assert_equal(strategy.net_exposure().values, ts.net_exposure(trades, universe))
         assert_equal(strategy.abs_exposure().values, ts.abs_exposure(trades, universe))
 
+    def test_run_dtype(self):
+        universe = make_randomwalk()
+        strategy = RandomStrategy(seed=42).run(universe, dtype=np.float32)
+
+        assert strategy.universe.dtypes.eq(np.float32).all()
+        assert strategy.wealth().dtype == np.float32
+        assert strategy.abs_exposure().dtype == np.float32
+
+        expected = RandomStrategy(seed=42).run(universe).wealth()
+        pd.testing.assert_series_equal(
+            strategy.wealth(), expected, check_dtype=False, atol=1e-5
+        )
+
     def test_notrunerror(self):
         strategy = RandomStrategy()
         with pytest.raises(NotRunError):
@@ -393,3 +410,369 @@ class TestStrategy:
 
 #     for attr in ('lot', 'gains'):
 #         assert_mul(history_1, history_a, attr, a)
+
+
+class TestRunArrays:
+    """
+    Trades given as a table are executed without `Trade` objects.
+    """
+
+    def run_both(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = RandomStrategy(
+            n_trades=50, max_n_assets=3, min_lot=-1.0, take=0.05, stop=-0.05, seed=42
+        )
+        expected = strategy.run(universe, verbose=False)
+        result = DeterminedStrategy(strategy.arrays(universe))
+        result.run(universe, verbose=False)
+        return result, expected
+
+    def test_attributes(self):
+        result, _ = self.run_both()
+
+        assert not hasattr(result, "trades")
+        assert result.trade_arrays.n_trades == 50
+        assert result.trade_close.shape == (50,)
+
+    def test_ts(self):
+        result, expected = self.run_both()
+
+        for name in ("wealth", "drawdown", "net_exposure", "abs_exposure"):
+            pd.testing.assert_series_equal(
+                getattr(result, name)(), getattr(expected, name)(), atol=1e-10
+            )
+
+    @pytest.mark.parametrize("metric", metrics)
+    def test_score(self, metric):
+        result, expected = self.run_both()
+        name = metric.__name__
+
+        assert result.score(name) == pytest.approx(expected.score(name))
+
+    def test_history(self):
+        result, expected = self.run_both()
+
+        pd.testing.assert_frame_equal(
+            result.history(), expected.history(), check_dtype=False
+        )
+
+    def test_frame(self):
+        result, expected = self.run_both()
+        frame = expected.history()[["trade_id", "asset", "lot", "entry", "exit"]]
+        frame = frame.assign(take=0.05, stop=-0.05).sample(frac=1, random_state=42)
+        strategy = DeterminedStrategy(frame).run(expected.universe, verbose=False)
+
+        pd.testing.assert_series_equal(strategy.wealth(), expected.wealth())
+        assert (strategy.trade_close == result.trade_close).all()
+
+    def test_rerun(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = DeterminedStrategy([trade("0")]).run(universe, verbose=False)
+        strategy._trades = pd.DataFrame({"asset": ["0"]})
+        strategy.run(universe, verbose=False)
+
+        assert not hasattr(strategy, "trades")
+        assert strategy.score("num_win") + strategy.score("num_lose") == 1
+
+    def test_notradeerror(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = DeterminedStrategy(pd.DataFrame({"asset": []}))
+
+        with pytest.raises(NoTradeError):
+            strategy.run(universe, verbose=False)
+
+
+class TestBacktest:
+    """
+    `backtest` leaves the strategy unchanged and returns an immutable result.
+    """
+
+    def make_strategy(self):
+        return RandomStrategy(
+            n_trades=50, max_n_assets=3, min_lot=-1.0, take=0.05, stop=-0.05, seed=42
+        )
+
+    @pytest.mark.parametrize("metric", metrics)
+    def test_run(self, metric):
+        universe = make_randomwalk(100, 10, seed=42)
+        result = self.make_strategy().backtest(universe)
+        expected = self.make_strategy().run(universe, verbose=False)
+        name = metric.__name__
+
+        pd.testing.assert_frame_equal(
+            result.history(), expected.history(), check_dtype=False
+        )
+        for series in ("wealth", "net_exposure", "abs_exposure"):
+            pd.testing.assert_series_equal(
+                getattr(result, series)(), getattr(expected, series)(), atol=1e-10
+            )
+        assert result.score(name) == pytest.approx(expected.score(name))
+        assert result.score("max_drawdown") == pytest.approx(
+            expected.score("max_drawdown")
+        )
+
+    @pytest.mark.parametrize("path", ["frame", "arrays", "backtest"])
+    def test_no_entry(self, path):
+        """
+        Trades without entry enter at the first bar in every path.
+        """
+        universe = make_randomwalk(100, 10, seed=42)
+        trades = [trade("0", exit=50), -trade("1"), trade(["2", "3"], take=0.01)]
+        expected = DeterminedStrategy(trades).run(universe, verbose=False)
+
+        if path == "frame":
+            frame = pd.DataFrame(
+                {
+                    "trade_id": [0, 1, 2, 2],
+                    "asset": ["0", "1", "2", "3"],
+                    "lot": [1.0, -1.0, 1.0, 1.0],
+                    "exit": [50, None, None, None],
+                    "take": [None, None, 0.01, 0.01],
+                }
+            )
+            result = DeterminedStrategy(frame).run(universe, verbose=False)
+        elif path == "arrays":
+            arrays = TradeArrays.from_trades(trades, universe)
+            result = DeterminedStrategy(arrays).run(universe, verbose=False)
+        else:
+            result = DeterminedStrategy(trades).backtest(universe)
+
+        assert result.score("final_wealth") == pytest.approx(
+            expected.score("final_wealth")
+        )
+        assert expected.score("final_wealth") == pytest.approx(
+            expected.wealth().iloc[-1]
+        )
+        for series in ("wealth", "net_exposure", "abs_exposure"):
+            pd.testing.assert_series_equal(
+                getattr(result, series)(), getattr(expected, series)(), atol=1e-10
+            )
+        assert_allclose(result.history()["pnl"], expected.history()["pnl"])
+
+    def test_unchanged(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        trades = [trade("0", take=0.01), -trade("1")]
+        strategy = DeterminedStrategy(trades)
+        f_strategy = create_strategy(lambda universe: trades)
+        attributes = (dict(vars(strategy)), dict(vars(f_strategy)))
+
+        strategy.backtest(universe)
+        f_strategy.backtest(universe)
+
+        assert (dict(vars(strategy)), dict(vars(f_strategy))) == attributes
+        assert all(not hasattr(t, "close") for t in trades)
+
+    def test_target(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        weight = pd.DataFrame(0.1, index=universe.index, columns=universe.columns)
+        strategy = create_strategy(lambda universe: Target(weight, by="weight"))
+
+        result = strategy.backtest(universe)
+        expected = strategy.run(universe, verbose=False)
+
+        pd.testing.assert_series_equal(result.wealth(), expected.wealth())
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        universes = [make_randomwalk(100, 10, seed=i) for i in range(8)]
+        strategy = create_strategy(
+            lambda universe, n: RandomStrategy(n_trades=n, seed=0)(universe), n=100
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(strategy.backtest, universes))
+
+        for universe, result in zip(universes, results):
+            expected = strategy.run(universe, verbose=False)
+            pd.testing.assert_series_equal(result.wealth(), expected.wealth())
+
+    def test_immutable(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        result = self.make_strategy().backtest(universe)
+
+        with pytest.raises(AttributeError):
+            result.index = None
+        with pytest.raises(TypeError):
+            result.arrays["wealth"] = None
+        with pytest.raises(ValueError):
+            result.arrays["wealth"][0] = 1.0
+
+    def test_notradeerror(self):
+        universe = make_randomwalk(100, 10, seed=42)
+
+        with pytest.raises(NoTradeError):
+            DeterminedStrategy([]).backtest(universe)
+
+
+class TestRunTarget:
+    """
+    Target positions are evaluated by matrix operations of holdings.
+    """
+
+    def run_both(self, by="lot"):
+        universe = make_randomwalk(100, 10, seed=42)
+        np.random.seed(42)
+        values = np.random.choice([0.0, 1.0, -2.0], size=(100, 10))
+        values = pd.DataFrame(values[np.arange(100) // 5 * 5], columns=universe.columns)
+        target = Target(values, by=by)
+
+        result = create_strategy(lambda universe: target)
+        result.run(universe, verbose=False)
+        lots = pd.DataFrame(target.lots(universe), columns=universe.columns)
+        expected = DeterminedStrategy(signal_to_trades(lots))
+        expected.run(universe, verbose=False)
+        return result, expected
+
+    @pytest.mark.parametrize("by", ["lot", "weight"])
+    def test_wealth(self, by):
+        result, expected = self.run_both(by)
+
+        pd.testing.assert_series_equal(result.wealth(), expected.wealth())
+        pd.testing.assert_series_equal(result.drawdown(), expected.drawdown())
+
+    def test_exposure(self):
+        result, _ = self.run_both()
+        value = result.holdings * result.universe.values
+
+        assert_equal(result.net_exposure().values, value.sum(1))
+        assert_equal(result.abs_exposure().values, np.abs(value).sum(1))
+
+    @pytest.mark.parametrize("metric", metrics)
+    def test_score(self, metric):
+        result, expected = self.run_both()
+        name = metric.__name__
+
+        assert result.score(name) == pytest.approx(expected.score(name))
+
+    def test_history(self):
+        result, expected = self.run_both()
+
+        pd.testing.assert_frame_equal(result.history(), expected.history())
+
+    def test_turnover(self):
+        result, expected = self.run_both()
+
+        assert result.turnover().index.equals(result.universe.index)
+        with pytest.raises(NotRunError):
+            expected.turnover()
+
+    def test_call(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        target = Target(np.ones((100, 10)))
+        strategy = create_strategy(lambda universe: target)
+
+        assert strategy(universe) is target
+
+    def test_rerun(self):
+        result, _ = self.run_both()
+        result._f = lambda universe: [trade("0")]
+        result.run(result.universe, verbose=False)
+
+        assert not hasattr(result, "holdings")
+        assert len(result.trades) == 1
+
+    def test_notradeerror(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = create_strategy(lambda universe: Target(np.zeros((100, 10))))
+
+        with pytest.raises(NoTradeError):
+            strategy.run(universe, verbose=False)
+
+
+class TestByAsset:
+    def make_strategy(self, mode):
+        bars = list(pd.date_range("2000-01-01", periods=100))
+        universe = make_randomwalk(100, 10, bars=bars, seed=42)
+        strategy = RandomStrategy(
+            n_trades=30, max_n_assets=3, min_lot=-1.0, take=0.05, seed=42
+        )
+        if mode == "trades":
+            return strategy.run(universe, verbose=False)
+        if mode == "arrays":
+            strategy = DeterminedStrategy(strategy.arrays(universe))
+            return strategy.run(universe, verbose=False)
+        if mode == "target":
+            np.random.seed(42)
+            values = np.random.choice([0.0, 1.0, -2.0], size=(100, 10))
+            target = Target(values[np.arange(100) // 5 * 5])
+            return create_strategy(lambda universe: target).run(universe, verbose=False)
+
+    @pytest.mark.parametrize("mode", ["trades", "arrays", "target"])
+    def test_sum(self, mode):
+        strategy = self.make_strategy(mode)
+
+        pnl = strategy.pnl_by_asset()
+        assert pnl.shape == strategy.universe.shape
+        assert_allclose(pnl.sum(axis=1).cumsum(), strategy.wealth(), atol=1e-10)
+
+        assert_allclose(
+            strategy.exposure_by_asset().sum(axis=1),
+            strategy.net_exposure(),
+            atol=1e-10,
+        )
+        assert_allclose(
+            strategy.exposure_by_asset(net=False).sum(axis=1),
+            strategy.abs_exposure(),
+            atol=1e-10,
+        )
+
+    def test_naive(self):
+        strategy = self.make_strategy("trades")
+        universe = strategy.universe
+
+        pnl = np.zeros(universe.shape)
+        exposure = np.zeros(universe.shape)
+        for t in strategy.trades:
+            i_entry = universe.index.get_loc(t.entry)
+            i_close = universe.index.get_loc(t.close)
+            for asset, lot in zip(t.asset, t.lot):
+                j = universe.columns.get_loc(asset)
+                value = lot * universe.values[i_entry : i_close + 1, j]
+                exposure[i_entry : i_close + 1, j] += value
+                pnl[i_entry + 1 : i_close + 1, j] += np.diff(value)
+        pnl = pd.DataFrame(pnl, index=universe.index, columns=universe.columns)
+        exposure = pd.DataFrame(
+            exposure, index=universe.index, columns=universe.columns
+        )
+
+        pd.testing.assert_frame_equal(strategy.pnl_by_asset(), pnl, check_freq=False)
+        pd.testing.assert_frame_equal(
+            strategy.exposure_by_asset(), exposure, check_freq=False
+        )
+
+    @pytest.mark.parametrize("mode", ["trades", "arrays", "target"])
+    @pytest.mark.parametrize("freq", [None, 7, "M"])
+    def test_sparse(self, mode, freq):
+        strategy = self.make_strategy(mode)
+
+        for method in (strategy.pnl_by_asset, strategy.exposure_by_asset):
+            dense = method(freq=freq)
+            sparse = method(sparse=True, freq=freq)
+            assert (sparse != 0).all()
+            result = sparse.unstack(fill_value=0.0)
+            expected = dense.loc[:, (dense != 0).any()]
+            expected = expected.loc[(expected != 0).any(axis=1)]
+            pd.testing.assert_frame_equal(
+                result, expected, check_names=False, check_freq=False
+            )
+
+    @pytest.mark.parametrize("mode", ["trades", "arrays", "target"])
+    def test_freq(self, mode):
+        strategy = self.make_strategy(mode)
+
+        pnl = strategy.pnl_by_asset(freq=7)
+        assert list(pnl.index) == list(strategy.universe.index[6::7]) + [
+            strategy.universe.index[-1]
+        ]
+        assert_allclose(pnl.sum(), strategy.pnl_by_asset().sum())
+
+        exposure = strategy.exposure_by_asset(freq="M")
+        expected = strategy.exposure_by_asset().resample("M").last()
+        assert_allclose(exposure.values, expected.values)
+
+    def test_notrunerror(self):
+        with pytest.raises(NotRunError):
+            RandomStrategy().pnl_by_asset()
+        with pytest.raises(NotRunError):
+            RandomStrategy().exposure_by_asset()
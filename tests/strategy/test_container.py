@@ -1,11 +1,19 @@
 import re
+import time
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
 import pytest
+from numpy.testing import assert_allclose
 
 from epymetheus import create_strategy
 from epymetheus import trade
+from epymetheus.batch import Target
+from epymetheus.benchmarks import DeterminedStrategy
 from epymetheus.benchmarks import RandomStrategy
+from epymetheus.datasets import make_randomwalk
+from epymetheus.exceptions import NotRunError
 from epymetheus.strategy.container import StrategyContainer
 from epymetheus.strategy.container import StrategyDict
 from epymetheus.strategy.container import StrategyList
@@ -173,3 +181,231 @@ class TestStrategyDict(TestStrategyContainer):
         container = StrategyDict({"s0": s0, "s1": s1})
 
         assert container.dict() == OrderedDict(s0=s0, s1=s1)
+
+
+class TestAttribution:
+    """
+    Test attribution of a run of StrategyContainer to its children
+    """
+
+    def make_container(self):
+        return StrategyDict(
+            {
+                "S0": RandomStrategy(n_trades=20, max_n_assets=3, min_lot=-1, seed=0),
+                "S1": RandomStrategy(n_trades=10, take=0.02, stop=-0.02, seed=1),
+                "S2": create_strategy(lambda universe: [trade("0", lot=0.0)]),
+            }
+        )
+
+    def test_trade_keys(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        container = self.make_container().run(universe, verbose=False)
+
+        assert container.trade_keys == ["S0"] * 20 + ["S1"] * 10 + ["S2"]
+        history = container.history()
+        assert list(history.columns[:2]) == ["trade_id", "strategy"]
+        for trade_id, key in zip(history["trade_id"], history["strategy"]):
+            assert container.trade_keys[trade_id] == key
+
+    def test_wealth_by_strategy(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        container = self.make_container().run(universe, verbose=False)
+
+        result = container.wealth_by_strategy()
+
+        assert list(result.columns) == ["S0", "S1", "S2"]
+        for key, strategy in container.items():
+            expected = strategy.run(universe, verbose=False).wealth()
+            assert_allclose(result[key], expected, atol=1e-10)
+        assert_allclose(result.sum(axis=1), container.wealth(), atol=1e-10)
+
+    @pytest.mark.parametrize(
+        "metric_name", ["final_wealth", "max_drawdown", "num_win", "avg_pnl"]
+    )
+    def test_score_by_strategy(self, metric_name):
+        universe = make_randomwalk(100, 10, seed=42)
+        container = self.make_container().run(universe, verbose=False)
+
+        result = container.score_by_strategy(metric_name)
+
+        for key, strategy in container.items():
+            expected = strategy.run(universe, verbose=False).score(metric_name)
+            assert_allclose(result[key], expected, atol=1e-10)
+
+    @pytest.mark.filterwarnings("error")
+    @pytest.mark.parametrize(
+        "metric_name", ["final_wealth", "num_win", "avg_pnl", "rate_win"]
+    )
+    def test_score_by_strategy_empty(self, metric_name):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategies = dict(self.make_container().items())
+        strategies["S3"] = create_strategy(lambda universe: [])
+        container = StrategyDict(strategies).run(universe, verbose=False)
+
+        result = container.score_by_strategy(metric_name)
+
+        assert result["S3"] == 0.0
+        assert not result.isna().any()
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_sum(self, columnar):
+        """
+        Attribution to children sums up to the container including
+        trades without entry.
+        """
+        universe = make_randomwalk(100, 10, seed=42)
+        strategies = {
+            "S0": DeterminedStrategy([trade("0"), -trade("1", exit=50)]),
+            "S1": DeterminedStrategy([trade(["2", "3"], lot=[1.0, -2.0])]),
+        }
+        if columnar:
+            frame = pd.DataFrame({"asset": ["4", "5"], "lot": [-1.0, 2.0]})
+            strategies["S2"] = DeterminedStrategy(frame)
+        container = StrategyDict(strategies).run(universe, verbose=False)
+
+        for metric_name in ("final_wealth", "num_win", "num_lose"):
+            result = container.score_by_strategy(metric_name).sum()
+            assert_allclose(result, container.score(metric_name), atol=1e-10)
+        assert_allclose(
+            container.score("final_wealth"), container.history()["pnl"].sum()
+        )
+        assert_allclose(
+            container.wealth_by_strategy().sum(axis=1), container.wealth(), atol=1e-10
+        )
+
+    def test_corr(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        container = self.make_container().run(universe, verbose=False)
+
+        result = container.corr()
+        expected = container.wealth_by_strategy().diff().corr()
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert_allclose(result.loc["S0", "S0"], 1.0)
+
+    def test_columnar(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        frame = pd.DataFrame({"asset": ["1", "2"], "lot": [1.0, -1.0], "entry": [3, 5]})
+        strategies = dict(self.make_container().items())
+        strategies["S3"] = DeterminedStrategy(frame)
+        container = StrategyDict(strategies).run(universe, verbose=False)
+
+        assert not hasattr(container, "trades")
+        assert container.trade_arrays.n_trades == 33
+        assert container.trade_keys == ["S0"] * 20 + ["S1"] * 10 + ["S2"] + ["S3"] * 2
+        history = container.history()
+        assert list(history["strategy"][-2:]) == ["S3", "S3"]
+        for trade_id, key in zip(history["trade_id"], history["strategy"]):
+            assert container.trade_keys[trade_id] == key
+
+        result = container.wealth_by_strategy()
+        for key, strategy in strategies.items():
+            expected = strategy.run(universe, verbose=False).wealth()
+            assert_allclose(result[key], expected, atol=1e-10)
+        assert_allclose(result.sum(axis=1), container.wealth(), atol=1e-10)
+
+    def test_call(self):
+        """
+        Calling the container does not change keys of trades of the last run.
+        """
+        universe = make_randomwalk(100, 10, seed=42)
+        strategies = dict(self.make_container().items())
+        strategies["S3"] = create_strategy(
+            lambda universe: [trade(asset) for asset in universe.columns]
+        )
+        container = StrategyDict(strategies).run(universe, verbose=False)
+        history = container.history()
+        score = container.score_by_strategy("final_wealth")
+
+        container(make_randomwalk(100, 3, seed=42))
+
+        assert container.trade_keys == ["S0"] * 20 + ["S1"] * 10 + ["S2"] + ["S3"] * 10
+        pd.testing.assert_frame_equal(container.history(), history)
+        pd.testing.assert_series_equal(
+            container.score_by_strategy("final_wealth"), score
+        )
+
+    def test_notrunerror(self):
+        with pytest.raises(NotRunError):
+            self.make_container().wealth_by_strategy()
+        with pytest.raises(NotRunError):
+            self.make_container().score_by_strategy("final_wealth")
+
+
+def sleep_then_trade(universe, asset, seconds):
+    time.sleep(seconds)
+    return [trade(asset)]
+
+
+def hold(universe, holdings):
+    return Target(holdings)
+
+
+class TestConcurrent:
+    """
+    Test concurrent generation of trades of child strategies
+    """
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_order(self, backend, n_jobs):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategies = [
+            RandomStrategy(n_trades=5, max_n_assets=2, seed=i) for i in range(4)
+        ]
+
+        container = StrategyList(strategies, n_jobs=n_jobs, backend=backend)
+        container.run(universe, verbose=False)
+        expected = StrategyList(strategies).run(universe, verbose=False)
+
+        assert container.trades == expected.trades
+        assert container.trade_keys == expected.trade_keys
+        pd.testing.assert_series_equal(container.wealth(), expected.wealth())
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_columnar(self, backend):
+        universe = make_randomwalk(100, 10, seed=42)
+        holdings = np.zeros((100, 10))
+        holdings[10:20, 3] = 1.0
+        strategies = [
+            RandomStrategy(n_trades=5, seed=0),
+            DeterminedStrategy(pd.DataFrame({"asset": ["1", "2"], "lot": [1.0, -1.0]})),
+            create_strategy(hold, holdings=holdings),
+        ]
+
+        container = StrategyList(strategies, n_jobs=2, backend=backend)
+        container.run(universe, verbose=False)
+        expected = StrategyList(strategies).run(universe, verbose=False)
+
+        assert container.trade_keys == expected.trade_keys
+        assert container.trade_keys[-3:] == ["strategy_1"] * 2 + ["strategy_2"]
+        pd.testing.assert_frame_equal(container.history(), expected.history())
+
+    def test_wall_time(self):
+        strategies = {
+            str(i): create_strategy(sleep_then_trade, asset=str(i), seconds=0.2)
+            for i in range(10)
+        }
+        container = StrategyDict(strategies, n_jobs=10)
+
+        begin = time.time()
+        trades = container(...)
+        assert time.time() - begin < 1.0
+        assert trades == [trade(str(i)) for i in range(10)]
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            StrategyList([], backend="NONEXISTENT")
+
+    @pytest.mark.parametrize("key", ["n_jobs", "backend"])
+    def test_option_key(self, key):
+        strategy = create_strategy(lambda universe: [trade("0")])
+
+        container = StrategyDict({key: strategy}, n_jobs=2)
+
+        assert list(container.keys()) == [key]
+        assert container.n_jobs == 2 and container.backend == "thread"
+        with pytest.raises(TypeError):
+            StrategyContainer(**{key: strategy})
+        with pytest.raises(TypeError):
+            StrategyDict(**{key: strategy})
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+# Budget of time in microseconds spent in modules of epymetheus themselves,
+# excluding dependencies such as numpy and pandas
+BUDGET = 200000
+
+modules = [
+    "epymetheus",
+    "epymetheus.batch",
+    "epymetheus.benchmarks",
+    "epymetheus.datasets",
+    "epymetheus.montecarlo",
+    "epymetheus.stochastic",
+]
+
+
+def import_times(module) -> dict:
+    """
+    Return self import time in microseconds of each module
+    imported by `import module` in a new interpreter.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+@pytest.mark.parametrize("module", modules)
+def test_lazy(module):
+    """
+    Optional or heavy dependencies are not imported until used.
+    """
+    times = import_times(module)
+    for lazy in ("pandas_datareader", "scipy", "concurrent.futures.process"):
+        assert lazy not in times
+
+
+@pytest.mark.parametrize("module", modules)
+def test_budget(module):
+    times = import_times(module)
+    own = sum(t for name, t in times.items() if name.startswith("epymetheus"))
+    assert own < BUDGET
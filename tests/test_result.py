@@ -0,0 +1,155 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from epymetheus import create_strategy
+from epymetheus import load_result
+from epymetheus import save_result
+from epymetheus import trade
+from epymetheus import write_history
+from epymetheus.batch import Target
+from epymetheus.benchmarks import DeterminedStrategy
+from epymetheus.benchmarks import RandomStrategy
+from epymetheus.datasets import make_randomwalk
+from epymetheus.exceptions import NotRunError
+from epymetheus.result import Result
+
+
+class TestResult:
+    @pytest.mark.parametrize("bars", [None, "date"])
+    def test_roundtrip(self, tmp_path, bars):
+        if bars == "date":
+            bars = list(pd.date_range("2000-01-01", periods=100))
+        universe = make_randomwalk(100, 10, bars=bars, seed=42)
+        strategy = RandomStrategy(n_trades=20, max_n_assets=3, seed=42)
+        strategy.run(universe, verbose=False)
+
+        save_result(strategy, tmp_path)
+        result = load_result(tmp_path)
+
+        pd.testing.assert_frame_equal(
+            result.history(), strategy.history(), check_dtype=False
+        )
+        for name in ("wealth", "drawdown", "net_exposure", "abs_exposure"):
+            pd.testing.assert_series_equal(
+                getattr(result, name)(), getattr(strategy, name)()
+            )
+        assert result.metadata["n_trades"] == 20
+        assert result.metadata["strategy"] == "RandomStrategy"
+
+    def test_mmap(self, tmp_path):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = RandomStrategy(seed=42).run(universe, verbose=False)
+        save_result(strategy, tmp_path)
+
+        result = load_result(tmp_path)
+        assert isinstance(result.arrays["wealth"], np.memmap)
+        assert np.shares_memory(result.wealth().values, result.arrays["wealth"])
+
+    def test_take_stop(self, tmp_path):
+        universe = make_randomwalk(100, 3, seed=42)
+        trades = [
+            trade("0", entry=1, take=0.01, stop=-0.01),
+            -trade(["1", "2"], exit=50),
+        ]
+        strategy = DeterminedStrategy(trades).run(universe, verbose=False)
+        save_result(strategy, tmp_path)
+
+        history = load_result(tmp_path, mmap_mode=None).history()
+        assert list(history["take"]) == [0.01, None, None]
+        assert list(history["entry"]) == [1, None, None]
+        assert list(history["close"]) == list(strategy.history()["close"])
+
+    def test_trade_arrays(self, tmp_path):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = RandomStrategy(n_trades=20, max_n_assets=3, take=0.05, seed=42)
+        arrays = strategy.arrays(universe)
+        strategy = DeterminedStrategy(arrays).run(universe, verbose=False)
+
+        save_result(strategy, tmp_path)
+        result = load_result(tmp_path)
+
+        pd.testing.assert_frame_equal(
+            result.history(), strategy.history(), check_dtype=False
+        )
+        pd.testing.assert_series_equal(result.wealth(), strategy.wealth())
+        assert result.metadata["n_trades"] == 20
+
+    def test_target(self, tmp_path):
+        universe = make_randomwalk(100, 10, seed=42)
+        weight = pd.DataFrame(0.1, index=universe.index, columns=universe.columns)
+        strategy = create_strategy(lambda universe: Target(weight, by="weight"))
+        strategy.run(universe, verbose=False)
+
+        save_result(strategy, tmp_path)
+        result = load_result(tmp_path)
+
+        pd.testing.assert_frame_equal(
+            result.history(), strategy.history(), check_dtype=False
+        )
+        pd.testing.assert_series_equal(result.wealth(), strategy.wealth())
+        assert result.metadata["n_trades"] == 1000
+
+    @pytest.mark.parametrize("metric_name", ["final_wealth", "max_drawdown", "num_win"])
+    def test_from_strategy(self, tmp_path, metric_name):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = RandomStrategy(n_trades=20, max_n_assets=3, seed=42)
+        strategy.run(universe, verbose=False)
+        save_result(strategy, tmp_path)
+
+        result = Result.from_strategy(strategy)
+        loaded = load_result(tmp_path)
+
+        pd.testing.assert_frame_equal(result.history(), loaded.history())
+        pd.testing.assert_series_equal(result.wealth(), loaded.wealth())
+        assert result.score(metric_name) == pytest.approx(strategy.score(metric_name))
+        assert loaded.score(metric_name) == pytest.approx(strategy.score(metric_name))
+
+    def test_pickle(self):
+        universe = make_randomwalk(100, 10, seed=42)
+        result = RandomStrategy(seed=42).backtest(universe)
+
+        unpickled = pickle.loads(pickle.dumps(result))
+
+        pd.testing.assert_frame_equal(unpickled.history(), result.history())
+        assert unpickled.metadata == result.metadata
+
+    @pytest.mark.parametrize("axis", ["index", "columns"])
+    def test_invalid_labels(self, tmp_path, axis):
+        universe = pd.DataFrame({"A": [1.0, 2.0, 3.0], 1: [3.0, 1.0, 2.0]})
+        if axis == "index":
+            universe = universe.T.iloc[:, :2]
+        strategy = create_strategy(lambda universe: [trade(universe.columns[0])])
+        strategy.run(universe, verbose=False)
+
+        with pytest.raises(TypeError):
+            save_result(strategy, tmp_path / "result")
+        assert not (tmp_path / "result").exists()
+
+    def test_notrunerror(self, tmp_path):
+        with pytest.raises(NotRunError):
+            save_result(RandomStrategy(), tmp_path)
+        with pytest.raises(NotRunError):
+            Result.from_strategy(RandomStrategy())
+        with pytest.raises(NotRunError):
+            write_history(RandomStrategy(), tmp_path)
+
+
+class TestWriteHistory:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_chunk(self, tmp_path, chunk_size):
+        universe = make_randomwalk(100, 10, seed=42)
+        strategy = RandomStrategy(n_trades=50, max_n_assets=4, seed=42)
+        strategy.run(universe, verbose=False)
+
+        write_history(strategy, tmp_path, chunk_size=chunk_size)
+        history = strategy.history()
+
+        codes = np.load(tmp_path / "asset.npy")
+        assets = np.load(tmp_path / "assets.npy")
+        assert codes.dtype == np.int32
+        assert list(assets[codes]) == list(history["asset"])
+        for name in ("trade_id", "lot", "entry", "close", "exit", "pnl"):
+            assert list(np.load(tmp_path / (name + ".npy"))) == list(history[name])
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from epymetheus import MemmapUniverse
+from epymetheus import trade
+from epymetheus import ts
+from epymetheus.benchmarks import RandomStrategy
+from epymetheus.datasets import make_randomwalk
+from epymetheus.metrics import metric_from_name
+
+metrics = ("final_wealth", "num_win", "avg_pnl", "max_drawdown")
+
+
+class TestMemmapUniverse:
+    @pytest.fixture(scope="function", autouse=True)
+    def setup(self):
+        np.random.seed(42)
+
+    def test_save_open(self, tmp_path):
+        universe = make_randomwalk(
+            100, 5, bars=list(pd.date_range("2000-01-01", periods=100))
+        )
+        MemmapUniverse.save(universe, tmp_path)
+        result = MemmapUniverse.open(tmp_path)
+
+        assert isinstance(result.values, np.memmap)
+        assert result.shape == (100, 5)
+        pd.testing.assert_frame_equal(result.to_frame(), universe)
+
+    def test_to_frame_view(self, tmp_path):
+        universe = MemmapUniverse.save(make_randomwalk(10, 3), tmp_path)
+        assert np.shares_memory(universe.to_frame().values, universe.values)
+
+    def test_create(self, tmp_path):
+        universe = MemmapUniverse.create(tmp_path, range(10), ["A", "B"])
+        universe.values[:5] = 1.0
+        universe.values[5:] = 2.0
+        universe.values.flush()
+
+        result = MemmapUniverse.open(tmp_path).to_frame()
+        assert list(result.columns) == ["A", "B"]
+        assert_allclose(result["A"], [1.0] * 5 + [2.0] * 5)
+
+    @pytest.mark.parametrize(
+        "columns",
+        [[1, "1"], [("A", 0), ("A", 1)], pd.MultiIndex.from_product([["A"], [0, 1]])],
+    )
+    def test_invalid_labels(self, tmp_path, columns):
+        with pytest.raises(TypeError):
+            MemmapUniverse.create(tmp_path / "universe", range(10), columns)
+        assert not (tmp_path / "universe").exists()
+
+    def test_run(self, tmp_path):
+        universe = make_randomwalk(100, 5)
+        memmap_universe = MemmapUniverse.save(universe, tmp_path)
+
+        strategy = RandomStrategy(n_trades=20, max_n_assets=2, seed=42)
+        result = strategy.run(memmap_universe, verbose=False)
+        result_wealth = result.wealth()
+        result_scores = [result.score(m) for m in metrics]
+
+        strategy.run(universe, verbose=False)
+        pd.testing.assert_series_equal(result_wealth, strategy.wealth())
+        assert_allclose(result_scores, [strategy.score(m) for m in metrics])
+
+    def test_ts_metrics(self, tmp_path):
+        universe = make_randomwalk(100, 3)
+        memmap_universe = MemmapUniverse.save(universe, tmp_path)
+        trades = [
+            trade("0", entry=10, exit=90, take=0.01, stop=-0.01),
+            [1.0, -2.0] * trade(["1", "2"], entry=20),
+            -trade("2", exit=50),
+        ]
+        trades = [t.execute(memmap_universe) for t in trades]
+        assert [t.close for t in trades] == [t.execute(universe).close for t in trades]
+
+        for f in (ts.wealth, ts.net_exposure, ts.abs_exposure):
+            assert_allclose(f(trades, memmap_universe), f(trades, universe))
+        for m in metrics:
+            result = metric_from_name(m)(trades, memmap_universe)
+            assert_allclose(result, metric_from_name(m)(trades, universe))
@@ -176,3 +176,19 @@ class TestWealth:
         expected = ts.wealth([a * t for t in strategy.trades], universe)
 
         assert_allclose(result, expected)
+
+
+class TestDtype:
+    @pytest.mark.parametrize(
+        "func", [ts.wealth, ts.drawdown, ts.net_exposure, ts.abs_exposure]
+    )
+    def test_float32(self, func):
+        np.random.seed(42)
+        universe = make_randomwalk(100, 10)
+        strategy = RandomStrategy(n_trades=20, max_n_assets=3).run(universe)
+
+        result = func(strategy.trades, universe.astype(np.float32))
+        expected = func(strategy.trades, universe)
+
+        assert result.dtype == np.float32
+        assert_allclose(result, expected, rtol=1e-5, atol=1e-5)